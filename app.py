@@ -3,9 +3,6 @@ Amazon Customer Reviews Sentiment Analysis
 Entry point for the application.
 """
 
-import os
-os.environ['TF_ENABLE_ONEDNN_OPTS'] = '0'
-
 from src.app import create_app
 from src.config.settings import Config
 
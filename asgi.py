@@ -0,0 +1,13 @@
+"""
+Amazon Customer Reviews Sentiment Analysis
+ASGI entry point for async serving.
+
+Usage:
+    uvicorn asgi:app --host 0.0.0.0 --port 5000
+"""
+
+from src.asgi import create_asgi_app
+
+
+# Create application instance
+app = create_asgi_app('production')
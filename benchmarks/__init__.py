@@ -0,0 +1 @@
+"""Reproducible inference benchmarks for the sentiment analyzer."""
@@ -0,0 +1,74 @@
+"""
+Benchmark harness entry point.
+
+Usage:
+    python -m benchmarks --tiny model
+    python -m benchmarks service
+    python -m benchmarks --tiny tokenization
+    python -m benchmarks database --writers 4 --readers 4
+    python -m benchmarks runtime --profiles baseline trace bf16
+    python -m benchmarks --tiny serving --idle 0 1000
+    python -m benchmarks load --replicas 4
+    python -m benchmarks http --url http://127.0.0.1:5000
+    python -m benchmarks --tiny --output-dir bench_out/ all
+
+Each benchmark writes a JSON document with the results and the environment
+(commit, backend, precision, torch version, CPU count) to
+``benchmarks/results/`` unless ``--output-dir`` is given.
+"""
+
+from pathlib import Path
+from typing import Optional
+import argparse
+import logging
+
+from src.config.settings import Config
+
+from . import (
+    database_bench, http_bench, load_bench, model_bench, runtime_bench, serving_bench, service_bench, tokenization_bench
+)
+from .common import resolve_model_path, write_results
+
+BENCHMARKS = {
+    "model": model_bench,
+    "service": service_bench,
+    "http": http_bench,
+    "tokenization": tokenization_bench,
+    "database": database_bench,
+    "runtime": runtime_bench,
+    "serving": serving_bench,
+    "load": load_bench
+}
+
+
+def main(argv: Optional[list] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Sentiment inference benchmarks.")
+    parser.add_argument("--model-path", type=Path, default=None, help="Checkpoint directory")
+    parser.add_argument("--tiny", action="store_true", help="Use a small random-weight DistilBERT")
+    parser.add_argument("--output-dir", type=Path, default=None, help="Directory for result JSON files")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+    subparsers.add_parser("all", help="Run every benchmark with its defaults")
+    for name, module in BENCHMARKS.items():
+        module.add_arguments(subparsers.add_parser(name, help=module.__doc__.splitlines()[0]))
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING, format=Config.LOG_FORMAT)
+    Config.MODEL_PATH = resolve_model_path(args.model_path, args.tiny)
+
+    names = list(BENCHMARKS) if args.benchmark == "all" else [args.benchmark]
+    for name in names:
+        module = BENCHMARKS[name]
+        if args.benchmark == "all":
+            sub_parser = argparse.ArgumentParser()
+            module.add_arguments(sub_parser)
+            run_args = sub_parser.parse_args([])
+        else:
+            run_args = args
+        print(f"== {name} ==")
+        results = module.run(run_args)
+        output = args.output_dir / f"{name}.json" if args.output_dir else None
+        write_results(name, results, output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""Shared helpers for the benchmark harness."""
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+import json
+import os
+import platform
+import random
+import subprocess
+import tempfile
+import time
+
+from src.config.settings import Config
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+# Review vocabulary for synthetic inputs. Every word is a single token in the
+# tiny checkpoint's vocab (and nearly all are in distilbert-base-uncased), so a
+# text of N words is about N tokens plus [CLS]/[SEP].
+WORDS = (
+    "the product is great good bad terrible love hate quality price fast slow "
+    "shipping arrived broke works perfectly never again would buy recommend "
+    "not worth money very happy disappointed cheap sturdy battery screen sound "
+    "size color fit comfortable returned seller service box instructions easy "
+    "hard use day week month year after before it was this my kids family gift"
+).split()
+
+
+def synthetic_review(num_tokens: int, rng: random.Random) -> str:
+    """Build a review of roughly ``num_tokens`` tokens."""
+    return " ".join(rng.choice(WORDS) for _ in range(max(1, num_tokens - 2)))
+
+
+def synthetic_reviews(count: int, num_tokens: int, seed: int = 0) -> List[str]:
+    rng = random.Random(seed)
+    return [synthetic_review(num_tokens, rng) for _ in range(count)]
+
+
+def make_tiny_checkpoint(path: Optional[Path] = None) -> Path:
+    """
+    Write a small random-weight DistilBERT checkpoint with a matching tokenizer.
+
+    Used when the fine-tuned checkpoint is not available, e.g. in CI. Shapes
+    are reduced so runs are quick, but the code path (tokenizer, padding,
+    attention, classification head) is the same as with the real model.
+    """
+    from transformers import DistilBertConfig, DistilBertForSequenceClassification, DistilBertTokenizerFast
+
+    path = Path(path or Path(tempfile.gettempdir()) / "sentiment-bench-tiny")
+    if (path / "config.json").exists():
+        return path
+    path.mkdir(parents=True, exist_ok=True)
+    specials = ["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]"]
+    characters = list("abcdefghijklmnopqrstuvwxyz0123456789.,!?'\"-()")
+    vocab = specials + sorted(set(WORDS)) + characters + [f"##{c}" for c in characters]
+    (path / "vocab.txt").write_text("\n".join(vocab) + "\n", encoding="utf-8")
+
+    tokenizer = DistilBertTokenizerFast(vocab_file=str(path / "vocab.txt"))
+    config = DistilBertConfig(
+        vocab_size=len(vocab),
+        dim=128,
+        hidden_dim=256,
+        n_layers=2,
+        n_heads=2,
+        max_position_embeddings=Config.MAX_SEQUENCE_LENGTH,
+        initializer_range=0.2
+    )
+    DistilBertForSequenceClassification(config).save_pretrained(str(path))
+    tokenizer.save_pretrained(str(path))
+    return path
+
+
+def resolve_model_path(model_path: Optional[Path], tiny: bool) -> Path:
+    """Pick the checkpoint to benchmark, falling back to a tiny random model."""
+    if tiny:
+        return make_tiny_checkpoint()
+    model_path = Path(model_path or Config.MODEL_PATH)
+    if not (model_path / "config.json").exists():
+        print(f"No checkpoint at {model_path}, using a tiny random-weight model")
+        return make_tiny_checkpoint()
+    return model_path
+
+
+def percentiles(samples_ms: Sequence[float]) -> Dict[str, float]:
+    """Summarize latency samples in milliseconds."""
+    ordered = sorted(samples_ms)
+    if not ordered:
+        return {}
+
+    def pick(q: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))], 3)
+
+    return {
+        "count": len(ordered),
+        "mean_ms": round(sum(ordered) / len(ordered), 3),
+        "p50_ms": pick(0.50),
+        "p95_ms": pick(0.95),
+        "p99_ms": pick(0.99),
+        "max_ms": round(ordered[-1], 3)
+    }
+
+
+def timed(fn, *args, **kwargs) -> float:
+    """Run ``fn`` once and return its wall time in milliseconds."""
+    start = time.perf_counter()
+    fn(*args, **kwargs)
+    return (time.perf_counter() - start) * 1000
+
+
+def environment() -> Dict[str, Any]:
+    """Describe the run so results can be compared across commits and machines."""
+    info: Dict[str, Any] = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "backend": Config.MODEL_BACKEND,
+        "precision": Config.MODEL_PRECISION,
+        "device": Config.DEVICE
+    }
+    try:
+        info["commit"] = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+            cwd=Path(__file__).resolve().parent
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        info["commit"] = None
+    try:
+        import torch
+        info["torch"] = torch.__version__
+        info["torch_threads"] = torch.get_num_threads()
+    except ImportError:
+        pass
+    return info
+
+
+def write_results(name: str, results: Dict[str, Any], output: Optional[Path] = None) -> Path:
+    """Write a benchmark result document as JSON and return its path."""
+    document = {"benchmark": name, "environment": environment(), "results": results}
+    if output is None:
+        RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        output = RESULTS_DIR / f"{name}-{document['environment']['commit'] or 'nocommit'}-{stamp}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(document, indent=2), encoding="utf-8")
+    print(f"Wrote {output}")
+    return output
@@ -0,0 +1,123 @@
+"""Database benchmark: concurrent feedback writes and admin reads with default and tuned SQLite."""
+
+from pathlib import Path
+from typing import Any, Dict, List
+import argparse
+import random
+import tempfile
+import threading
+import time
+
+from flask import Flask
+
+from src.config.settings import Config
+from src.database.engine import configure_engine, sqlite_pragmas
+from src.database.models import db
+from src.database.repository import FeedbackRepository
+
+from .common import percentiles, synthetic_reviews
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--writers", type=int, default=4, help="Threads inserting feedback one row at a time")
+    parser.add_argument("--readers", type=int, default=4, help="Threads reading feedback pages and stats")
+    parser.add_argument("--duration", type=float, default=5.0, help="Seconds per mode")
+    parser.add_argument("--seed-rows", type=int, default=5000, help="Rows in the table before the run")
+
+
+def _make_app(path: Path, tuned: bool) -> Flask:
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{path}"
+    app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+    db.init_app(app)
+    with app.app_context():
+        if tuned:
+            configure_engine(db.engine)
+        db.create_all()
+    return app
+
+
+def _records(count: int, rng: random.Random) -> List[Dict[str, Any]]:
+    return [
+        {
+            "text": text,
+            "predicted_sentiment": rng.choice(("Positive", "Negative")),
+            "predicted_confidence": round(rng.uniform(50, 100), 2),
+            "is_correct": rng.random() < 0.8
+        }
+        for text in synthetic_reviews(count, 48, seed=rng.randrange(1 << 30))
+    ]
+
+
+def _worker(app: Flask, operation, deadline: float, samples: List[float], errors: List[str]) -> None:
+    with app.app_context():
+        while time.monotonic() < deadline:
+            start = time.perf_counter()
+            try:
+                operation()
+                samples.append((time.perf_counter() - start) * 1000)
+            except Exception as e:
+                db.session.rollback()
+                errors.append(type(e).__name__)
+        db.session.remove()
+
+
+def _run_mode(args: argparse.Namespace, tuned: bool) -> Dict[str, Any]:
+    with tempfile.TemporaryDirectory() as tmp:
+        app = _make_app(Path(tmp) / "feedback.db", tuned)
+        rng = random.Random(0)
+        with app.app_context():
+            FeedbackRepository.create_feedback_batch(_records(args.seed_rows, rng))
+        writes = _records(1000, rng)
+
+        def write():
+            FeedbackRepository.create_feedback(**writes[rng.randrange(len(writes))])
+
+        def read():
+            FeedbackRepository.get_feedback_page(limit=100)
+            FeedbackRepository.get_feedback_stats()
+
+        deadline = time.monotonic() + args.duration
+        write_ms: List[float] = []
+        read_ms: List[float] = []
+        errors: List[str] = []
+        threads = [
+            threading.Thread(target=_worker, args=(app, write, deadline, write_ms, errors))
+            for _ in range(args.writers)
+        ] + [
+            threading.Thread(target=_worker, args=(app, read, deadline, read_ms, errors))
+            for _ in range(args.readers)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        with app.app_context():
+            db.engine.dispose()
+    return {
+        "writes": {**percentiles(write_ms), "per_sec": round(len(write_ms) / args.duration, 1)},
+        "reads": {**percentiles(read_ms), "per_sec": round(len(read_ms) / args.duration, 1)},
+        "errors": {name: errors.count(name) for name in set(errors)}
+    }
+
+
+def run(args: argparse.Namespace) -> Dict[str, Any]:
+    """Run the same mixed workload against a fresh SQLite file with default pragmas, then tuned ones."""
+    # Read stats from the database on every call instead of the in-process cache
+    Config.FEEDBACK_STATS_CACHE_SECONDS = 0
+    results: Dict[str, Any] = {"workload": {
+        "writers": args.writers,
+        "readers": args.readers,
+        "duration_s": args.duration,
+        "seed_rows": args.seed_rows,
+        "pragmas": sqlite_pragmas()
+    }}
+    for mode in ("default", "tuned"):
+        stats = _run_mode(args, tuned=mode == "tuned")
+        results[mode] = stats
+        print(
+            f"{mode:8s} writes/s={stats['writes']['per_sec']:8.1f} p99={stats['writes'].get('p99_ms', 0):8.2f}ms "
+            f"reads/s={stats['reads']['per_sec']:8.1f} p99={stats['reads'].get('p99_ms', 0):8.2f}ms "
+            f"errors={sum(stats['errors'].values())}"
+        )
+    return results
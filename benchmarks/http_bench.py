@@ -0,0 +1,83 @@
+"""HTTP load generator for /analyze against the Flask test client or a running server."""
+
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import argparse
+import json
+import time
+import urllib.error
+import urllib.request
+
+from .common import percentiles, synthetic_reviews
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--url", default=None, help="Base URL of a running server (defaults to the in-process test client)")
+    parser.add_argument("--path", default="/analyze", help="Endpoint to load")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16], help="Concurrent clients per run")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per concurrency level")
+    parser.add_argument("--length", type=int, default=64, help="Review length in tokens")
+
+
+def _url_sender(base_url: str, path: str) -> Callable[[str], int]:
+    def send(text: str) -> int:
+        request = urllib.request.Request(
+            base_url.rstrip("/") + path,
+            data=json.dumps({"text": text}).encode("utf-8"),
+            headers={"Content-Type": "application/json"}
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=60) as response:
+                response.read()
+                return response.status
+        except urllib.error.HTTPError as e:
+            return e.code
+    return send
+
+
+def _test_client_sender(path: str) -> Callable[[str], int]:
+    from src.app import create_app
+
+    app = create_app("test")
+
+    def send(text: str) -> int:
+        return app.test_client().post(path, json={"text": text}).status_code
+    return send
+
+
+def load(send: Callable[[str], int], texts: List[str], concurrency: int) -> Dict[str, Any]:
+    """Fire ``texts`` at ``send`` from ``concurrency`` threads and summarize."""
+    def one(text: str) -> Tuple[float, int]:
+        start = time.perf_counter()
+        status = send(text)
+        return (time.perf_counter() - start) * 1000, status
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        outcomes = list(pool.map(one, texts))
+    elapsed = time.perf_counter() - start
+    stats = percentiles([latency for latency, _ in outcomes])
+    stats["requests_per_sec"] = round(len(texts) / elapsed, 1)
+    stats["status_codes"] = dict(Counter(str(status) for _, status in outcomes))
+    return stats
+
+
+def run(args: argparse.Namespace, send: Optional[Callable[[str], int]] = None) -> Dict[str, Any]:
+    """Run one load test per concurrency level."""
+    if send is None:
+        send = _url_sender(args.url, args.path) if args.url else _test_client_sender(args.path)
+    for text in synthetic_reviews(3, args.length, seed=-1):
+        send(text)
+
+    runs = []
+    for concurrency in args.concurrency:
+        # Fresh texts per level so the prediction cache does not short-circuit inference
+        texts = synthetic_reviews(args.requests, args.length, seed=concurrency)
+        stats = load(send, texts, concurrency)
+        runs.append({"concurrency": concurrency, **stats})
+        print(
+            f"concurrency={concurrency:4d} p50={stats['p50_ms']:8.2f}ms "
+            f"p99={stats['p99_ms']:8.2f}ms req/s={stats['requests_per_sec']:8.1f}"
+        )
+    return {"target": args.url or "test_client", "path": args.path, "runs": runs}
@@ -0,0 +1,135 @@
+"""Load benchmark: time and peak RSS of from_pretrained vs memory-mapped loading, and memory shared by replicas."""
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from src.config.settings import Config
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+MODES = {"pretrained": False, "mmap": True}
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--modes", nargs="+", choices=list(MODES), default=list(MODES), help="Loading modes to compare")
+    parser.add_argument("--repeats", type=int, default=3, help="Fresh processes per mode for load time and peak RSS")
+    parser.add_argument("--replicas", type=int, default=3, help="Processes holding the model at once for the sharing test (0 = skip)")
+
+
+def _pss_mb(pid: int) -> Optional[float]:
+    """Proportional set size of a process: shared pages are divided among the processes mapping them (Linux only)."""
+    try:
+        with open(f"/proc/{pid}/smaps_rollup", encoding="ascii") as handle:
+            for line in handle:
+                if line.startswith("Pss:"):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        pass
+    return None
+
+
+def _start(mode: str) -> subprocess.Popen:
+    env = {**os.environ, "MODEL_LOAD_MMAP": str(MODES[mode])}
+    return subprocess.Popen(
+        [sys.executable, "-m", "benchmarks.load_bench", str(Config.MODEL_PATH)],
+        cwd=REPO_ROOT, env=env, stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True
+    )
+
+
+def _read(process: subprocess.Popen) -> Dict[str, Any]:
+    line = process.stdout.readline()
+    if not line:
+        raise RuntimeError(f"Loader process exited with code {process.wait()}")
+    return json.loads(line)
+
+
+def _report(process: subprocess.Popen) -> Dict[str, Any]:
+    """Ask the child to report its memory once more; it exits afterwards."""
+    process.stdin.write("\n")
+    process.stdin.flush()
+    return _read(process)
+
+
+def run(args: argparse.Namespace) -> Dict[str, Any]:
+    """Load the model in fresh processes, since peak RSS only ever grows within one."""
+    results: Dict[str, Any] = {"model_path": str(Config.MODEL_PATH), "precision": Config.MODEL_PRECISION, "modes": {}}
+    for mode in args.modes:
+        loads: List[Dict[str, Any]] = []
+        for _ in range(args.repeats):
+            process = _start(mode)
+            loads.append(_read(process))
+            _report(process)
+            process.wait()
+        summary: Dict[str, Any] = {
+            "load_s": round(statistics.median(load["load_s"] for load in loads), 3),
+            "weights_s": round(statistics.median(load["timings"]["weights_s"] for load in loads), 3),
+            "rss_before_mb": loads[0]["model"]["load"]["rss_before_mb"],
+            "peak_rss_mb": max(load["model"]["load"]["peak_rss_mb"] or 0 for load in loads),
+            "rss_after_warmup_mb": loads[0]["process"]["rss_mb"],
+            "model": loads[0]["model"]
+        }
+        print(
+            f"{mode:10s} load={summary['load_s']:.2f}s weights={summary['weights_s']:.2f}s "
+            f"peak_rss={summary['peak_rss_mb']}MB rss={summary['rss_after_warmup_mb']}MB"
+        )
+        if args.replicas > 0:
+            processes = [_start(mode) for _ in range(args.replicas)]
+            for process in processes:
+                _read(process)
+            # Measure while every replica is loaded and warm; Pss splits shared pages between them
+            pss = [_pss_mb(process.pid) for process in processes]
+            for process in processes:
+                process.stdin.write("\n")
+                process.stdin.flush()
+            replicas = [{"pss_mb": value, **_read(process)} for value, process in zip(pss, processes)]
+            for process in processes:
+                process.wait()
+            summary["replicas"] = {
+                "count": args.replicas,
+                "rss_mb": [replica["process"]["rss_mb"] for replica in replicas],
+                "pss_mb": [replica["pss_mb"] for replica in replicas],
+                "model_pss_mb": [replica["model"].get("mapped", {}).get("pss_mb") for replica in replicas],
+                "total_pss_mb": round(sum(replica["pss_mb"] or 0 for replica in replicas), 1)
+            }
+            print(
+                f"{mode:10s} {args.replicas} replicas: total_pss={summary['replicas']['total_pss_mb']}MB "
+                f"pss={summary['replicas']['pss_mb']} model_pss={summary['replicas']['model_pss_mb']}"
+            )
+        results["modes"][mode] = summary
+    return results
+
+
+def _child(model_path: Path) -> None:
+    """Load and warm up the model, report, then report again when the parent asks and exit."""
+    from src.models.sentiment_model import SentimentModel
+    from src.monitoring.memory import process_memory
+
+    SentimentModel.import_dependencies()
+    start = time.perf_counter()
+    model = SentimentModel(model_path)
+    model.load()
+    load_s = time.perf_counter() - start
+    # Same warmup as the service; it touches every layer's weights
+    model.predict("Warmup review to initialize the inference path.")
+
+    def report() -> None:
+        print(json.dumps({
+            "load_s": load_s,
+            "timings": model.load_timings,
+            "process": process_memory(),
+            "model": model.memory_usage()
+        }), flush=True)
+
+    report()
+    sys.stdin.readline()
+    report()
+
+
+if __name__ == "__main__":
+    _child(Path(sys.argv[1]))
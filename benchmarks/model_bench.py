@@ -0,0 +1,55 @@
+"""Model microbenchmark: latency percentiles and throughput by input length and batch size."""
+
+from typing import Any, Dict, List
+import argparse
+import time
+
+from src.config.settings import Config
+from src.models.factory import create_model
+
+from .common import percentiles, synthetic_reviews, timed
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--lengths", type=int, nargs="+", default=[16, 64, 128, 256, 512], help="Input lengths in tokens")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 8, 32], help="Texts per predict_batch call")
+    parser.add_argument("--iterations", type=int, default=20, help="Timed calls per configuration")
+    parser.add_argument("--warmup", type=int, default=3, help="Untimed calls per configuration")
+
+
+def run(args: argparse.Namespace) -> Dict[str, Any]:
+    """Time ``predict_batch`` for every (length, batch size) pair."""
+    Config.BATCH_SIZE = max(args.batch_sizes)
+    model = create_model()
+    load_start = time.perf_counter()
+    model.load()
+    load_s = time.perf_counter() - load_start
+
+    rows: List[Dict[str, Any]] = []
+    for length in args.lengths:
+        for batch_size in args.batch_sizes:
+            texts = synthetic_reviews(batch_size, length, seed=length)
+            for _ in range(args.warmup):
+                model.predict_batch(texts)
+            samples = [timed(model.predict_batch, texts) for _ in range(args.iterations)]
+            stats = percentiles(samples)
+            mean_s = stats["mean_ms"] / 1000
+            rows.append({
+                "length": length,
+                "batch_size": batch_size,
+                **stats,
+                "items_per_sec": round(batch_size / mean_s, 1),
+                "tokens_per_sec": round(batch_size * length / mean_s, 1)
+            })
+            print(
+                f"length={length:4d} batch={batch_size:3d} "
+                f"p50={stats['p50_ms']:8.2f}ms p99={stats['p99_ms']:8.2f}ms "
+                f"tokens/s={rows[-1]['tokens_per_sec']:10.1f}"
+            )
+    return {
+        "model_path": str(model.model_path),
+        "model_version": model.version,
+        "load_s": round(load_s, 3),
+        "load_timings": model.load_timings,
+        "configurations": rows
+    }
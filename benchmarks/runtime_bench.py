@@ -0,0 +1,103 @@
+"""Torch runtime benchmark: latency and score drift of each CPU runtime setting against eager fp32."""
+
+from typing import Any, Dict, List, Tuple
+import argparse
+import os
+import time
+
+from src.config.settings import Config
+from src.models.sentiment_model import SentimentModel
+
+from .common import percentiles, synthetic_reviews, timed
+
+# Baseline: what SentimentModel did before the runtime profile (eager, no_grad, fp32)
+BASELINE = {"TORCH_INFERENCE_MODE": False, "TORCH_GRAPH_MODE": "eager", "MODEL_PRECISION": "fp32"}
+
+# Each profile changes one setting from the baseline, except the combined ones at the end
+PROFILES: Dict[str, Dict[str, Any]] = {
+    "baseline": {},
+    "inference_mode": {"TORCH_INFERENCE_MODE": True},
+    "trace": {"TORCH_GRAPH_MODE": "trace"},
+    "compile": {"TORCH_GRAPH_MODE": "compile"},
+    "bf16": {"MODEL_PRECISION": "bf16"},
+    "int8": {"MODEL_PRECISION": "int8"},
+    "inference_mode+trace": {"TORCH_INFERENCE_MODE": True, "TORCH_GRAPH_MODE": "trace"},
+    "inference_mode+trace+bf16": {"TORCH_INFERENCE_MODE": True, "TORCH_GRAPH_MODE": "trace", "MODEL_PRECISION": "bf16"}
+}
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--profiles", nargs="+", choices=list(PROFILES), default=list(PROFILES), help="Settings to compare")
+    parser.add_argument("--threads", type=int, nargs="+", default=[os.cpu_count() or 1], help="Intra-op thread counts to run every profile with")
+    parser.add_argument("--lengths", type=int, nargs="+", default=[32, 128, 512], help="Input lengths in tokens")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 16], help="Texts per predict_batch call")
+    parser.add_argument("--iterations", type=int, default=10, help="Timed calls per configuration")
+
+
+def _measure(model: SentimentModel, workloads: List[Tuple[int, int, List[str]]], iterations: int) -> Dict[str, Any]:
+    timings = {}
+    predictions = []
+    for length, batch_size, texts in workloads:
+        predictions.extend(model.predict_batch(texts))
+        samples = [timed(model.predict_batch, texts) for _ in range(iterations)]
+        timings[f"{length}x{batch_size}"] = percentiles(samples)
+    return {"timings": timings, "predictions": predictions}
+
+
+def _drift(baseline: List[Dict[str, Any]], other: List[Dict[str, Any]]) -> Dict[str, float]:
+    drift = [abs(a["scores"]["positive"] - b["scores"]["positive"]) for a, b in zip(baseline, other)]
+    agreement = sum(a["sentiment"] == b["sentiment"] for a, b in zip(baseline, other)) / len(baseline)
+    return {"agreement": round(agreement, 4), "max_score_drift": round(max(drift), 3)}
+
+
+def run(args: argparse.Namespace) -> Dict[str, Any]:
+    """Load the model once per (profile, thread count) and time ``predict_batch`` on the same inputs."""
+    Config.BATCH_SIZE = max(args.batch_sizes)
+    workloads = [
+        (length, batch_size, synthetic_reviews(batch_size, length, seed=length * 100 + batch_size))
+        for length in args.lengths
+        for batch_size in args.batch_sizes
+    ]
+    original = {name: getattr(Config, name) for name in (*BASELINE, "TORCH_INTRA_OP_THREADS")}
+    results: Dict[str, Any] = {"workload": {
+        "lengths": args.lengths,
+        "batch_sizes": args.batch_sizes,
+        "iterations": args.iterations
+    }, "runs": []}
+    reference: Dict[int, Dict[str, Any]] = {}
+    try:
+        for threads in args.threads:
+            for name in args.profiles:
+                for key, value in {**BASELINE, **PROFILES[name], "TORCH_INTRA_OP_THREADS": threads}.items():
+                    setattr(Config, key, value)
+                model = SentimentModel(device="cpu")
+                start = time.perf_counter()
+                model.load()
+                load_s = time.perf_counter() - start
+                measured = _measure(model, workloads, args.iterations)
+                run_result = {
+                    "profile": name,
+                    "threads": threads,
+                    "runtime": model.runtime,
+                    "load_s": round(load_s, 3),
+                    "runtime_s": model.load_timings["runtime_s"],
+                    "timings": measured["timings"]
+                }
+                base = reference.setdefault(threads, {"name": name, **measured})
+                run_result["speedup"] = {
+                    shape: round(base["timings"][shape]["mean_ms"] / stats["mean_ms"], 2)
+                    for shape, stats in measured["timings"].items()
+                }
+                run_result["vs"] = base["name"]
+                run_result.update(_drift(base["predictions"], measured["predictions"]))
+                results["runs"].append(run_result)
+                speedups = " ".join(f"{shape}={value:.2f}x" for shape, value in run_result["speedup"].items())
+                print(
+                    f"threads={threads:2d} {name:28s} load={load_s:7.2f}s {speedups} "
+                    f"agreement={run_result['agreement']:.3f} drift={run_result['max_score_drift']:.3f}"
+                )
+                del model
+    finally:
+        for key, value in original.items():
+            setattr(Config, key, value)
+    return results
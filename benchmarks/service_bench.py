@@ -0,0 +1,53 @@
+"""Service benchmark: SentimentService.analyze with the prediction cache on and off."""
+
+from typing import Any, Dict
+import argparse
+import random
+
+from src.config.settings import Config
+from src.services.prediction_cache import PredictionCache
+from src.services.sentiment_service import SentimentService
+
+from .common import percentiles, synthetic_reviews, timed
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--requests", type=int, default=500, help="analyze() calls per mode")
+    parser.add_argument("--unique", type=int, default=200, help="Distinct reviews in the workload")
+    parser.add_argument("--length", type=int, default=64, help="Review length in tokens")
+    parser.add_argument("--batching", action="store_true", help="Keep the micro-batching scheduler on")
+
+
+def run(args: argparse.Namespace) -> Dict[str, Any]:
+    """Replay the same duplicate-heavy workload with and without the cache."""
+    Config.BATCHING_ENABLED = args.batching
+    service = SentimentService()
+    service.initialize()
+
+    pool = synthetic_reviews(args.unique, args.length, seed=1)
+    rng = random.Random(2)
+    workload = [rng.choice(pool) for _ in range(args.requests)]
+
+    results: Dict[str, Any] = {"workload": {
+        "requests": args.requests,
+        "unique": args.unique,
+        "length": args.length,
+        "batching": args.batching
+    }}
+    for mode in ("cache_off", "cache_on"):
+        service._cache = None
+        if mode == "cache_on":
+            service._cache = PredictionCache(
+                max_entries=Config.CACHE_MAX_ENTRIES,
+                max_bytes=Config.CACHE_MAX_BYTES,
+                ttl_seconds=Config.CACHE_TTL_SECONDS
+            )
+        samples = [timed(service.analyze, text) for text in workload]
+        stats = percentiles(samples)
+        stats["requests_per_sec"] = round(1000 / stats["mean_ms"], 1)
+        if service._cache is not None:
+            stats["cache"] = service._cache.get_stats()
+        results[mode] = stats
+        print(f"{mode:9s} p50={stats['p50_ms']:8.3f}ms p99={stats['p99_ms']:8.3f}ms req/s={stats['requests_per_sec']:8.1f}")
+    service.shutdown()
+    return results
@@ -0,0 +1,263 @@
+"""Serving benchmark: sync (threaded WSGI) vs async (ASGI) servers under load with idle slow clients."""
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+import argparse
+import asyncio
+import importlib.util
+import json
+import os
+import resource
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+
+from src.config.settings import Config
+
+from .common import percentiles, synthetic_reviews
+
+HOST = "127.0.0.1"
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--modes", nargs="+", choices=("sync", "async"), default=["sync", "async"], help="Servers to compare")
+    parser.add_argument("--idle", type=int, nargs="+", default=[0, 1000], help="Slow clients holding a half-sent request open during each run")
+    parser.add_argument("--concurrency", type=int, default=32, help="Concurrent active clients")
+    parser.add_argument("--requests", type=int, default=300, help="Requests per run")
+    parser.add_argument("--length", type=int, default=64, help="Review length in tokens")
+    parser.add_argument("--timeout", type=float, default=5.0, help="Seconds before a request counts as timed out")
+    parser.add_argument("--sync-threads", type=int, default=32, help="Request threads of the sync server (0 = one thread per connection)")
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind((HOST, 0))
+        return sock.getsockname()[1]
+
+
+def _raise_fd_limit() -> None:
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < hard:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+
+def _process_stats(pid: int) -> Dict[str, Optional[int]]:
+    """Threads and resident memory of the server process (Linux only)."""
+    stats: Dict[str, Optional[int]] = {"threads": None, "rss_mb": None}
+    try:
+        with open(f"/proc/{pid}/status", encoding="ascii") as handle:
+            for line in handle:
+                if line.startswith("Threads:"):
+                    stats["threads"] = int(line.split()[1])
+                elif line.startswith("VmRSS:"):
+                    stats["rss_mb"] = int(line.split()[1]) // 1024
+    except OSError:
+        pass
+    return stats
+
+
+def _wait_ready(port: int, process: subprocess.Popen, timeout: float = 300.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Server exited with code {process.returncode}")
+        try:
+            with urllib.request.urlopen(f"http://{HOST}:{port}/health", timeout=2) as response:
+                if response.status == 200:
+                    return
+        except (urllib.error.URLError, OSError):
+            pass
+        time.sleep(0.5)
+    raise RuntimeError("Server did not become ready")
+
+
+async def _post(port: int, payload: bytes, timeout: float) -> str:
+    """Send one request on a fresh connection and return its status code, or the failure kind."""
+    async def exchange() -> str:
+        reader, writer = await asyncio.open_connection(HOST, port)
+        try:
+            writer.write(
+                b"POST /analyze HTTP/1.1\r\nHost: bench\r\nContent-Type: application/json\r\n"
+                b"Content-Length: %d\r\nConnection: close\r\n\r\n%s" % (len(payload), payload)
+            )
+            await writer.drain()
+            status_line = await reader.readline()
+            await reader.read()
+            return status_line.split()[1].decode() if status_line else "closed"
+        finally:
+            writer.close()
+
+    try:
+        return await asyncio.wait_for(exchange(), timeout)
+    except asyncio.TimeoutError:
+        return "timeout"
+    except OSError:
+        return "error"
+
+
+async def _open_idle(port: int, count: int) -> List[asyncio.StreamWriter]:
+    """Open ``count`` connections that send half a request and then stall, like slow mobile clients."""
+    writers = []
+    for _ in range(count):
+        try:
+            _, writer = await asyncio.open_connection(HOST, port)
+        except OSError:
+            break
+        writer.write(b"POST /analyze HTTP/1.1\r\nHost: bench\r\nContent-Type: application/json\r\n")
+        writers.append(writer)
+    await asyncio.gather(*(writer.drain() for writer in writers), return_exceptions=True)
+    return writers
+
+
+async def _load(port: int, texts: List[str], concurrency: int, timeout: float, idle: int, pid: int) -> Dict[str, Any]:
+    idle_writers = await _open_idle(port, idle)
+    await asyncio.sleep(1.0)
+    under_idle = _process_stats(pid)
+
+    payloads = [json.dumps({"text": text}).encode("utf-8") for text in texts]
+    latencies: List[float] = []
+    outcomes: Dict[str, int] = {}
+
+    async def client(index: int) -> None:
+        for payload in payloads[index::concurrency]:
+            start = time.perf_counter()
+            status = await _post(port, payload, timeout)
+            if status == "200":
+                latencies.append((time.perf_counter() - start) * 1000)
+            outcomes[status] = outcomes.get(status, 0) + 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client(i) for i in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    peak = _process_stats(pid)
+
+    for writer in idle_writers:
+        writer.close()
+    return {
+        "idle_connections": len(idle_writers),
+        **percentiles(latencies),
+        "ok_per_sec": round(len(latencies) / elapsed, 1),
+        "outcomes": outcomes,
+        "server_threads": peak["threads"],
+        "server_rss_mb": peak["rss_mb"],
+        "server_threads_idle_only": under_idle["threads"]
+    }
+
+
+def _run_mode(mode: str, args: argparse.Namespace) -> List[Dict[str, Any]]:
+    port = _free_port()
+    with tempfile.TemporaryDirectory() as tmp:
+        env = {
+            **os.environ,
+            "DATABASE_URL": f"sqlite:///{Path(tmp) / 'feedback.db'}",
+            "LOG_LEVEL": "WARNING"
+        }
+        # Abandoned slow clients make the sync server log bad requests; keep that off the console
+        log_path = Path(tmp) / "server.log"
+        log = open(log_path, "wb")
+        process = subprocess.Popen(
+            [sys.executable, "-m", "benchmarks.serving_bench", "serve", mode, str(port),
+             str(Config.MODEL_PATH), str(args.sync_threads)],
+            env=env,
+            cwd=Path(__file__).resolve().parent.parent,
+            stdout=log,
+            stderr=subprocess.STDOUT
+        )
+        try:
+            try:
+                _wait_ready(port, process)
+            except RuntimeError:
+                print(log_path.read_text(errors="replace")[-4000:])
+                raise
+            runs = []
+            for idle in args.idle:
+                # Fresh texts per run so the prediction cache does not short-circuit inference
+                texts = synthetic_reviews(args.requests, args.length, seed=idle + 1)
+                stats = asyncio.run(_load(port, texts, args.concurrency, args.timeout, idle, process.pid))
+                runs.append(stats)
+                print(
+                    f"{mode:5s} idle={stats['idle_connections']:5d} ok/s={stats['ok_per_sec']:7.1f} "
+                    f"p50={stats.get('p50_ms', 0):8.1f}ms p99={stats.get('p99_ms', 0):8.1f}ms "
+                    f"threads={stats['server_threads']} rss={stats['server_rss_mb']}MB outcomes={stats['outcomes']}"
+                )
+            return runs
+        finally:
+            process.terminate()
+            try:
+                process.wait(timeout=30)
+            except subprocess.TimeoutExpired:
+                process.kill()
+            log.close()
+
+
+def run(args: argparse.Namespace) -> Dict[str, Any]:
+    """Start each server in a subprocess and load it with and without idle slow clients."""
+    _raise_fd_limit()
+    results: Dict[str, Any] = {"workload": {
+        "concurrency": args.concurrency,
+        "requests": args.requests,
+        "length": args.length,
+        "timeout_s": args.timeout,
+        "sync_threads": args.sync_threads,
+        "batching": Config.BATCHING_ENABLED
+    }}
+    for mode in args.modes:
+        if mode == "async" and not all(importlib.util.find_spec(name) for name in ("uvicorn", "a2wsgi")):
+            print("async: skipped, uvicorn or a2wsgi is not installed (pip install uvicorn a2wsgi)")
+            continue
+        results[mode] = _run_mode(mode, args)
+    return results
+
+
+def serve(mode: str, port: int, model_path: str, sync_threads: int) -> None:
+    """Server subprocess: the Flask app on a threaded WSGI server, or the ASGI app on uvicorn."""
+    _raise_fd_limit()
+    Config.MODEL_PATH = Path(model_path)
+    if mode == "async":
+        try:
+            import uvicorn
+        except ImportError as e:
+            raise SystemExit("The async server requires uvicorn: pip install uvicorn a2wsgi") from e
+        from src.asgi import create_asgi_app
+
+        uvicorn.run(create_asgi_app("production"), host=HOST, port=port, log_level="warning", backlog=4096)
+        return
+
+    from concurrent.futures import ThreadPoolExecutor
+    from werkzeug.serving import BaseWSGIServer, make_server
+    from src.app import create_app
+
+    app = create_app("production")
+    if sync_threads <= 0:
+        make_server(HOST, port, app, threaded=True).serve_forever()
+        return
+
+    class PooledWSGIServer(BaseWSGIServer):
+        """A fixed pool of request threads, like gunicorn's gthread worker."""
+
+        request_queue_size = 4096
+
+        def __init__(self):
+            super().__init__(HOST, port, app)
+            self.pool = ThreadPoolExecutor(max_workers=sync_threads)
+
+        def process_request(self, request, client_address):
+            self.pool.submit(self._handle, request, client_address)
+
+        def _handle(self, request, client_address):
+            try:
+                self.finish_request(request, client_address)
+            except Exception:
+                self.handle_error(request, client_address)
+            finally:
+                self.shutdown_request(request)
+
+    PooledWSGIServer().serve_forever()
+
+
+if __name__ == "__main__" and sys.argv[1:2] == ["serve"]:
+    serve(sys.argv[2], int(sys.argv[3]), sys.argv[4], int(sys.argv[5]))
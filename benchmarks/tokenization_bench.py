@@ -0,0 +1,81 @@
+"""Tokenization benchmark: share of predict latency spent tokenizing, before and after the fast path."""
+
+from typing import Any, Dict, List
+import argparse
+import time
+
+from src.config.settings import Config
+from src.models.factory import create_model
+
+from .common import percentiles, synthetic_reviews
+
+# Longest input the service accepts (see SentimentService._validate_input)
+MAX_INPUT_CHARS = 10000
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--lengths", type=int, nargs="+", default=[64, 512, 2000], help="Input lengths in tokens before truncation")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 32], help="Texts per predict call")
+    parser.add_argument("--iterations", type=int, default=10, help="Timed calls per configuration")
+
+
+def _legacy_encode(model, texts: List[str]):
+    """Tokenization as done before the fast path: full text, then ``tokenizer.pad`` per batch."""
+    encodings = model.tokenizer(texts, truncation=True, max_length=Config.MAX_SEQUENCE_LENGTH)
+    features = [{k: encodings[k][i] for k in encodings.keys()} for i in range(len(texts))]
+    return [(list(range(len(texts))), model.tokenizer.pad(features, padding=True, return_tensors=model.RETURN_TENSORS))]
+
+
+def _measure(encode, model, texts: List[str], iterations: int) -> Dict[str, Any]:
+    for _ in range(2):
+        model.predict_encoded(encode(texts), len(texts))
+    tokenize_ms, total_ms = [], []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        batches = encode(texts)
+        encoded = time.perf_counter()
+        model.predict_encoded(batches, len(texts))
+        done = time.perf_counter()
+        tokenize_ms.append((encoded - start) * 1000)
+        total_ms.append((done - start) * 1000)
+    tokenize = percentiles(tokenize_ms)
+    total = percentiles(total_ms)
+    return {
+        "tokenize": tokenize,
+        "total": total,
+        "tokenize_share": round(tokenize["mean_ms"] / total["mean_ms"], 4)
+    }
+
+
+def run(args: argparse.Namespace) -> Dict[str, Any]:
+    """Time tokenization against the full predict path for each (length, batch size) pair."""
+    Config.BATCH_SIZE = max(args.batch_sizes)
+    model = create_model()
+    model.load()
+
+    rows: List[Dict[str, Any]] = []
+    for length in args.lengths:
+        for batch_size in args.batch_sizes:
+            texts = [text[:MAX_INPUT_CHARS] for text in synthetic_reviews(batch_size, length, seed=length)]
+            before = _measure(lambda t: _legacy_encode(model, t), model, texts, args.iterations)
+            after = _measure(model.encode, model, texts, args.iterations)
+            rows.append({
+                "length": length,
+                "chars": max(len(text) for text in texts),
+                "batch_size": batch_size,
+                "before": before,
+                "after": after,
+                "tokenize_speedup": round(before["tokenize"]["mean_ms"] / after["tokenize"]["mean_ms"], 2)
+            })
+            print(
+                f"length={length:5d} batch={batch_size:3d} "
+                f"tokenize {before['tokenize']['mean_ms']:8.2f}ms -> {after['tokenize']['mean_ms']:8.2f}ms "
+                f"share {before['tokenize_share']:6.1%} -> {after['tokenize_share']:6.1%}"
+            )
+    return {
+        "model_path": str(model.model_path),
+        "model_version": model.version,
+        "tokenizer_max_chars": Config.TOKENIZER_MAX_CHARS,
+        "tokenization": model.batch_tokenizer.get_stats(),
+        "configurations": rows
+    }
@@ -3,11 +3,35 @@ API Routes for the sentiment analysis application.
 Follows Single Responsibility Principle - handles only HTTP routing.
 """
 
-from flask import Blueprint, render_template, request, jsonify
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+import hmac
+import json
+
+from flask import Blueprint, Response, g, render_template, request, jsonify, stream_with_context
+from sqlalchemy.exc import DataError, IntegrityError
 import logging
+import time
 
-from ..services.sentiment_service import SentimentService, ServiceError
+from ..services.sentiment_service import (
+    SentimentService,
+    ServiceError,
+    ServiceOverloadedError,
+    ServiceNotReadyError
+)
+from ..config.settings import Config
+from ..database.feedback_buffer import BufferFullError, FeedbackBuffer
 from ..database.repository import FeedbackRepository
+from ..monitoring.metrics import (
+    FEEDBACK_FLUSHED,
+    FEEDBACK_PENDING,
+    HTTP_LATENCY,
+    HTTP_REQUESTS,
+    STAGE_LATENCY,
+    render_metrics
+)
 
 
 logger = logging.getLogger(__name__)
@@ -18,6 +42,42 @@ api = Blueprint('api', __name__)
 # Service instance
 sentiment_service = SentimentService()
 
+# Write-behind feedback buffer, started by the app factory
+feedback_buffer = FeedbackBuffer(
+    max_records=Config.FEEDBACK_FLUSH_MAX_RECORDS,
+    flush_interval_ms=Config.FEEDBACK_FLUSH_INTERVAL_MS,
+    max_pending=Config.FEEDBACK_BUFFER_MAX_PENDING
+)
+FEEDBACK_PENDING.set_function(feedback_buffer.pending)
+FEEDBACK_FLUSHED.set_function(lambda: feedback_buffer.flushed_records)
+
+FEEDBACK_REQUIRED_FIELDS = ['text', 'predicted_sentiment', 'predicted_confidence', 'is_correct']
+# Optional string fields and the length of their columns (None: unlimited)
+FEEDBACK_OPTIONAL_FIELDS = {'correct_label': 20, 'user_comment': None, 'model_version': 64}
+
+# Errors for a record the database refused, as opposed to a failed database
+RECORD_REJECTED_ERRORS = (DataError, IntegrityError)
+
+_PARSE_LATENCY = STAGE_LATENCY.labels(stage="parse")
+_SERIALIZE_LATENCY = STAGE_LATENCY.labels(stage="serialize")
+
+
+@api.before_request
+def start_timer():
+    """Record when the request reached the blueprint."""
+    g.request_start = time.perf_counter()
+
+
+@api.after_request
+def record_request_metrics(response):
+    """Count the request and observe its latency under the matched route."""
+    start = g.get('request_start')
+    route = request.url_rule.rule if request.url_rule is not None else 'unmatched'
+    if start is not None:
+        HTTP_LATENCY.labels(route=route).observe(time.perf_counter() - start)
+    HTTP_REQUESTS.labels(route=route, method=request.method, status=response.status_code).inc()
+    return response
+
 
 @api.route('/')
 def index():
@@ -31,6 +91,31 @@ def admin():
     return render_template('admin.html')
 
 
+def parse_analyze_request(body: bytes, query_mode: Optional[str]) -> Tuple[Dict[str, Any], Optional[str]]:
+    """
+    Parse the body of an analyze request; shared with the ASGI app.
+    
+    Args:
+        body: Raw request body, read as JSON whatever the content type
+        query_mode: The ``mode`` query parameter, used when the body has none
+    
+    Returns:
+        The request object, and the routing mode
+    
+    Raises:
+        ValueError: If the body is missing, not JSON, or not a JSON object
+    """
+    try:
+        data = json.loads(body) if body else None
+    except ValueError:
+        raise ValueError("Request body must be valid JSON")
+    if not data:
+        raise ValueError("Request body is required")
+    if not isinstance(data, dict):
+        raise ValueError("Request body must be a JSON object")
+    return data, data.get('mode') or query_mode
+
+
 @api.route('/analyze', methods=['POST'])
 def analyze():
     """
@@ -38,7 +123,8 @@ def analyze():
     
     Request Body:
         {
-            "text": "Review text to analyze"
+            "text": "Review text to analyze",
+            "mode": "auto" | "fast" | "accurate" | "cascade"  (optional, also ?mode=)
         }
     
     Response:
@@ -48,20 +134,29 @@ def analyze():
             "scores": {
                 "positive": 95.5,
                 "negative": 4.5
-            }
+            },
+            "model_version": "3f2a9c1e0b7d-fp32",
+            "model": "distilbert" | "fast"
         }
     """
+    start = time.perf_counter()
     try:
-        data = request.get_json()
-        
-        if not data:
-            return jsonify({"error": "Request body is required"}), 400
-        
-        text = data.get('text', '')
+        data, mode = parse_analyze_request(request.get_data(), request.args.get('mode'))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    _PARSE_LATENCY.observe(time.perf_counter() - start)
+    
+    try:
+        result = sentiment_service.analyze(data.get('text', ''), mode=mode)
         
-        result = sentiment_service.analyze(text)
-        return jsonify(result)
+        start = time.perf_counter()
+        response = jsonify(result)
+        _SERIALIZE_LATENCY.observe(time.perf_counter() - start)
+        return response
         
+    except (ServiceOverloadedError, ServiceNotReadyError) as e:
+        logger.warning(f"Service unavailable: {e}")
+        return jsonify({"error": str(e)}), 503
     except ServiceError as e:
         logger.warning(f"Service error: {e}")
         return jsonify({"error": str(e)}), 400
@@ -70,6 +165,47 @@ def analyze():
         return jsonify({"error": "An unexpected error occurred"}), 500
 
 
+def _feedback_record(data: Any) -> Dict[str, Any]:
+    """
+    Validate a feedback payload and build its column values.
+    
+    Records are checked against the column types here, so that a buffered
+    record accepted with ``202`` is not rejected later by the database.
+    
+    Raises:
+        ValueError: If a required field is missing or a field has the wrong type
+    """
+    if not isinstance(data, dict):
+        raise ValueError("Feedback must be an object")
+    for field in FEEDBACK_REQUIRED_FIELDS:
+        if field not in data:
+            raise ValueError(f"Missing required field: {field}")
+    if not isinstance(data['text'], str):
+        raise ValueError("text must be a string")
+    if not isinstance(data['predicted_sentiment'], str) or len(data['predicted_sentiment']) > 20:
+        raise ValueError("predicted_sentiment must be a string of at most 20 characters")
+    confidence = data['predicted_confidence']
+    # bool is an int, and NaN fails both comparisons
+    if isinstance(confidence, bool) or not isinstance(confidence, (int, float)) or not 0 <= confidence <= 100:
+        raise ValueError("predicted_confidence must be a number between 0 and 100")
+    if not isinstance(data['is_correct'], bool):
+        raise ValueError("is_correct must be true or false")
+    for field, max_length in FEEDBACK_OPTIONAL_FIELDS.items():
+        value = data.get(field)
+        if value is not None and (not isinstance(value, str) or (max_length and len(value) > max_length)):
+            limit = f" of at most {max_length} characters" if max_length else ""
+            raise ValueError(f"{field} must be a string{limit}")
+    return {
+        'text': data['text'],
+        'predicted_sentiment': data['predicted_sentiment'],
+        'predicted_confidence': data['predicted_confidence'],
+        'is_correct': data['is_correct'],
+        'correct_label': data.get('correct_label'),
+        'user_comment': data.get('user_comment'),
+        'model_version': data.get('model_version')
+    }
+
+
 @api.route('/feedback', methods=['POST'])
 def submit_feedback():
     """
@@ -84,6 +220,10 @@ def submit_feedback():
             "correct_label": "Negative" (optional),
             "user_comment": "Comment" (optional)
         }
+    
+    With the feedback buffer on, the record is written in the next bulk
+    insert. ``FEEDBACK_CONSISTENCY=durable`` waits for that insert and
+    returns the id; ``eventual`` returns 202 right away without one.
     """
     try:
         data = request.get_json()
@@ -92,31 +232,119 @@ def submit_feedback():
             return jsonify({"error": "Request body is required"}), 400
         
         # Validate required fields
-        required_fields = ['text', 'predicted_sentiment', 'predicted_confidence', 'is_correct']
-        for field in required_fields:
-            if field not in data:
-                return jsonify({"error": f"Missing required field: {field}"}), 400
-        
-        # Create feedback
-        feedback = FeedbackRepository.create_feedback(
-            text=data['text'],
-            predicted_sentiment=data['predicted_sentiment'],
-            predicted_confidence=data['predicted_confidence'],
-            is_correct=data['is_correct'],
-            correct_label=data.get('correct_label'),
-            user_comment=data.get('user_comment')
-        )
+        try:
+            record = _feedback_record(data)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        
+        if not feedback_buffer.is_running():
+            feedback = FeedbackRepository.create_feedback(**record)
+            return jsonify({
+                "message": "Feedback submitted successfully",
+                "feedback_id": feedback.id
+            }), 201
+        
+        future = feedback_buffer.submit([record])[0]
+        if Config.FEEDBACK_CONSISTENCY == 'eventual':
+            return jsonify({
+                "message": "Feedback accepted",
+                "feedback_id": None
+            }), 202
         
         return jsonify({
             "message": "Feedback submitted successfully",
-            "feedback_id": feedback.id
+            "feedback_id": future.result(timeout=Config.FEEDBACK_WRITE_TIMEOUT)
         }), 201
         
+    except (BufferFullError, FutureTimeoutError) as e:
+        logger.warning(f"Feedback buffer unavailable: {e}")
+        return jsonify({"error": "Feedback service is busy. Please try again later."}), 503
+    except RECORD_REJECTED_ERRORS as e:
+        logger.warning(f"Feedback record rejected by the database: {e}")
+        return jsonify({"error": "Feedback record was rejected by the database"}), 400
     except Exception as e:
         logger.error(f"Failed to submit feedback: {e}")
         return jsonify({"error": "Failed to submit feedback"}), 500
 
 
+@api.route('/feedback/batch', methods=['POST'])
+def submit_feedback_batch():
+    """
+    Submit many feedback records at once.
+    
+    Request Body:
+        {
+            "feedback": [{"text": "...", "predicted_sentiment": "Positive", ...}, ...]
+        }
+    
+    Response:
+        {
+            "results": [{"feedback_id": 12}, {"error": "Missing required field: is_correct"}, ...]
+        }
+    
+    Invalid records get an ``error`` entry without failing the rest; the
+    response is 400 when no record was stored. With
+    ``FEEDBACK_CONSISTENCY=eventual`` the response is 202 and ids are null.
+    """
+    try:
+        data = request.get_json()
+        
+        if not data:
+            return jsonify({"error": "Request body is required"}), 400
+        
+        items = data.get('feedback')
+        if not isinstance(items, list) or not items:
+            return jsonify({"error": "Feedback must be a non-empty list"}), 400
+        if len(items) > Config.MAX_BATCH_ITEMS:
+            return jsonify({"error": f"Too many records (max {Config.MAX_BATCH_ITEMS} per batch)"}), 400
+        
+        results = [{} for _ in items]
+        valid_indices, records = [], []
+        for i, item in enumerate(items):
+            try:
+                records.append(_feedback_record(item))
+                valid_indices.append(i)
+            except ValueError as e:
+                results[i] = {"error": str(e)}
+        
+        if not records:
+            return jsonify({"results": results}), 400
+        
+        if not feedback_buffer.is_running():
+            for i, feedback_id in zip(valid_indices, FeedbackRepository.create_feedback_batch(records)):
+                results[i] = {"feedback_id": feedback_id}
+            return jsonify({"results": results}), 201
+        
+        futures = feedback_buffer.submit(records)
+        eventual = Config.FEEDBACK_CONSISTENCY == 'eventual'
+        deadline = time.monotonic() + Config.FEEDBACK_WRITE_TIMEOUT
+        for i, future in zip(valid_indices, futures):
+            if eventual:
+                results[i] = {"feedback_id": None}
+                continue
+            try:
+                results[i] = {"feedback_id": future.result(timeout=max(0.0, deadline - time.monotonic()))}
+            except FutureTimeoutError:
+                raise
+            except RECORD_REJECTED_ERRORS as e:
+                logger.warning(f"Feedback record rejected by the database: {e}")
+                results[i] = {"error": "Feedback record was rejected by the database"}
+            except Exception as e:
+                logger.warning(f"Failed to store feedback record: {e}")
+                results[i] = {"error": "Failed to store feedback"}
+        if eventual:
+            return jsonify({"results": results}), 202
+        stored = any("feedback_id" in result for result in results)
+        return jsonify({"results": results}), 201 if stored else 400
+        
+    except (BufferFullError, FutureTimeoutError) as e:
+        logger.warning(f"Feedback buffer unavailable: {e}")
+        return jsonify({"error": "Feedback service is busy. Please try again later."}), 503
+    except Exception as e:
+        logger.error(f"Failed to submit feedback batch: {e}")
+        return jsonify({"error": "Failed to submit feedback"}), 500
+
+
 @api.route('/feedback/stats', methods=['GET'])
 def get_feedback_stats():
     """Get feedback statistics."""
@@ -128,20 +356,144 @@ def get_feedback_stats():
         return jsonify({"error": "Failed to get statistics"}), 500
 
 
+def _parse_timestamp(name: str) -> Optional[datetime]:
+    """Parse an ISO date or datetime query argument as naive UTC, matching ``created_at``."""
+    value = request.args.get(name)
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f"{name} must be an ISO 8601 date or datetime")
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _feedback_filters() -> Dict[str, Any]:
+    """
+    Read the feedback list filters from the query string.
+    
+    Raises:
+        ValueError: If a filter value is invalid
+    """
+    filters: Dict[str, Any] = {
+        'sentiment': request.args.get('sentiment') or None,
+        'correct_label': request.args.get('correct_label') or None,
+        'since': _parse_timestamp('since'),
+        'until': _parse_timestamp('until')
+    }
+    is_correct = request.args.get('is_correct')
+    if is_correct:
+        if is_correct.lower() not in ('true', 'false'):
+            raise ValueError("is_correct must be true or false")
+        filters['is_correct'] = is_correct.lower() == 'true'
+    return filters
+
+
 @api.route('/feedback', methods=['GET'])
 def get_all_feedback():
-    """Get all feedback entries."""
+    """
+    List feedback entries, newest first, one page at a time.
+    
+    Query parameters:
+        limit: Page size (default 100, capped at FEEDBACK_PAGE_MAX)
+        cursor: ``next_cursor`` from the previous page
+        is_correct, sentiment, correct_label: Exact-match filters
+        since, until: ISO 8601 bounds on ``created_at`` (UTC, until exclusive)
+    """
     try:
         limit = request.args.get('limit', 100, type=int)
-        feedback_list = FeedbackRepository.get_all_feedback(limit=limit)
+        feedback_list, next_cursor = FeedbackRepository.get_feedback_page(
+            limit=limit,
+            cursor=request.args.get('cursor') or None,
+            **_feedback_filters()
+        )
         return jsonify({
-            "feedback": [f.to_dict() for f in feedback_list]
+            "feedback": [f.to_dict() for f in feedback_list],
+            "next_cursor": next_cursor
         })
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
     except Exception as e:
         logger.error(f"Failed to get feedback: {e}")
         return jsonify({"error": "Failed to get feedback"}), 500
 
 
+@api.route('/feedback/export', methods=['GET'])
+def export_feedback():
+    """
+    Stream every matching feedback entry as one JSON document.
+    
+    Takes the same filters as ``GET /feedback``. Rows are read in keyset
+    chunks and written as they are serialized, so memory use does not grow
+    with the size of the export.
+    """
+    try:
+        filters = _feedback_filters()
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    def generate():
+        yield '{"feedback": ['
+        for i, feedback in enumerate(FeedbackRepository.iter_feedback(**filters)):
+            yield (',' if i else '') + json.dumps(feedback.to_dict())
+        yield ']}'
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype='application/json',
+        headers={'Content-Disposition': 'attachment; filename=feedback.json'}
+    )
+
+
+@api.route('/admin/model/reload', methods=['POST'])
+def reload_model():
+    """
+    Load a checkpoint in the background and swap it in without a restart.
+    
+    Request Body (optional):
+        {
+            "model_path": "checkpoints-v2"
+        }
+    
+    ``model_path`` is resolved under ``MODEL_RELOAD_ROOT``; without it the
+    checkpoint at ``MODEL_PATH`` is reloaded. Requires
+    ``Authorization: Bearer <ADMIN_TOKEN>``. Progress is reported under
+    ``reload`` in ``/health``.
+    """
+    if not Config.ADMIN_TOKEN:
+        return jsonify({"error": "Model reload is disabled (ADMIN_TOKEN is not set)"}), 403
+    token = _bearer_token(request.headers.get('Authorization', ''))
+    if token is None or not hmac.compare_digest(token.encode(), Config.ADMIN_TOKEN.encode()):
+        return jsonify({"error": "Unauthorized"}), 401, {"WWW-Authenticate": "Bearer"}
+    
+    data = request.get_json(silent=True) or {}
+    model_path = None
+    if data.get('model_path'):
+        root = Path(Config.MODEL_RELOAD_ROOT).resolve()
+        model_path = (root / str(data['model_path'])).resolve()
+        if not model_path.is_relative_to(root) or not (model_path / 'config.json').is_file():
+            return jsonify({"error": "model_path must be a checkpoint directory under MODEL_RELOAD_ROOT"}), 400
+    
+    if not sentiment_service.reload_model(model_path):
+        return jsonify({"error": "A model reload is already in progress"}), 409
+    return jsonify({
+        "status": "reloading",
+        "model_path": str(model_path or Config.MODEL_PATH),
+        "model_version": sentiment_service.get_status()["model_version"]
+    }), 202
+
+
+def _bearer_token(authorization: str) -> Optional[str]:
+    """Token of a ``Bearer`` Authorization header (scheme is case-insensitive), else None."""
+    scheme, _, token = authorization.strip().partition(' ')
+    token = token.strip()
+    if scheme.lower() != 'bearer' or not token:
+        return None
+    return token
+
+
 @api.route('/health')
 def health():
     """Health check endpoint."""
@@ -149,12 +501,60 @@ def health():
     
     if status['ready']:
         return jsonify({"status": "healthy", **status}), 200
+    elif status['state'] == 'warming':
+        return jsonify({"status": "warming", **status}), 503
     else:
         return jsonify({"status": "unhealthy", **status}), 503
 
 
+@api.route('/metrics')
+def metrics():
+    """Prometheus scrape endpoint in the text exposition format."""
+    return Response(render_metrics(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
+
 @api.route('/api/v1/analyze', methods=['POST'])
 def analyze_v1():
     """Versioned API endpoint for sentiment analysis."""
     return analyze()
 
+
+@api.route('/api/v1/analyze/batch', methods=['POST'])
+def analyze_batch_v1():
+    """
+    Batch sentiment analysis endpoint.
+    
+    Request Body:
+        {
+            "texts": ["First review", "Second review", ...],
+            "mode": "auto" | "fast" | "accurate" | "cascade"  (optional, also ?mode=)
+        }
+    
+    Response:
+        {
+            "results": [
+                {"sentiment": "Positive", "confidence": 95.5, "scores": {...}},
+                {"error": "Text cannot be empty"},
+                ...
+            ]
+        }
+    """
+    try:
+        data, mode = parse_analyze_request(request.get_data(), request.args.get('mode'))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    
+    try:
+        results = sentiment_service.analyze_batch(data.get('texts'), mode=mode)
+        return jsonify({"results": results})
+        
+    except ServiceNotReadyError as e:
+        logger.warning(f"Service unavailable: {e}")
+        return jsonify({"error": str(e)}), 503
+    except ServiceError as e:
+        logger.warning(f"Service error: {e}")
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        logger.error(f"Unexpected error: {e}")
+        return jsonify({"error": "An unexpected error occurred"}), 500
+
@@ -3,12 +3,16 @@ Flask Application Factory.
 Follows Factory Pattern for creating Flask app instances.
 """
 
+import atexit
 import logging
+import time
 from flask import Flask
 
 from .config.settings import Config, get_config
-from .api.routes import api, sentiment_service
+from .api.routes import api, feedback_buffer, sentiment_service
+from .database.engine import configure_engine, engine_options
 from .database.models import db
+from .database.repository import FeedbackRepository
 
 
 def create_app(config_name: str = 'default') -> Flask:
@@ -21,6 +25,8 @@ def create_app(config_name: str = 'default') -> Flask:
     Returns:
         Configured Flask application
     """
+    start = time.perf_counter()
+    
     # Initialize environment
     Config.init_environment()
     
@@ -42,9 +48,14 @@ def create_app(config_name: str = 'default') -> Flask:
     
     # Load configuration
     app.config.from_object(config)
+    if config.DATABASE_TUNING:
+        app.config.setdefault('SQLALCHEMY_ENGINE_OPTIONS', engine_options(config.SQLALCHEMY_DATABASE_URI))
     
     # Initialize database
     db.init_app(app)
+    if config.DATABASE_TUNING:
+        with app.app_context():
+            configure_engine(db.engine)
     
     # Register blueprints
     app.register_blueprint(api)
@@ -53,8 +64,15 @@ def create_app(config_name: str = 'default') -> Flask:
     with app.app_context():
         initialize_database()
         initialize_services()
+    initialize_feedback_buffer(app)
+    
+    # Flush buffered feedback and stop workers on graceful shutdown
+    atexit.register(shutdown_services)
     
-    logger.info(f"{Config.APP_NAME} v{Config.VERSION} initialized")
+    logger.info(
+        f"{Config.APP_NAME} v{Config.VERSION} initialized in "
+        f"{time.perf_counter() - start:.3f}s"
+    )
     
     return app
 
@@ -73,6 +91,9 @@ def initialize_database() -> None:
     logger.info("Initializing database...")
     try:
         db.create_all()
+        FeedbackRepository.ensure_columns()
+        FeedbackRepository.ensure_indexes()
+        FeedbackRepository.ensure_feedback_stats()
         logger.info("Database initialized successfully")
     except Exception as e:
         logger.error(f"Failed to initialize database: {e}")
@@ -85,9 +106,24 @@ def initialize_services() -> None:
     logger.info("Initializing services...")
     
     try:
-        sentiment_service.initialize()
-        logger.info("All services initialized successfully")
+        background = Config.MODEL_LOAD_IN_BACKGROUND
+        sentiment_service.initialize(background=background)
+        if background:
+            logger.info("Model loading in background, /health reports 'warming' until ready")
+        else:
+            logger.info("All services initialized successfully")
     except Exception as e:
         logger.error(f"Failed to initialize services: {e}")
         raise
 
+
+def initialize_feedback_buffer(app: Flask) -> None:
+    """Start the write-behind feedback buffer if enabled."""
+    if Config.FEEDBACK_BUFFER_ENABLED:
+        feedback_buffer.start(app)
+
+
+def shutdown_services() -> None:
+    """Flush pending feedback and stop background workers."""
+    feedback_buffer.stop()
+    sentiment_service.shutdown()
@@ -0,0 +1,298 @@
+"""
+ASGI application for async serving.
+
+The inference endpoints and ``/health`` and ``/metrics`` are served
+natively: a request awaits its prediction from the micro-batching scheduler
+or the inference executor, so an idle or slow connection costs a coroutine
+instead of a thread. Every other route (UI, feedback, admin) is passed to
+the Flask app through ``a2wsgi`` on a thread pool and behaves exactly as
+under WSGI.
+
+Usage:
+    uvicorn asgi:app --host 0.0.0.0 --port 5000
+"""
+
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Tuple
+from urllib.parse import parse_qs
+import asyncio
+import json
+import logging
+import threading
+import time
+
+from a2wsgi import WSGIMiddleware
+from flask import Flask
+
+from .app import create_app, shutdown_services
+from .api.routes import parse_analyze_request, sentiment_service
+from .config.settings import Config
+from .monitoring.metrics import HTTP_LATENCY, HTTP_REQUESTS, STAGE_LATENCY, render_metrics
+from .services.sentiment_service import ServiceError, ServiceNotReadyError, ServiceOverloadedError
+
+
+logger = logging.getLogger(__name__)
+
+_PARSE_LATENCY = STAGE_LATENCY.labels(stage="parse")
+_SERIALIZE_LATENCY = STAGE_LATENCY.labels(stage="serialize")
+
+# (status, content type, body)
+Response = Tuple[int, str, bytes]
+
+# Set for a Flask response once its client is gone; copied into the WSGI thread
+_response_abandoned: ContextVar[threading.Event] = ContextVar("_response_abandoned")
+
+
+class ASGIApp:
+    """ASGI front end for the sentiment service, falling back to the Flask app."""
+
+    def __init__(self, flask_app: Flask):
+        """
+        Initialize the app.
+
+        Args:
+            flask_app: Application from ``create_app``, used for every route
+                without a native async handler
+        """
+        self.flask_app = flask_app
+        self._wsgi = WSGIMiddleware(_stop_when_abandoned(flask_app), workers=Config.ASGI_WSGI_THREADS)
+        self._routes: Dict[Tuple[str, str], Callable[[bytes, Dict[str, Any]], Awaitable[Response]]] = {
+            ("POST", "/analyze"): self._analyze,
+            ("POST", "/api/v1/analyze"): self._analyze,
+            ("POST", "/api/v1/analyze/batch"): self._analyze_batch,
+            ("GET", "/health"): self._health,
+            ("GET", "/metrics"): self._metrics
+        }
+
+    async def __call__(self, scope: Dict[str, Any], receive, send) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+        handler = self._routes.get((scope["method"], scope["path"]))
+        if handler is None:
+            await self._call_wsgi(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        try:
+            body = await _read_body(receive)
+        except ClientDisconnected:
+            return
+        except RequestTooLarge:
+            status, content_type, payload = _json(413, {"error": "Request body is too large"})
+        else:
+            status, content_type, payload = await handler(body, scope)
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", content_type.encode("latin-1")),
+                (b"content-length", str(len(payload)).encode("latin-1"))
+            ]
+        })
+        await send({"type": "http.response.body", "body": payload})
+        HTTP_LATENCY.labels(route=scope["path"]).observe(time.perf_counter() - start)
+        HTTP_REQUESTS.labels(route=scope["path"], method=scope["method"], status=status).inc()
+
+    async def _lifespan(self, receive, send) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                shutdown_services()
+                self._wsgi.executor.shutdown(wait=False)
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _analyze(self, body: bytes, scope: Dict[str, Any]) -> Response:
+        """Async ``/analyze``; same request, response and status codes as the Flask view."""
+        start = time.perf_counter()
+        try:
+            data, mode = parse_analyze_request(body, _query_mode(scope))
+        except ValueError as e:
+            return _json(400, {"error": str(e)})
+        _PARSE_LATENCY.observe(time.perf_counter() - start)
+
+        try:
+            result = await sentiment_service.analyze_async(data.get('text', ''), mode=mode)
+        except (ServiceOverloadedError, ServiceNotReadyError) as e:
+            logger.warning(f"Service unavailable: {e}")
+            return _json(503, {"error": str(e)})
+        except ServiceError as e:
+            logger.warning(f"Service error: {e}")
+            return _json(400, {"error": str(e)})
+        except Exception as e:
+            logger.error(f"Unexpected error: {e}")
+            return _json(500, {"error": "An unexpected error occurred"})
+
+        start = time.perf_counter()
+        response = _json(200, result)
+        _SERIALIZE_LATENCY.observe(time.perf_counter() - start)
+        return response
+
+    async def _analyze_batch(self, body: bytes, scope: Dict[str, Any]) -> Response:
+        """Async ``/api/v1/analyze/batch``."""
+        try:
+            data, mode = parse_analyze_request(body, _query_mode(scope))
+        except ValueError as e:
+            return _json(400, {"error": str(e)})
+        try:
+            results = await sentiment_service.analyze_batch_async(data.get('texts'), mode=mode)
+        except ServiceNotReadyError as e:
+            logger.warning(f"Service unavailable: {e}")
+            return _json(503, {"error": str(e)})
+        except ServiceError as e:
+            logger.warning(f"Service error: {e}")
+            return _json(400, {"error": str(e)})
+        except Exception as e:
+            logger.error(f"Unexpected error: {e}")
+            return _json(500, {"error": "An unexpected error occurred"})
+        return _json(200, {"results": results})
+
+    async def _health(self, body: bytes, scope: Dict[str, Any]) -> Response:
+        status = sentiment_service.get_status()
+        if status['ready']:
+            return _json(200, {"status": "healthy", **status})
+        if status['state'] == 'warming':
+            return _json(503, {"status": "warming", **status})
+        return _json(503, {"status": "unhealthy", **status})
+
+    async def _metrics(self, body: bytes, scope: Dict[str, Any]) -> Response:
+        return 200, "text/plain; version=0.0.4; charset=utf-8", render_metrics().encode("utf-8")
+
+    async def _call_wsgi(self, scope: Dict[str, Any], receive, send) -> None:
+        """
+        Run the Flask app for this request through the WSGI adapter.
+
+        The response streams back chunk by chunk, so streaming views (e.g.
+        ``/feedback/export``) keep their constant memory use. Once the client
+        disconnects, or takes no chunk for ``ASGI_WSGI_SEND_TIMEOUT`` seconds,
+        the rest of the response is dropped and the view stops at its next
+        chunk, so it never holds its pool thread indefinitely.
+        """
+        try:
+            body = await _read_body(receive)
+        except ClientDisconnected:
+            return
+        except RequestTooLarge:
+            status, content_type, payload = _json(413, {"error": "Request body is too large"})
+            await send({"type": "http.response.start", "status": status,
+                        "headers": [(b"content-type", content_type.encode("latin-1"))]})
+            await send({"type": "http.response.body", "body": payload})
+            return
+
+        abandoned = threading.Event()
+        received = False
+
+        async def replay_body() -> Dict[str, Any]:
+            nonlocal received
+            if received:
+                # The adapter never reads past the last body message
+                await asyncio.Event().wait()
+            received = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        async def send_unless_abandoned(message: Dict[str, Any]) -> None:
+            if abandoned.is_set():
+                return
+            try:
+                await asyncio.wait_for(send(message), Config.ASGI_WSGI_SEND_TIMEOUT)
+            except asyncio.TimeoutError:
+                abandoned.set()
+                logger.warning(
+                    f"Client took no data from {scope['path']} for {Config.ASGI_WSGI_SEND_TIMEOUT:g}s, "
+                    f"abandoning the response"
+                )
+            except OSError:
+                abandoned.set()
+
+        watcher = asyncio.ensure_future(_wait_for_disconnect(receive))
+        watcher.add_done_callback(lambda task: task.cancelled() or abandoned.set())
+        _response_abandoned.set(abandoned)
+        responder = asyncio.ensure_future(self._wsgi(scope, replay_body, send_unless_abandoned))
+        try:
+            await asyncio.shield(responder)
+        except asyncio.CancelledError:
+            # The adapter keeps draining the view's chunks, dropping them, until it stops
+            abandoned.set()
+            raise
+        finally:
+            watcher.cancel()
+
+
+class ClientDisconnected(Exception):
+    """Exception raised when the client disconnects before sending the whole request."""
+    pass
+
+
+class RequestTooLarge(Exception):
+    """Exception raised when a request body exceeds ``ASGI_MAX_BODY_BYTES``."""
+    pass
+
+
+async def _read_body(receive) -> bytes:
+    chunks = []
+    size = 0
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            raise ClientDisconnected()
+        chunk = message.get("body", b"")
+        size += len(chunk)
+        if size > Config.ASGI_MAX_BODY_BYTES:
+            raise RequestTooLarge()
+        chunks.append(chunk)
+        if not message.get("more_body", False):
+            return b"".join(chunks)
+
+
+async def _wait_for_disconnect(receive) -> None:
+    """Return once the client disconnects; the request body has already been read."""
+    while (await receive())["type"] != "http.disconnect":
+        pass
+
+
+def _query_mode(scope: Dict[str, Any]) -> Optional[str]:
+    """The ``mode`` query parameter, used when the body has none."""
+    values = parse_qs(scope["query_string"].decode("latin-1")).get("mode")
+    return values[0] if values else None
+
+
+def _json(status: int, data: Any) -> Response:
+    return status, "application/json", json.dumps(data).encode("utf-8")
+
+
+def _stop_when_abandoned(wsgi_app: Callable) -> Callable:
+    """Wrap a WSGI app so a response stops at its next chunk once its client is gone."""
+    def app(environ: Dict[str, Any], start_response: Callable) -> Iterable[bytes]:
+        iterable = wsgi_app(environ, start_response)
+        abandoned = _response_abandoned.get(None)
+        if abandoned is None:
+            return iterable
+
+        def chunks():
+            try:
+                for chunk in iterable:
+                    if abandoned.is_set():
+                        return
+                    yield chunk
+            finally:
+                if hasattr(iterable, "close"):
+                    iterable.close()
+
+        return chunks()
+
+    return app
+
+
+def create_asgi_app(config_name: str = 'default') -> ASGIApp:
+    """
+    Create the Flask app and wrap it for async serving.
+
+    Args:
+        config_name: Configuration name ('development', 'production', 'test')
+    """
+    return ASGIApp(create_app(config_name))
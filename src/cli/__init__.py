@@ -0,0 +1 @@
+"""Command-line tools for offline processing."""
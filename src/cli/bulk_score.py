@@ -0,0 +1,363 @@
+"""
+Streaming offline bulk scorer for large review dumps.
+
+Usage:
+    python -m src.cli.bulk_score reviews.jsonl.gz scores.jsonl --text-field reviewText
+    python -m src.cli.bulk_score reviews.csv scores_parquet/ --format parquet --resume
+    python -m src.cli.bulk_score reviews.jsonl scores.jsonl --long-documents
+
+Input is read as a stream (JSONL or CSV, optionally gzipped), so memory stays
+bounded by ``--window`` rows regardless of file size. A producer thread reads
+and tokenizes the next window while the model scores the current one. Results
+are written in input order and a checkpoint is committed after every window,
+so ``--resume`` continues after a crash without duplicating or losing rows.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import argparse
+import csv
+import gzip
+import io
+import json
+import logging
+import os
+import queue
+import threading
+import time
+
+from ..config.settings import Config
+from ..models.sentiment_model import SentimentModel
+
+
+logger = logging.getLogger(__name__)
+
+_DONE = object()
+
+
+def open_text(path: Path):
+    """Open a possibly gzipped text file for reading."""
+    if path.suffix == ".gz":
+        return io.TextIOWrapper(gzip.open(path, "rb"), encoding="utf-8", newline="")
+    return open(path, "r", encoding="utf-8", newline="")
+
+
+def read_rows(path: Path, text_field: str, id_field: Optional[str], skip: int = 0) -> Iterator[Tuple[Any, Any]]:
+    """
+    Stream ``(id, text)`` pairs from a JSONL or CSV file.
+
+    Args:
+        path: Input file (.jsonl/.json/.csv, optionally .gz)
+        text_field: Column holding the review text
+        id_field: Column holding a row identifier (row number if omitted)
+        skip: Number of leading rows to skip when resuming
+    """
+    name = path.name[:-3] if path.suffix == ".gz" else path.name
+    is_csv = name.endswith(".csv")
+    with open_text(path) as handle:
+        if is_csv:
+            csv.field_size_limit(1 << 24)
+            rows = csv.DictReader(handle)
+        else:
+            rows = (line for line in handle if line.strip())
+        for index, row in enumerate(rows):
+            if index < skip:
+                continue
+            if not is_csv:
+                try:
+                    row = json.loads(row)
+                except ValueError:
+                    yield index, None
+                    continue
+                if not isinstance(row, dict):
+                    yield index, None
+                    continue
+            row_id = row.get(id_field, index) if id_field else index
+            yield row_id, row.get(text_field)
+
+
+class Checkpoint:
+    """Atomically persisted progress marker for a scoring run."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.rows_done = 0
+        self.output_bytes = 0
+        self.parts = 0
+
+    def load(self) -> "Checkpoint":
+        if self.path.exists():
+            state = json.loads(self.path.read_text(encoding="utf-8"))
+            self.rows_done = state["rows_done"]
+            self.output_bytes = state.get("output_bytes", 0)
+            self.parts = state.get("parts", 0)
+        return self
+
+    def save(self) -> None:
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps({
+            "rows_done": self.rows_done,
+            "output_bytes": self.output_bytes,
+            "parts": self.parts
+        }), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+
+
+class JsonlWriter:
+    """Appends result records to a JSONL file, truncating uncommitted tail on resume."""
+
+    def __init__(self, path: Path, checkpoint: Checkpoint):
+        self.checkpoint = checkpoint
+        mode = "r+b" if checkpoint.rows_done and path.exists() else "wb"
+        self._handle = open(path, mode)
+        self._handle.seek(checkpoint.output_bytes)
+        self._handle.truncate()
+
+    def write(self, records: List[Dict[str, Any]]) -> None:
+        self._handle.write("".join(json.dumps(r, ensure_ascii=False) + "\n" for r in records).encode("utf-8"))
+
+    def commit(self) -> None:
+        self._handle.flush()
+        os.fsync(self._handle.fileno())
+        self.checkpoint.output_bytes = self._handle.tell()
+
+    def close(self) -> None:
+        self._handle.close()
+
+
+def parquet_schema():
+    """
+    The one schema every Parquet part is written with.
+
+    Inferring it per part breaks on mixed id types (a row-number fallback
+    next to string ids) and lets a part of only error rows disagree with
+    the others, so ids are stored as strings and every column is fixed.
+    """
+    import pyarrow as pa
+
+    return pa.schema([
+        ("id", pa.string()),
+        ("sentiment", pa.string()),
+        ("confidence", pa.float64()),
+        ("negative", pa.float64()),
+        ("positive", pa.float64()),
+        ("error", pa.string())
+    ])
+
+
+class ParquetWriter:
+    """Writes result records as numbered Parquet part files in a directory."""
+
+    def __init__(self, path: Path, checkpoint: Checkpoint, rows_per_part: int):
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError as e:
+            raise SystemExit("Parquet output requires pyarrow: pip install pyarrow") from e
+        self.path = path
+        self.checkpoint = checkpoint
+        self.rows_per_part = rows_per_part
+        self.schema = parquet_schema()
+        self._buffer: List[Dict[str, Any]] = []
+        path.mkdir(parents=True, exist_ok=True)
+        # Drop parts written after the last committed checkpoint
+        for part in path.glob("part-*.parquet"):
+            if int(part.stem.split("-")[1]) >= checkpoint.parts:
+                part.unlink()
+
+    def write(self, records: List[Dict[str, Any]]) -> None:
+        self._buffer.extend(
+            {**record, "id": None if record["id"] is None else str(record["id"])}
+            for record in records
+        )
+
+    def pending_rows(self) -> int:
+        return len(self._buffer)
+
+    def commit(self) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if not self._buffer:
+            return
+        table = pa.Table.from_pylist(self._buffer, schema=self.schema)
+        part = self.path / f"part-{self.checkpoint.parts:05d}.parquet"
+        tmp_part = part.with_suffix(".tmp")
+        pq.write_table(table, tmp_part)
+        os.replace(tmp_part, part)
+        self.checkpoint.parts += 1
+        self._buffer = []
+
+    def close(self) -> None:
+        pass
+
+
+def _to_record(row_id: Any, result: Optional[Dict[str, Any]], error: Optional[str]) -> Dict[str, Any]:
+    if result is None:
+        return {"id": row_id, "sentiment": None, "confidence": None, "negative": None, "positive": None, "error": error}
+    return {
+        "id": row_id,
+        "sentiment": result["sentiment"],
+        "confidence": result["confidence"],
+        "negative": result["scores"]["negative"],
+        "positive": result["scores"]["positive"],
+        "error": None
+    }
+
+
+def _produce(model: SentimentModel, rows: Iterator[Tuple[Any, Any]], window: int, out: "queue.Queue") -> None:
+    """Producer thread: read a window of rows, validate and tokenize it."""
+    try:
+        while True:
+            chunk = []
+            for row in rows:
+                chunk.append(row)
+                if len(chunk) >= window:
+                    break
+            if not chunk:
+                break
+            ids = [row_id for row_id, _ in chunk]
+            errors: Dict[int, str] = {}
+            valid_positions, valid_texts = [], []
+            for position, (_, text) in enumerate(chunk):
+                if not isinstance(text, str) or not text.strip():
+                    errors[position] = "Missing or empty text"
+                    continue
+                valid_positions.append(position)
+                valid_texts.append(text.strip())
+            if not valid_texts:
+                encoded = ([], None)
+            elif Config.LONG_DOCUMENT_MODE:
+                encoded = model.encode_windows(valid_texts)
+            else:
+                encoded = (model.encode(valid_texts), None)
+            out.put((ids, errors, valid_positions, encoded))
+    except Exception as e:
+        out.put(e)
+    finally:
+        out.put(_DONE)
+
+
+def score_file(
+    input_path: Path,
+    output_path: Path,
+    output_format: str = "jsonl",
+    text_field: str = "text",
+    id_field: Optional[str] = None,
+    window: int = 1024,
+    resume: bool = False,
+    rows_per_part: int = 100_000,
+    log_every: float = 10.0,
+    model: Optional[SentimentModel] = None
+) -> Dict[str, Any]:
+    """
+    Score every row of ``input_path`` and write results to ``output_path``.
+
+    Returns:
+        Run summary with row counts, elapsed time and rows/sec
+    """
+    checkpoint = Checkpoint(Path(f"{output_path}.checkpoint.json"))
+    if resume:
+        checkpoint.load()
+        logger.info(f"Resuming after {checkpoint.rows_done} rows")
+    elif checkpoint.path.exists():
+        checkpoint.path.unlink()
+
+    if model is None:
+        model = SentimentModel()
+    model.load()
+
+    if output_format == "parquet":
+        writer = ParquetWriter(output_path, checkpoint, rows_per_part)
+    else:
+        writer = JsonlWriter(output_path, checkpoint)
+
+    batches: "queue.Queue" = queue.Queue(maxsize=2)
+    rows = read_rows(input_path, text_field, id_field, skip=checkpoint.rows_done)
+    producer = threading.Thread(target=_produce, args=(model, rows, window, batches), name="bulk-producer", daemon=True)
+    producer.start()
+
+    start = time.perf_counter()
+    last_log = start
+    scored = 0
+    failed = 0
+    try:
+        while True:
+            item = batches.get()
+            if item is _DONE:
+                break
+            if isinstance(item, Exception):
+                raise item
+            ids, errors, valid_positions, (encoded, windows) = item
+            predictions = model.predict_encoded(encoded, len(valid_positions), windows) if encoded else []
+            results: List[Optional[Dict[str, Any]]] = [None] * len(ids)
+            for position, prediction in zip(valid_positions, predictions):
+                results[position] = prediction
+            writer.write([_to_record(row_id, results[i], errors.get(i)) for i, row_id in enumerate(ids)])
+
+            scored += len(valid_positions)
+            failed += len(errors)
+            checkpoint.rows_done += len(ids)
+            if output_format != "parquet" or writer.pending_rows() >= rows_per_part:
+                writer.commit()
+                checkpoint.save()
+
+            now = time.perf_counter()
+            if now - last_log >= log_every:
+                logger.info(
+                    f"{checkpoint.rows_done} rows done, "
+                    f"{(scored + failed) / (now - start):.1f} rows/sec"
+                )
+                last_log = now
+        writer.commit()
+        checkpoint.save()
+    finally:
+        writer.close()
+
+    elapsed = time.perf_counter() - start
+    summary = {
+        "rows_done": checkpoint.rows_done,
+        "scored": scored,
+        "failed": failed,
+        "elapsed_s": round(elapsed, 2),
+        "rows_per_sec": round((scored + failed) / elapsed, 1) if elapsed else 0.0,
+        "padding": model.padding_stats.to_dict()
+    }
+    logger.info(f"Bulk scoring finished: {summary}")
+    return summary
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Score a large review dump offline.")
+    parser.add_argument("input", type=Path, help="Input .jsonl or .csv file (optionally .gz)")
+    parser.add_argument("output", type=Path, help="Output .jsonl file, or directory for --format parquet")
+    parser.add_argument("--format", choices=("jsonl", "parquet"), default="jsonl", help="Output format")
+    parser.add_argument("--text-field", default="text", help="Field holding the review text")
+    parser.add_argument("--id-field", default=None, help="Field holding the row id (defaults to row number)")
+    parser.add_argument("--model-path", type=Path, default=None, help="Checkpoint directory")
+    parser.add_argument("--batch-size", type=int, default=Config.BATCH_SIZE, help="Texts per forward pass")
+    parser.add_argument("--window", type=int, default=1024, help="Rows read, bucketed and committed together")
+    parser.add_argument("--rows-per-part", type=int, default=100_000, help="Rows per Parquet part file")
+    parser.add_argument("--resume", action="store_true", help="Continue from the last checkpoint")
+    parser.add_argument("--long-documents", action="store_true", help="Score long reviews in sliding windows")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=getattr(logging, Config.LOG_LEVEL), format=Config.LOG_FORMAT)
+    Config.BATCH_SIZE = args.batch_size
+    if args.long_documents:
+        Config.LONG_DOCUMENT_MODE = True
+    summary = score_file(
+        input_path=args.input,
+        output_path=args.output,
+        output_format=args.format,
+        text_field=args.text_field,
+        id_field=args.id_field,
+        window=args.window,
+        resume=args.resume,
+        rows_per_part=args.rows_per_part,
+        model=SentimentModel(model_path=args.model_path)
+    )
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
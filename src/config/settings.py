@@ -24,6 +24,92 @@ class Config:
     BASE_DIR: Path = Path(__file__).resolve().parent.parent.parent
     MODEL_PATH: Path = BASE_DIR / "checkpoints"
     MAX_SEQUENCE_LENGTH: Final[int] = 512
+    MODEL_PRECISION: str = os.getenv("MODEL_PRECISION", "fp32")  # fp32 | int8 (dynamic, CPU only) | bf16 (autocast, CPU only)
+    MODEL_LOAD_IN_BACKGROUND: bool = os.getenv("MODEL_LOAD_IN_BACKGROUND", "False").lower() == "true"
+    MODEL_LOAD_MMAP: bool = os.getenv("MODEL_LOAD_MMAP", "False").lower() == "true"  # map safetensors weights, shared across processes
+    MODEL_RELOAD_ROOT: Path = Path(os.getenv("MODEL_RELOAD_ROOT", str(BASE_DIR)))  # reload paths resolve under here
+    ADMIN_TOKEN: str = os.getenv("ADMIN_TOKEN", "")  # bearer token for /admin/model/reload; empty disables it
+    
+    # Inference backend settings
+    MODEL_BACKEND: str = os.getenv("MODEL_BACKEND", "torch")  # torch | onnx
+    ONNX_CACHE_DIR: Path = Path(os.getenv("ONNX_CACHE_DIR", str(BASE_DIR / "onnx_cache")))
+    ONNX_INTRA_OP_THREADS: int = int(os.getenv("ONNX_INTRA_OP_THREADS", "0"))  # 0 = runtime default
+    
+    # Torch CPU runtime settings (torch backend)
+    TORCH_INTRA_OP_THREADS: int = int(os.getenv("TORCH_INTRA_OP_THREADS", "0"))  # 0 = torch default (one per core)
+    TORCH_INTER_OP_THREADS: int = int(os.getenv("TORCH_INTER_OP_THREADS", "0"))  # 0 = torch default
+    TORCH_THREAD_PINNING: bool = os.getenv("TORCH_THREAD_PINNING", "False").lower() == "true"  # bind OpenMP threads to cores
+    TORCH_INFERENCE_MODE: bool = os.getenv("TORCH_INFERENCE_MODE", "True").lower() == "true"  # else no_grad
+    TORCH_GRAPH_MODE: str = os.getenv("TORCH_GRAPH_MODE", "eager")  # eager | trace | compile
+    
+    # Batch inference settings
+    BATCH_SIZE: int = int(os.getenv("BATCH_SIZE", "32"))
+    MAX_BATCH_ITEMS: int = int(os.getenv("MAX_BATCH_ITEMS", "1000"))
+    LENGTH_BUCKETING: bool = os.getenv("LENGTH_BUCKETING", "True").lower() == "true"
+    
+    # Tokenization settings
+    TOKENIZER_MAX_CHARS: int = int(os.getenv("TOKENIZER_MAX_CHARS", "4096"))  # pre-truncation, 0 = off
+    TOKENIZER_CACHE_SIZE: int = int(os.getenv("TOKENIZER_CACHE_SIZE", "0"))  # cached encodings, 0 = off
+    
+    # Long-document mode (score overlapping windows instead of truncating)
+    LONG_DOCUMENT_MODE: bool = os.getenv("LONG_DOCUMENT_MODE", "False").lower() == "true"
+    LONG_DOCUMENT_STRIDE: int = int(os.getenv("LONG_DOCUMENT_STRIDE", "128"))  # tokens shared by adjacent windows
+    LONG_DOCUMENT_MAX_WINDOWS: int = int(os.getenv("LONG_DOCUMENT_MAX_WINDOWS", "4"))
+    LONG_DOCUMENT_AGGREGATION: str = os.getenv("LONG_DOCUMENT_AGGREGATION", "mean")  # mean | length | last
+    
+    # Dynamic micro-batching settings (coalesces concurrent /analyze calls)
+    BATCHING_ENABLED: bool = os.getenv("BATCHING_ENABLED", "True").lower() == "true"
+    BATCHING_MAX_BATCH_SIZE: int = int(os.getenv("BATCHING_MAX_BATCH_SIZE", "16"))
+    BATCHING_MAX_WAIT_MS: float = float(os.getenv("BATCHING_MAX_WAIT_MS", "5"))
+    BATCHING_QUEUE_DEPTH: int = int(os.getenv("BATCHING_QUEUE_DEPTH", "256"))
+    BATCHING_RESULT_TIMEOUT: float = float(os.getenv("BATCHING_RESULT_TIMEOUT", "30"))  # seconds a request waits for its batch
+    
+    # Multi-process inference settings (0 workers = run inference in-process)
+    INFERENCE_WORKERS: int = int(os.getenv("INFERENCE_WORKERS", "0"))
+    INFERENCE_THREADS_PER_WORKER: int = int(os.getenv(
+        "INFERENCE_THREADS_PER_WORKER",
+        str(max(1, (os.cpu_count() or 1) // max(1, int(os.getenv("INFERENCE_WORKERS", "0")))))
+    ))
+    INFERENCE_TASK_TIMEOUT: float = float(os.getenv("INFERENCE_TASK_TIMEOUT", "60"))
+    
+    # Fast fallback model (hashed tf-idf classifier distilled from DistilBERT)
+    FAST_MODEL_ENABLED: bool = os.getenv("FAST_MODEL_ENABLED", "False").lower() == "true"
+    FAST_MODEL_PATH: Path = Path(os.getenv("FAST_MODEL_PATH", str(BASE_DIR / "fast_model.npz")))
+    FAST_ROUTE_QUEUE_DEPTH: int = int(os.getenv("FAST_ROUTE_QUEUE_DEPTH", "64"))  # DistilBERT requests in flight, 0 = off
+    FAST_ROUTE_LATENCY_MS: float = float(os.getenv("FAST_ROUTE_LATENCY_MS", "1000"))  # recent DistilBERT latency, 0 = off
+    CASCADE_ENABLED: bool = os.getenv("CASCADE_ENABLED", "False").lower() == "true"  # auto requests try the fast model first
+    CASCADE_MIN_CONFIDENCE: float = float(os.getenv("CASCADE_MIN_CONFIDENCE", "90"))  # percent; below it DistilBERT answers
+    
+    # Async (ASGI) serving settings
+    ASYNC_INFERENCE_THREADS: int = int(os.getenv("ASYNC_INFERENCE_THREADS", "2"))  # ASGI forward passes when batching is off
+    ASGI_WSGI_THREADS: int = int(os.getenv("ASGI_WSGI_THREADS", "32"))  # threads for Flask routes served under ASGI
+    ASGI_MAX_BODY_BYTES: int = int(os.getenv("ASGI_MAX_BODY_BYTES", str(16 * 1024 * 1024)))
+    ASGI_WSGI_SEND_TIMEOUT: float = float(os.getenv("ASGI_WSGI_SEND_TIMEOUT", "30"))  # seconds a Flask view waits for the client to take a chunk
+    
+    # Prediction cache settings (keyed on normalized text + checkpoint identity)
+    CACHE_ENABLED: bool = os.getenv("CACHE_ENABLED", "True").lower() == "true"
+    CACHE_MAX_ENTRIES: int = int(os.getenv("CACHE_MAX_ENTRIES", "10000"))
+    CACHE_MAX_BYTES: int = int(os.getenv("CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+    CACHE_TTL_SECONDS: float = float(os.getenv("CACHE_TTL_SECONDS", "3600"))
+    
+    # Persistent second-level cache shared by all worker processes
+    DISK_CACHE_ENABLED: bool = os.getenv("DISK_CACHE_ENABLED", "False").lower() == "true"
+    DISK_CACHE_PATH: Path = Path(os.getenv("DISK_CACHE_PATH", str(BASE_DIR / "prediction_cache.db")))
+    DISK_CACHE_MAX_ENTRIES: int = int(os.getenv("DISK_CACHE_MAX_ENTRIES", "500000"))
+    DISK_CACHE_WARM_ENTRIES: int = int(os.getenv("DISK_CACHE_WARM_ENTRIES", "5000"))
+    
+    # Feedback write-behind buffer (groups feedback into bulk inserts)
+    FEEDBACK_BUFFER_ENABLED: bool = os.getenv("FEEDBACK_BUFFER_ENABLED", "False").lower() == "true"  # bulk inserts; off commits each request
+    FEEDBACK_CONSISTENCY: str = os.getenv("FEEDBACK_CONSISTENCY", "durable")  # durable | eventual
+    FEEDBACK_FLUSH_MAX_RECORDS: int = int(os.getenv("FEEDBACK_FLUSH_MAX_RECORDS", "200"))
+    FEEDBACK_FLUSH_INTERVAL_MS: float = float(os.getenv("FEEDBACK_FLUSH_INTERVAL_MS", "50"))
+    FEEDBACK_BUFFER_MAX_PENDING: int = int(os.getenv("FEEDBACK_BUFFER_MAX_PENDING", "10000"))
+    FEEDBACK_WRITE_TIMEOUT: float = float(os.getenv("FEEDBACK_WRITE_TIMEOUT", "10"))
+    
+    # Feedback statistics (read from the feedback_stats summary table)
+    FEEDBACK_STATS_CACHE_SECONDS: float = float(os.getenv("FEEDBACK_STATS_CACHE_SECONDS", "5"))
+    FEEDBACK_STATS_DAYS: int = int(os.getenv("FEEDBACK_STATS_DAYS", "30"))  # days in the by_day breakdown
+    FEEDBACK_PAGE_MAX: int = int(os.getenv("FEEDBACK_PAGE_MAX", "500"))  # hard cap on GET /feedback limit
     
     # Device settings
     DEVICE: str = "cuda" if os.getenv("USE_CUDA", "False").lower() == "true" else "cpu"
@@ -38,14 +124,30 @@ class Config:
         f"sqlite:///{BASE_DIR / 'feedback.db'}"
     )
     SQLALCHEMY_TRACK_MODIFICATIONS: bool = False
-    
-    # Environment settings
-    TF_ENABLE_ONEDNN_OPTS: str = "0"
+    DATABASE_TUNING: bool = os.getenv("DATABASE_TUNING", "False").lower() == "true"
+    SQLITE_JOURNAL_MODE: str = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+    SQLITE_SYNCHRONOUS: str = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+    SQLITE_BUSY_TIMEOUT_MS: int = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+    SQLITE_MMAP_SIZE: int = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "10"))  # Postgres only
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+    DB_POOL_TIMEOUT: float = float(os.getenv("DB_POOL_TIMEOUT", "10"))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))  # seconds
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "True").lower() == "true"
     
     @classmethod
     def init_environment(cls) -> None:
-        """Initialize environment variables."""
-        os.environ['TF_ENABLE_ONEDNN_OPTS'] = cls.TF_ENABLE_ONEDNN_OPTS
+        """
+        Set OpenMP variables, which torch reads once when it is first imported.
+
+        Pinning is skipped with inference workers, since every worker process
+        would bind its threads to the same cores.
+        """
+        if cls.TORCH_INTRA_OP_THREADS > 0:
+            os.environ.setdefault('OMP_NUM_THREADS', str(cls.TORCH_INTRA_OP_THREADS))
+        if cls.TORCH_THREAD_PINNING and cls.INFERENCE_WORKERS <= 0:
+            os.environ.setdefault('OMP_PROC_BIND', 'close')
+            os.environ.setdefault('OMP_PLACES', 'cores')
 
 
 class DevelopmentConfig(Config):
@@ -56,6 +158,7 @@ class DevelopmentConfig(Config):
 class ProductionConfig(Config):
     """Production configuration."""
     DEBUG = False
+    DATABASE_TUNING = os.getenv("DATABASE_TUNING", "True").lower() == "true"
 
 
 class TestConfig(Config):
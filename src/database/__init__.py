@@ -1,6 +1,9 @@
 """Database module for feedback storage."""
 
-from .models import db, Feedback
+from .models import db, Feedback, FeedbackStats
 from .repository import FeedbackRepository
+from .feedback_buffer import FeedbackBuffer, BufferFullError, BufferStoppedError
+from .engine import configure_engine, engine_options
 
-__all__ = ['db', 'Feedback', 'FeedbackRepository']
+__all__ = ['db', 'Feedback', 'FeedbackStats', 'FeedbackRepository', 'FeedbackBuffer', 'BufferFullError',
+           'BufferStoppedError', 'configure_engine', 'engine_options']
@@ -0,0 +1,71 @@
+"""
+Database engine tuning.
+Applies SQLite pragmas on every connection and sizes the Postgres connection pool.
+"""
+
+from typing import Any, Dict
+import logging
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from ..config.settings import Config
+
+
+logger = logging.getLogger(__name__)
+
+
+def engine_options(database_uri: str) -> Dict[str, Any]:
+    """
+    Build ``SQLALCHEMY_ENGINE_OPTIONS`` for a database URI.
+
+    Postgres gets an explicitly sized pool with pre-ping, so connections
+    dropped by the server or a proxy are replaced instead of failing a
+    request. SQLite keeps SQLAlchemy's defaults.
+    """
+    if not database_uri.startswith(("postgresql", "postgres")):
+        return {}
+    return {
+        "pool_size": Config.DB_POOL_SIZE,
+        "max_overflow": Config.DB_MAX_OVERFLOW,
+        "pool_timeout": Config.DB_POOL_TIMEOUT,
+        "pool_recycle": Config.DB_POOL_RECYCLE,
+        "pool_pre_ping": Config.DB_POOL_PRE_PING
+    }
+
+
+def sqlite_pragmas() -> Dict[str, Any]:
+    """Pragmas applied to every SQLite connection, in order."""
+    return {
+        "journal_mode": Config.SQLITE_JOURNAL_MODE,
+        "synchronous": Config.SQLITE_SYNCHRONOUS,
+        "busy_timeout": Config.SQLITE_BUSY_TIMEOUT_MS,
+        "mmap_size": Config.SQLITE_MMAP_SIZE
+    }
+
+
+def configure_engine(engine: Engine) -> None:
+    """
+    Apply the SQLite pragmas to every new connection of ``engine``.
+
+    WAL lets readers run alongside the single writer instead of waiting on
+    the database lock, ``synchronous=NORMAL`` drops the fsync on every commit
+    (WAL stays consistent, only the last commits can be lost on power loss),
+    ``busy_timeout`` makes a blocked writer wait instead of failing with
+    "database is locked", and ``mmap_size`` serves reads from the page cache.
+    No-op for other databases.
+    """
+    if engine.dialect.name != "sqlite":
+        return
+    pragmas = sqlite_pragmas()
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+    logger.info(f"SQLite pragmas enabled: {pragmas}")
@@ -0,0 +1,199 @@
+"""
+Write-behind buffer for feedback records.
+Groups feedback from many requests into one bulk insert and one commit.
+"""
+
+from concurrent.futures import Future
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+import threading
+import time
+
+from .repository import FeedbackRepository
+
+
+logger = logging.getLogger(__name__)
+
+
+class FeedbackBuffer:
+    """
+    In-memory feedback queue flushed by a background thread.
+
+    Records are flushed with a single bulk insert once ``max_records`` are
+    waiting or the oldest one has waited ``flush_interval_ms``, whichever
+    comes first. A record that arrives when nothing was flushed for a whole
+    interval is flushed at once: the interval only holds records back while
+    feedback keeps coming, when there is something to group them with.
+    Each submitted record gets a ``Future`` that resolves to its id after
+    the commit, so callers choose between waiting for the id (durable) and
+    returning immediately (eventual). ``stop`` flushes whatever is still
+    buffered; records submitted after it are written by the caller.
+    """
+
+    def __init__(self, max_records: int, flush_interval_ms: float, max_pending: int):
+        """
+        Initialize the buffer.
+
+        Args:
+            max_records: Records per bulk insert; reaching it triggers a flush
+            flush_interval_ms: Longest time a record waits before being flushed
+            max_pending: Buffered records before new submissions are rejected
+        """
+        self.max_records = max_records
+        self.flush_interval = flush_interval_ms / 1000.0
+        self.max_pending = max_pending
+        self._pending: List[Tuple[Dict[str, Any], Future]] = []
+        self._deadline: Optional[float] = None
+        self._last_flush = float("-inf")
+        self._condition = threading.Condition()
+        self._app = None
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self.flushes = 0
+        self.flushed_records = 0
+        self.failed_records = 0
+
+    def start(self, app) -> None:
+        """Start the flush thread; ``app`` provides the database context."""
+        if self._running:
+            return
+        self._app = app
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="feedback-flusher", daemon=True)
+        self._thread.start()
+        logger.info(
+            f"FeedbackBuffer started (max_records={self.max_records}, "
+            f"flush_interval_ms={self.flush_interval * 1000:g})"
+        )
+
+    def stop(self) -> None:
+        """Stop the flush thread and write out everything still buffered."""
+        if not self._running:
+            return
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=30.0)
+        remaining = self._take(all_records=True)
+        while remaining:
+            self._flush(remaining)
+            remaining = self._take(all_records=True)
+        logger.info("FeedbackBuffer stopped")
+
+    def is_running(self) -> bool:
+        return self._running
+
+    def submit(self, records: List[Dict[str, Any]]) -> List[Future]:
+        """
+        Buffer feedback records for the next flush.
+
+        After ``stop`` the records are inserted before this returns, so a
+        request racing with shutdown still gets its ids.
+
+        Returns:
+            One future per record, resolving to the new feedback id
+
+        Raises:
+            BufferFullError: If the buffer cannot take the records
+            BufferStoppedError: If the buffer was never started
+        """
+        now = datetime.utcnow()
+        batch = [({**record, "created_at": record.get("created_at") or now}, Future()) for record in records]
+        with self._condition:
+            running = self._running
+            if running:
+                if len(self._pending) + len(batch) > self.max_pending:
+                    raise BufferFullError("Feedback buffer is full")
+                was_empty = not self._pending
+                if was_empty:
+                    start = time.monotonic()
+                    idle = start - self._last_flush >= self.flush_interval
+                    self._deadline = start if idle else start + self.flush_interval
+                self._pending.extend(batch)
+                # Wake the flusher to flush now or start the interval timer, or to flush a full batch
+                if was_empty or len(self._pending) >= self.max_records:
+                    self._condition.notify()
+        if not running:
+            if self._app is None:
+                raise BufferStoppedError("Feedback buffer is not started")
+            self._flush(batch)
+        return [future for _, future in batch]
+
+    def pending(self) -> int:
+        with self._condition:
+            return len(self._pending)
+
+    def _run(self) -> None:
+        """Flush loop: wait for a full batch or the oldest record's deadline."""
+        while True:
+            with self._condition:
+                while self._running and not self._batch_due():
+                    timeout = None
+                    if self._pending:
+                        timeout = max(0.0, self._deadline - time.monotonic())
+                    self._condition.wait(timeout=timeout)
+                if not self._running:
+                    return
+            batch = self._take()
+            if batch:
+                self._flush(batch)
+
+    def _batch_due(self) -> bool:
+        if not self._pending:
+            return False
+        return len(self._pending) >= self.max_records or time.monotonic() >= self._deadline
+
+    def _take(self, all_records: bool = False) -> List[Tuple[Dict[str, Any], Future]]:
+        with self._condition:
+            size = len(self._pending) if all_records else self.max_records
+            batch, self._pending = self._pending[:size], self._pending[size:]
+            self._deadline = time.monotonic() + self.flush_interval if self._pending else None
+            return batch
+
+    def _flush(self, batch: List[Tuple[Dict[str, Any], Future]]) -> None:
+        """Bulk insert a batch, falling back to row by row to isolate bad records."""
+        records = [record for record, _ in batch]
+        with self._app.app_context():
+            try:
+                ids = FeedbackRepository.create_feedback_batch(records)
+            except Exception as e:
+                logger.warning(f"Bulk feedback insert of {len(records)} records failed, retrying one by one: {e}")
+                ids = []
+                for record, future in batch:
+                    try:
+                        ids.extend(FeedbackRepository.create_feedback_batch([record]))
+                    except Exception as row_error:
+                        ids.append(None)
+                        future.set_exception(row_error)
+                        self.failed_records += 1
+        for (_, future), feedback_id in zip(batch, ids):
+            if feedback_id is not None:
+                future.set_result(feedback_id)
+                self.flushed_records += 1
+        self.flushes += 1
+        with self._condition:
+            self._last_flush = time.monotonic()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get buffer counters."""
+        return {
+            "running": self._running,
+            "pending": self.pending(),
+            "max_records": self.max_records,
+            "flush_interval_ms": self.flush_interval * 1000,
+            "flushes": self.flushes,
+            "flushed_records": self.flushed_records,
+            "failed_records": self.failed_records
+        }
+
+
+class BufferFullError(Exception):
+    """Exception raised when the feedback buffer cannot accept more records."""
+    pass
+
+
+class BufferStoppedError(Exception):
+    """Exception raised when records are submitted to a buffer that was never started."""
+    pass
@@ -10,6 +10,12 @@ class Feedback(db.Model):
     """Model for storing user feedback on predictions."""
     
     __tablename__ = 'feedback'
+    __table_args__ = (
+        # Newest-first listing and keyset pagination on (created_at, id)
+        db.Index('ix_feedback_created_at_id', 'created_at', 'id'),
+        # Filtering by correctness in the same order
+        db.Index('ix_feedback_is_correct_created_at_id', 'is_correct', 'created_at', 'id'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     text = db.Column(db.Text, nullable=False)
@@ -18,6 +24,7 @@ class Feedback(db.Model):
     is_correct = db.Column(db.Boolean, nullable=False)
     correct_label = db.Column(db.String(20), nullable=True)
     user_comment = db.Column(db.Text, nullable=True)
+    model_version = db.Column(db.String(64), nullable=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
     
     def to_dict(self):
@@ -30,5 +37,24 @@ class Feedback(db.Model):
             'is_correct': self.is_correct,
             'correct_label': self.correct_label,
             'user_comment': self.user_comment,
+            'model_version': self.model_version,
             'created_at': self.created_at.isoformat()
         }
+
+
+class FeedbackStats(db.Model):
+    """
+    Pre-aggregated feedback counts, maintained alongside every insert and delete.
+    
+    One row per (day, predicted sentiment, confidence bucket, correctness), so
+    statistics are read from a table whose size grows with days rather than
+    with feedback volume.
+    """
+    
+    __tablename__ = 'feedback_stats'
+    
+    day = db.Column(db.Date, primary_key=True)
+    predicted_sentiment = db.Column(db.String(20), primary_key=True)
+    confidence_bucket = db.Column(db.Integer, primary_key=True)
+    is_correct = db.Column(db.Boolean, primary_key=True)
+    count = db.Column(db.Integer, nullable=False, default=0)
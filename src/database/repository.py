@@ -1,12 +1,129 @@
 """Repository for feedback operations."""
 
-from typing import List, Optional, Dict, Any
+from collections import Counter
+from datetime import date, datetime, timedelta
+from typing import List, Optional, Dict, Any, Iterator, Tuple
+import base64
 import logging
+import threading
+import time
 
-from .models import db, Feedback
+from sqlalchemy import and_, insert, or_
+
+from ..config.settings import Config
+from .models import db, Feedback, FeedbackStats
 
 logger = logging.getLogger(__name__)
 
+StatsKey = Tuple[date, str, int, bool]
+
+
+def confidence_bucket(confidence: float) -> int:
+    """Lower bound of the 10-point confidence bucket (0, 10, ..., 90)."""
+    return min(max(int(float(confidence) // 10) * 10, 0), 90)
+
+
+def _stats_key(created_at: datetime, predicted_sentiment: str, predicted_confidence: float, is_correct: bool) -> StatsKey:
+    return (created_at.date(), predicted_sentiment, confidence_bucket(predicted_confidence), bool(is_correct))
+
+
+def _apply_stats_deltas(deltas: Counter) -> None:
+    """
+    Add count deltas to the summary table in the current transaction.
+    
+    Uses an atomic upsert on SQLite and PostgreSQL so concurrent writers
+    never lose increments; other databases fall back to read-modify-write.
+    """
+    rows = [
+        {
+            'day': day,
+            'predicted_sentiment': sentiment,
+            'confidence_bucket': bucket,
+            'is_correct': is_correct,
+            'count': delta
+        }
+        for (day, sentiment, bucket, is_correct), delta in deltas.items() if delta
+    ]
+    if not rows:
+        return
+    dialect = db.session.get_bind().dialect.name
+    if dialect in ('sqlite', 'postgresql'):
+        if dialect == 'sqlite':
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        statement = dialect_insert(FeedbackStats).values(rows)
+        statement = statement.on_conflict_do_update(
+            index_elements=['day', 'predicted_sentiment', 'confidence_bucket', 'is_correct'],
+            set_={'count': FeedbackStats.count + statement.excluded.count}
+        )
+        db.session.execute(statement)
+        return
+    for row in rows:
+        key = (row['day'], row['predicted_sentiment'], row['confidence_bucket'], row['is_correct'])
+        stats = db.session.get(FeedbackStats, key, with_for_update=True)
+        if stats is None:
+            db.session.add(FeedbackStats(**row))
+        else:
+            stats.count += row['count']
+
+
+class _StatsCache:
+    """Process-local cache of the computed statistics, dropped on every local write."""
+    
+    def __init__(self):
+        self._value: Optional[Dict[str, Any]] = None
+        self._expires = 0.0
+        self._lock = threading.Lock()
+    
+    def get(self) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            if self._value is not None and time.monotonic() < self._expires:
+                return self._value
+            return None
+    
+    def put(self, value: Dict[str, Any], ttl: float) -> None:
+        with self._lock:
+            self._value = value
+            self._expires = time.monotonic() + ttl
+    
+    def invalidate(self) -> None:
+        with self._lock:
+            self._value = None
+
+
+_stats_cache = _StatsCache()
+
+
+def encode_cursor(feedback: Feedback) -> str:
+    """Opaque keyset cursor pointing just past ``feedback`` in newest-first order."""
+    raw = f"{feedback.created_at.isoformat()}|{feedback.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Decode a cursor from ``encode_cursor``.
+    
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode()
+        created_at, feedback_id = raw.rsplit('|', 1)
+        return datetime.fromisoformat(created_at), int(feedback_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def _summarize(total: int, correct: int) -> Dict[str, Any]:
+    return {
+        'total': total,
+        'correct': correct,
+        'incorrect': total - correct,
+        'accuracy': round(correct / total * 100, 2) if total else 0
+    }
+
 
 class FeedbackRepository:
     """Repository for managing feedback data."""
@@ -18,7 +135,8 @@ class FeedbackRepository:
         predicted_confidence: float,
         is_correct: bool,
         correct_label: Optional[str] = None,
-        user_comment: Optional[str] = None
+        user_comment: Optional[str] = None,
+        model_version: Optional[str] = None
     ) -> Feedback:
         """Create a new feedback entry."""
         try:
@@ -28,10 +146,16 @@ class FeedbackRepository:
                 predicted_confidence=predicted_confidence,
                 is_correct=is_correct,
                 correct_label=correct_label,
-                user_comment=user_comment
+                user_comment=user_comment,
+                model_version=model_version,
+                created_at=datetime.utcnow()
             )
             db.session.add(feedback)
+            _apply_stats_deltas(Counter([_stats_key(
+                feedback.created_at, predicted_sentiment, predicted_confidence, is_correct
+            )]))
             db.session.commit()
+            _stats_cache.invalidate()
             logger.info(f"Feedback created: ID={feedback.id}, is_correct={is_correct}")
             return feedback
         except Exception as e:
@@ -40,9 +164,121 @@ class FeedbackRepository:
             raise
     
     @staticmethod
-    def get_all_feedback(limit: int = 100) -> List[Feedback]:
-        """Get all feedback entries."""
-        return Feedback.query.order_by(Feedback.created_at.desc()).limit(limit).all()
+    def create_feedback_batch(records: List[Dict[str, Any]]) -> List[int]:
+        """
+        Create many feedback entries with one bulk insert and one commit.
+        
+        Args:
+            records: Feedback column values, one dict per entry
+            
+        Returns:
+            The new feedback ids, in input order
+        """
+        try:
+            now = datetime.utcnow()
+            records = [{**record, 'created_at': record.get('created_at') or now} for record in records]
+            statement = insert(Feedback).returning(Feedback.id, sort_by_parameter_order=True)
+            ids = list(db.session.scalars(statement, records))
+            _apply_stats_deltas(Counter(
+                _stats_key(r['created_at'], r['predicted_sentiment'], r['predicted_confidence'], r['is_correct'])
+                for r in records
+            ))
+            db.session.commit()
+            _stats_cache.invalidate()
+            logger.info(f"Feedback created in bulk: {len(ids)} entries")
+            return ids
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Failed to create feedback batch: {e}")
+            raise
+    
+    @staticmethod
+    def _filtered_query(
+        is_correct: Optional[bool] = None,
+        sentiment: Optional[str] = None,
+        correct_label: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        cursor: Optional[str] = None
+    ):
+        """Build a newest-first feedback query with the given filters applied."""
+        query = Feedback.query
+        if is_correct is not None:
+            query = query.filter(Feedback.is_correct == is_correct)
+        if sentiment is not None:
+            query = query.filter(Feedback.predicted_sentiment == sentiment)
+        if correct_label is not None:
+            query = query.filter(Feedback.correct_label == correct_label)
+        if since is not None:
+            query = query.filter(Feedback.created_at >= since)
+        if until is not None:
+            query = query.filter(Feedback.created_at < until)
+        if cursor is not None:
+            created_at, feedback_id = decode_cursor(cursor)
+            query = query.filter(or_(
+                Feedback.created_at < created_at,
+                and_(Feedback.created_at == created_at, Feedback.id < feedback_id)
+            ))
+        return query.order_by(Feedback.created_at.desc(), Feedback.id.desc())
+    
+    @staticmethod
+    def get_feedback_page(
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        **filters: Any
+    ) -> Tuple[List[Feedback], Optional[str]]:
+        """
+        Get one page of feedback, newest first, using keyset pagination.
+        
+        Args:
+            limit: Page size, capped at ``FEEDBACK_PAGE_MAX``
+            cursor: ``next_cursor`` from the previous page
+            **filters: ``is_correct``, ``sentiment``, ``correct_label``,
+                ``since`` and ``until``
+            
+        Returns:
+            The page and the cursor for the next one (None on the last page)
+            
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        limit = max(1, min(limit, Config.FEEDBACK_PAGE_MAX))
+        rows = FeedbackRepository._filtered_query(cursor=cursor, **filters).limit(limit + 1).all()
+        next_cursor = encode_cursor(rows[limit - 1]) if len(rows) > limit else None
+        return rows[:limit], next_cursor
+    
+    @staticmethod
+    def iter_feedback(chunk_size: int = 1000, **filters: Any) -> Iterator[Feedback]:
+        """
+        Iterate over all matching feedback, newest first, one keyset page at a time.
+        
+        Each chunk is a separate short query, so a long export never holds a
+        read transaction open or keeps more than one chunk in memory.
+        """
+        cursor = None
+        while True:
+            rows, cursor = FeedbackRepository.get_feedback_page(limit=chunk_size, cursor=cursor, **filters)
+            yield from rows
+            if cursor is None:
+                return
+    
+    @staticmethod
+    def ensure_columns() -> None:
+        """Add nullable columns missing from a ``feedback`` table that predates them."""
+        table = Feedback.__table__
+        existing = {column['name'] for column in db.inspect(db.engine).get_columns(table.name)}
+        with db.engine.begin() as connection:
+            for column in table.columns:
+                if column.name not in existing and column.nullable:
+                    column_type = column.type.compile(dialect=db.engine.dialect)
+                    connection.execute(db.text(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}"))
+                    logger.info(f"Added column {table.name}.{column.name}")
+    
+    @staticmethod
+    def ensure_indexes() -> None:
+        """Create indexes missing from tables that predate them."""
+        for index in Feedback.__table__.indexes:
+            index.create(bind=db.engine, checkfirst=True)
     
     @staticmethod
     def get_feedback_by_id(feedback_id: int) -> Optional[Feedback]:
@@ -51,19 +287,102 @@ class FeedbackRepository:
     
     @staticmethod
     def get_feedback_stats() -> Dict[str, Any]:
-        """Get feedback statistics."""
-        total = Feedback.query.count()
-        correct = Feedback.query.filter_by(is_correct=True).count()
-        incorrect = Feedback.query.filter_by(is_correct=False).count()
+        """
+        Get feedback statistics.
+        
+        Read from the ``feedback_stats`` summary table and cached in-process
+        for ``FEEDBACK_STATS_CACHE_SECONDS``; local writes drop the cache, so
+        the TTL only bounds staleness from other processes.
+        """
+        cached = _stats_cache.get()
+        if cached is not None:
+            return cached
+        
+        rows = db.session.query(
+            FeedbackStats.day,
+            FeedbackStats.predicted_sentiment,
+            FeedbackStats.confidence_bucket,
+            FeedbackStats.is_correct,
+            FeedbackStats.count
+        ).filter(FeedbackStats.count > 0).all()
+        
+        first_day = datetime.utcnow().date() - timedelta(days=Config.FEEDBACK_STATS_DAYS - 1)
+        totals: Dict[str, Counter] = {'sentiment': Counter(), 'confidence': Counter(), 'day': Counter()}
+        corrects: Dict[str, Counter] = {'sentiment': Counter(), 'confidence': Counter(), 'day': Counter()}
+        total = correct = 0
+        for day, sentiment, bucket, is_correct, count in rows:
+            keys = {'sentiment': sentiment, 'confidence': f"{bucket}-{bucket + 10}"}
+            if day >= first_day:
+                keys['day'] = day.isoformat()
+            for dimension, key in keys.items():
+                totals[dimension][key] += count
+                if is_correct:
+                    corrects[dimension][key] += count
+            total += count
+            if is_correct:
+                correct += count
         
         accuracy = (correct / total * 100) if total > 0 else 0
         
-        return {
+        stats = {
             'total_feedback': total,
             'correct_predictions': correct,
-            'incorrect_predictions': incorrect,
-            'accuracy': round(accuracy, 2)
+            'incorrect_predictions': total - correct,
+            'accuracy': round(accuracy, 2),
+            'by_sentiment': {
+                key: _summarize(totals['sentiment'][key], corrects['sentiment'][key])
+                for key in sorted(totals['sentiment'])
+            },
+            'by_confidence': {
+                key: _summarize(totals['confidence'][key], corrects['confidence'][key])
+                for key in sorted(totals['confidence'], key=lambda k: int(k.split('-')[0]))
+            },
+            'by_day': {
+                key: _summarize(totals['day'][key], corrects['day'][key])
+                for key in sorted(totals['day'])
+            }
         }
+        _stats_cache.put(stats, Config.FEEDBACK_STATS_CACHE_SECONDS)
+        return stats
+    
+    @staticmethod
+    def rebuild_feedback_stats() -> int:
+        """
+        Recompute the summary table from the feedback table.
+        
+        Used to backfill existing databases; streams the rows so memory stays
+        flat on large tables.
+        
+        Returns:
+            Number of feedback rows counted
+        """
+        try:
+            deltas: Counter = Counter()
+            query = db.session.query(
+                Feedback.created_at,
+                Feedback.predicted_sentiment,
+                Feedback.predicted_confidence,
+                Feedback.is_correct
+            ).yield_per(10000)
+            for row in query:
+                deltas[_stats_key(*row)] += 1
+            db.session.query(FeedbackStats).delete()
+            _apply_stats_deltas(deltas)
+            db.session.commit()
+            _stats_cache.invalidate()
+            counted = sum(deltas.values())
+            logger.info(f"Feedback stats rebuilt from {counted} rows")
+            return counted
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Failed to rebuild feedback stats: {e}")
+            raise
+    
+    @staticmethod
+    def ensure_feedback_stats() -> None:
+        """Backfill the summary table if feedback exists but was never aggregated."""
+        if db.session.query(FeedbackStats.day).first() is None and db.session.query(Feedback.id).first() is not None:
+            FeedbackRepository.rebuild_feedback_stats()
     
     @staticmethod
     def delete_feedback(feedback_id: int) -> bool:
@@ -71,8 +390,15 @@ class FeedbackRepository:
         try:
             feedback = Feedback.query.get(feedback_id)
             if feedback:
+                _apply_stats_deltas(Counter({_stats_key(
+                    feedback.created_at,
+                    feedback.predicted_sentiment,
+                    feedback.predicted_confidence,
+                    feedback.is_correct
+                ): -1}))
                 db.session.delete(feedback)
                 db.session.commit()
+                _stats_cache.invalidate()
                 logger.info(f"Feedback deleted: ID={feedback_id}")
                 return True
             return False
@@ -8,6 +8,10 @@ from .sentiment_model import (
     ModelNotLoadedError,
     PredictionError
 )
+from .length_bucketing import PaddingStats, compare_padding
+from .factory import create_model
+from .fast_model import FastSentimentModel
+from .cascade import evaluate_cascade, needs_escalation
 
 __all__ = [
     'SentimentModel',
@@ -15,5 +19,11 @@ __all__ = [
     'ModelError',
     'ModelLoadError',
     'ModelNotLoadedError',
-    'PredictionError'
+    'PredictionError',
+    'PaddingStats',
+    'compare_padding',
+    'create_model',
+    'FastSentimentModel',
+    'evaluate_cascade',
+    'needs_escalation'
 ]
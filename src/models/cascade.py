@@ -0,0 +1,134 @@
+"""
+Confidence-gated cascade: the fast model answers confident reviews, DistilBERT the rest.
+
+Run ``python -m src.models.cascade`` to pick ``CASCADE_MIN_CONFIDENCE``
+before enabling ``CASCADE_ENABLED``:
+
+    python -m src.models.cascade --texts reviews.txt --thresholds 70 80 90 95
+    python -m src.models.cascade --feedback --target-agreement 0.99
+
+Both models score every review. For each threshold the report gives the
+share of reviews escalated to DistilBERT, the label agreement of the
+cascade's answers with DistilBERT alone, and the expected cost per review
+(fast pass on everything plus DistilBERT on the escalated share). The
+recommended threshold escalates the least traffic while meeting
+``--target-agreement``.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+import argparse
+import json
+import logging
+import time
+
+from ..config.settings import Config
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_THRESHOLDS = (60.0, 70.0, 80.0, 90.0, 95.0, 99.0)
+
+
+def needs_escalation(result: Dict[str, Any], min_confidence: float) -> bool:
+    """Whether a fast-model result is too uncertain to return (confidence in percent, as in responses)."""
+    return result["confidence"] < min_confidence
+
+
+def evaluate_cascade(
+    texts: List[str],
+    fast_model,
+    full_model,
+    thresholds: Sequence[float] = DEFAULT_THRESHOLDS,
+    target_agreement: float = 0.99
+) -> Dict[str, Any]:
+    """
+    Compare the cascade against DistilBERT alone at each confidence threshold.
+
+    Args:
+        texts: Reviews to score
+        fast_model: Loaded ``FastSentimentModel``
+        full_model: Loaded ``SentimentModel``
+        thresholds: Minimum fast-model confidences (percent) to evaluate
+        target_agreement: Agreement the recommended threshold must reach
+
+    Returns:
+        Report with one row per threshold and the recommended threshold
+    """
+    start = time.perf_counter()
+    full = [
+        result
+        for i in range(0, len(texts), Config.BATCH_SIZE)
+        for result in full_model.predict_batch(texts[i:i + Config.BATCH_SIZE])
+    ]
+    full_ms = (time.perf_counter() - start) * 1000 / len(texts)
+    start = time.perf_counter()
+    fast = fast_model.predict_batch(texts)
+    fast_ms = (time.perf_counter() - start) * 1000 / len(texts)
+
+    rows = []
+    for threshold in sorted(thresholds):
+        escalated = [needs_escalation(result, threshold) for result in fast]
+        answers = [f if not up else d for f, d, up in zip(fast, full, escalated)]
+        accepted = [(f, d) for f, d, up in zip(fast, full, escalated) if not up]
+        escalation_rate = sum(escalated) / len(texts)
+        cost_ms = fast_ms + escalation_rate * full_ms
+        rows.append({
+            "min_confidence": threshold,
+            "escalation_rate": round(escalation_rate, 4),
+            "agreement": round(sum(a["sentiment"] == d["sentiment"] for a, d in zip(answers, full)) / len(texts), 4),
+            "accepted_agreement": (
+                round(sum(f["sentiment"] == d["sentiment"] for f, d in accepted) / len(accepted), 4)
+                if accepted else None
+            ),
+            "ms_per_review": round(cost_ms, 3),
+            "speedup": round(full_ms / cost_ms, 2)
+        })
+
+    meeting = [row for row in rows if row["agreement"] >= target_agreement]
+    recommended = min(meeting, key=lambda row: row["escalation_rate"]) if meeting else None
+    return {
+        "reviews": len(texts),
+        "fast_model_version": fast_model.version,
+        "full_model_version": full_model.version,
+        "fast_ms_per_review": round(fast_ms, 4),
+        "full_ms_per_review": round(full_ms, 3),
+        "fast_only_agreement": round(sum(f["sentiment"] == d["sentiment"] for f, d in zip(fast, full)) / len(texts), 4),
+        "thresholds": rows,
+        "target_agreement": target_agreement,
+        "recommended_min_confidence": recommended["min_confidence"] if recommended else None
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    from .factory import create_model
+    from .fast_model import FastSentimentModel, feedback_texts
+
+    parser = argparse.ArgumentParser(description="Evaluate the confidence-gated cascade against DistilBERT.")
+    parser.add_argument("--texts", type=Path, nargs="*", default=[], help="Files with one review per line")
+    parser.add_argument("--feedback", action="store_true", help="Also evaluate on review texts from the feedback table")
+    parser.add_argument("--database-url", default=None, help="Database URL for --feedback (defaults to DATABASE_URL)")
+    parser.add_argument("--fast-model", type=Path, default=None, help="Fast model file (defaults to FAST_MODEL_PATH)")
+    parser.add_argument("--thresholds", type=float, nargs="+", default=list(DEFAULT_THRESHOLDS), help="Minimum fast-model confidences to evaluate (percent)")
+    parser.add_argument("--target-agreement", type=float, default=0.99, help="Agreement with DistilBERT the recommendation must reach")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=getattr(logging, Config.LOG_LEVEL), format=Config.LOG_FORMAT)
+    texts: List[str] = []
+    for path in args.texts:
+        texts.extend(path.read_text(encoding="utf-8").splitlines())
+    if args.feedback:
+        texts.extend(feedback_texts(args.database_url))
+    texts = list(dict.fromkeys(text.strip() for text in texts if text and text.strip()))
+    if not texts:
+        parser.error("No reviews: pass --texts and/or --feedback")
+
+    fast_model = FastSentimentModel(args.fast_model)
+    fast_model.load()
+    full_model = create_model()
+    full_model.load()
+    report = evaluate_cascade(texts, fast_model, full_model, args.thresholds, args.target_agreement)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
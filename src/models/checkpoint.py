@@ -0,0 +1,22 @@
+"""Checkpoint identity helpers."""
+
+from pathlib import Path
+import hashlib
+
+
+def checkpoint_fingerprint(model_path: Path) -> str:
+    """
+    Compute a cheap identity for the checkpoint directory at ``model_path``.
+
+    Hashes the name, size and modification time of every file in the
+    directory rather than its contents, so it costs a few ``stat`` calls
+    instead of reading ~250MB of weights. Any re-export or copy of a new
+    checkpoint into the directory changes the fingerprint.
+    """
+    model_path = Path(model_path)
+    digest = hashlib.sha256()
+    files = sorted(p for p in model_path.iterdir() if p.is_file()) if model_path.is_dir() else [model_path]
+    for path in files:
+        stat = path.stat()
+        digest.update(f"{path.name}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()[:16]
@@ -0,0 +1,29 @@
+"""Model backend selection."""
+
+from pathlib import Path
+from typing import Optional
+
+from ..config.settings import Config
+from .sentiment_model import SentimentModel
+
+SUPPORTED_BACKENDS = ("torch", "onnx")
+
+
+def create_model(backend: Optional[str] = None, model_path: Optional[Path] = None) -> SentimentModel:
+    """
+    Create the sentiment model for the configured inference backend.
+
+    Args:
+        backend: 'torch' or 'onnx' (defaults to ``Config.MODEL_BACKEND``)
+        model_path: Checkpoint directory (defaults to ``Config.MODEL_PATH``)
+
+    Returns:
+        Unloaded model instance
+    """
+    backend = (backend or Config.MODEL_BACKEND).lower()
+    if backend == "torch":
+        return SentimentModel(model_path=model_path)
+    if backend == "onnx":
+        from .onnx_model import OnnxSentimentModel
+        return OnnxSentimentModel(model_path=model_path)
+    raise ValueError(f"Unknown model backend: {backend} (expected one of {', '.join(SUPPORTED_BACKENDS)})")
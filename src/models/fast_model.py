@@ -0,0 +1,348 @@
+"""
+Fast fallback model: a hashed tf-idf linear classifier distilled from DistilBERT.
+
+The service answers with it when the DistilBERT path is overloaded, or when
+a client asks for ``mode=fast``. Inference is NumPy only and costs tens of
+microseconds per review, against tens to hundreds of milliseconds for the
+transformer on CPU.
+
+Distill it from the served checkpoint with:
+    python -m src.models.fast_model --texts reviews.txt --output fast_model.npz
+    python -m src.models.fast_model --feedback --output fast_model.npz
+
+The teacher scores every training review, and the classifier is fit to the
+teacher's positive probability (soft labels), so it learns the teacher's
+decision boundary rather than the raw labels. The report printed at the
+end gives label agreement with the teacher on a held-out split and the
+per-review latency of both models.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import argparse
+import hashlib
+import json
+import logging
+import re
+import time
+import zlib
+
+import numpy as np
+
+from ..config.settings import Config
+from .sentiment_model import BaseModel, ModelLoadError, ModelNotLoadedError
+
+logger = logging.getLogger(__name__)
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9']+")
+DEFAULT_FEATURES = 2 ** 20
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased word unigrams and bigrams; bigrams keep short negations ("not good")."""
+    words = TOKEN_PATTERN.findall(text.lower())
+    return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+
+def hash_features(text: str, n_features: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Signed feature hashing of ``text``.
+
+    crc32 is used because it is stable across processes (unlike ``hash``)
+    and implemented in C. The low bits pick the column, the top bit the sign,
+    so colliding features tend to cancel instead of adding up.
+
+    Returns:
+        Sorted unique column indices and their signed sublinear term frequencies
+    """
+    hashes = np.fromiter(
+        (zlib.crc32(token.encode("utf-8")) for token in tokenize(text)),
+        dtype=np.uint32
+    )
+    if not len(hashes):
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+    signs = np.where(hashes >> 31, -1.0, 1.0)
+    indices, inverse = np.unique((hashes % n_features).astype(np.int64), return_inverse=True)
+    counts = np.zeros(len(indices))
+    np.add.at(counts, inverse, signs)
+    values = np.sign(counts) * (1.0 + np.log(np.maximum(np.abs(counts), 1.0)))
+    return indices, values.astype(np.float32)
+
+
+def vectorize(texts: Iterable[str], n_features: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Hash ``texts`` into CSR arrays (indptr, indices, values), without tf-idf weighting."""
+    indptr = [0]
+    all_indices: List[np.ndarray] = []
+    all_values: List[np.ndarray] = []
+    for text in texts:
+        indices, values = hash_features(text, n_features)
+        all_indices.append(indices)
+        all_values.append(values)
+        indptr.append(indptr[-1] + len(indices))
+    return (
+        np.asarray(indptr, dtype=np.int64),
+        np.concatenate(all_indices) if all_indices else np.empty(0, dtype=np.int64),
+        np.concatenate(all_values) if all_values else np.empty(0, dtype=np.float32)
+    )
+
+
+def _weight_rows(indptr: np.ndarray, indices: np.ndarray, values: np.ndarray, idf: np.ndarray) -> np.ndarray:
+    """Apply idf weights and L2-normalize each row."""
+    weighted = values * idf[indices]
+    rows = np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+    norms = np.sqrt(np.bincount(rows, weights=weighted ** 2, minlength=len(indptr) - 1))
+    return (weighted / np.maximum(norms[rows], 1e-12)).astype(np.float32)
+
+
+class FastSentimentModel(BaseModel):
+    """Hashed tf-idf logistic regression with the same result format as ``SentimentModel``."""
+
+    NAME = "fast"
+    LABELS = {0: "Negative", 1: "Positive"}
+
+    def __init__(self, model_path: Optional[Path] = None):
+        self.model_path = Path(model_path or Config.FAST_MODEL_PATH)
+        self.n_features = DEFAULT_FEATURES
+        self.idf: Optional[np.ndarray] = None
+        self.weights: Optional[np.ndarray] = None
+        self.bias = 0.0
+        self.metadata: Dict[str, Any] = {}
+        self.version: Optional[str] = None
+        self._is_loaded = False
+
+    def load(self) -> None:
+        if self._is_loaded:
+            return
+        try:
+            with np.load(self.model_path) as archive:
+                self.idf = archive["idf"]
+                self.weights = archive["weights"]
+                self.bias = float(archive["bias"])
+                self.metadata = json.loads(str(archive["metadata"]))
+        except (OSError, KeyError, ValueError) as e:
+            raise ModelLoadError(f"Failed to load fast model from {self.model_path}: {e}") from e
+        self.n_features = len(self.weights)
+        digest = hashlib.blake2b(self.weights.tobytes(), digest_size=6).hexdigest()
+        self.version = f"{self.NAME}-{digest}"
+        self._is_loaded = True
+        logger.info(f"Fast model loaded from {self.model_path} (version {self.version})")
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as handle:
+            np.savez_compressed(
+                handle,
+                idf=self.idf,
+                weights=self.weights,
+                bias=np.float32(self.bias),
+                metadata=json.dumps(self.metadata)
+            )
+
+    def predict(self, text: str) -> Dict[str, Any]:
+        return self.predict_batch([text])[0]
+
+    def predict_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
+        if not self._is_loaded:
+            raise ModelNotLoadedError("Fast model not loaded")
+        if any(not text or not text.strip() for text in texts):
+            raise ValueError("Input text cannot be empty")
+        return [self._format_result(p) for p in self.positive_probabilities(texts)]
+
+    def positive_probabilities(self, texts: List[str]) -> np.ndarray:
+        indptr, indices, values = vectorize(texts, self.n_features)
+        weighted = _weight_rows(indptr, indices, values, self.idf)
+        rows = np.repeat(np.arange(len(texts)), np.diff(indptr))
+        logits = np.bincount(rows, weights=weighted * self.weights[indices], minlength=len(texts)) + self.bias
+        return 1.0 / (1.0 + np.exp(-logits))
+
+    def _format_result(self, positive: float) -> Dict[str, Any]:
+        probabilities = [1.0 - positive, positive]
+        predicted_class = int(positive >= 0.5)
+        return {
+            "sentiment": self.LABELS[predicted_class],
+            "confidence": round(probabilities[predicted_class] * 100, 2),
+            "scores": {
+                "negative": round(probabilities[0] * 100, 2),
+                "positive": round(probabilities[1] * 100, 2)
+            },
+            "model_version": self.version,
+            "model": self.NAME
+        }
+
+    def is_loaded(self) -> bool:
+        return self._is_loaded
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get model identity and the teacher it was distilled from."""
+        return {
+            "version": self.version,
+            "path": str(self.model_path),
+            "teacher_version": self.metadata.get("teacher_version")
+        }
+
+
+def fit(
+    texts: List[str],
+    targets: np.ndarray,
+    n_features: int = DEFAULT_FEATURES,
+    epochs: int = 200,
+    learning_rate: float = 0.05,
+    l2: float = 1e-6
+) -> FastSentimentModel:
+    """
+    Fit the classifier to soft targets (teacher positive probabilities) with full-batch Adam.
+
+    Returns:
+        Loaded model, ready to predict or ``save``
+    """
+    indptr, indices, values = vectorize(texts, n_features)
+    document_frequency = np.bincount(indices, minlength=n_features)
+    idf = (np.log((1.0 + len(texts)) / (1.0 + document_frequency)) + 1.0).astype(np.float32)
+    weighted = _weight_rows(indptr, indices, values, idf)
+    rows = np.repeat(np.arange(len(texts)), np.diff(indptr))
+
+    weights = np.zeros(n_features, dtype=np.float64)
+    bias = 0.0
+    moments = [np.zeros(n_features), np.zeros(n_features), 0.0, 0.0]
+    beta1, beta2, eps = 0.9, 0.999, 1e-8
+    for step in range(1, epochs + 1):
+        logits = np.bincount(rows, weights=weighted * weights[indices], minlength=len(texts)) + bias
+        residual = (1.0 / (1.0 + np.exp(-logits)) - targets) / len(texts)
+        grad_w = np.bincount(indices, weights=weighted * residual[rows], minlength=n_features) + l2 * weights
+        grad_b = residual.sum()
+        moments[0] = beta1 * moments[0] + (1 - beta1) * grad_w
+        moments[1] = beta2 * moments[1] + (1 - beta2) * grad_w ** 2
+        moments[2] = beta1 * moments[2] + (1 - beta1) * grad_b
+        moments[3] = beta2 * moments[3] + (1 - beta2) * grad_b ** 2
+        correction1, correction2 = 1 - beta1 ** step, 1 - beta2 ** step
+        weights -= learning_rate * (moments[0] / correction1) / (np.sqrt(moments[1] / correction2) + eps)
+        bias -= learning_rate * (moments[2] / correction1) / (np.sqrt(moments[3] / correction2) + eps)
+
+    model = FastSentimentModel()
+    model.n_features = n_features
+    model.idf = idf
+    model.weights = weights.astype(np.float32)
+    model.bias = bias
+    model.version = f"{FastSentimentModel.NAME}-unsaved"
+    model._is_loaded = True
+    return model
+
+
+def feedback_texts(database_url: Optional[str]) -> List[str]:
+    """Review texts from the feedback table."""
+    from sqlalchemy import create_engine, select
+
+    from ..database.models import Feedback
+
+    engine = create_engine(database_url or Config.SQLALCHEMY_DATABASE_URI)
+    try:
+        with engine.connect() as connection:
+            return list(connection.execute(select(Feedback.__table__.c.text)).scalars())
+    finally:
+        engine.dispose()
+
+
+def _teacher_probabilities(teacher, texts: List[str], batch_size: int) -> np.ndarray:
+    probabilities = []
+    for i in range(0, len(texts), batch_size):
+        for result in teacher.predict_batch(texts[i:i + batch_size]):
+            probabilities.append(result["scores"]["positive"] / 100)
+        if (i // batch_size) % 50 == 0:
+            logger.info(f"Teacher scored {min(i + batch_size, len(texts))}/{len(texts)} reviews")
+    return np.asarray(probabilities)
+
+
+def distill(
+    texts: List[str],
+    output: Path,
+    holdout: float = 0.1,
+    n_features: int = DEFAULT_FEATURES,
+    epochs: int = 200,
+    seed: int = 0
+) -> Dict[str, Any]:
+    """
+    Score ``texts`` with the configured DistilBERT, fit the fast model to its scores and save it.
+
+    Returns:
+        Report with held-out agreement and per-review latency of both models
+    """
+    from .factory import create_model
+
+    texts = list(dict.fromkeys(text.strip() for text in texts if text and text.strip()))
+    texts = [text for text in texts if TOKEN_PATTERN.search(text.lower())]
+    if len(texts) < 10:
+        raise ValueError(f"Need at least 10 distinct reviews to distill, got {len(texts)}")
+
+    teacher = create_model()
+    teacher.load()
+    start = time.perf_counter()
+    targets = _teacher_probabilities(teacher, texts, Config.BATCH_SIZE)
+    teacher_ms = (time.perf_counter() - start) * 1000 / len(texts)
+
+    order = np.random.default_rng(seed).permutation(len(texts))
+    split = max(1, int(len(texts) * holdout))
+    test, train = order[:split], order[split:]
+    model = fit([texts[i] for i in train], targets[train], n_features=n_features, epochs=epochs)
+    model.metadata = {
+        "teacher_version": teacher.version,
+        "train_size": len(train),
+        "n_features": n_features,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S")
+    }
+
+    test_texts = [texts[i] for i in test]
+    start = time.perf_counter()
+    predicted = model.positive_probabilities(test_texts)
+    fast_ms = (time.perf_counter() - start) * 1000 / len(test_texts)
+    agreement = float(np.mean((predicted >= 0.5) == (targets[test] >= 0.5)))
+
+    model.save(output)
+    report = {
+        "output": str(output),
+        "teacher_version": teacher.version,
+        "train_size": len(train),
+        "holdout_size": len(test),
+        "holdout_agreement": round(agreement, 4),
+        "holdout_mean_score_diff": round(float(np.mean(np.abs(predicted - targets[test]))) * 100, 2),
+        "teacher_ms_per_review": round(teacher_ms, 3),
+        "fast_ms_per_review": round(fast_ms, 4)
+    }
+    logger.info(f"Fast model distilled: {report}")
+    return report
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Distill the fast fallback model from DistilBERT.")
+    parser.add_argument("--texts", type=Path, nargs="*", default=[], help="Files with one review per line")
+    parser.add_argument("--feedback", action="store_true", help="Also train on review texts from the feedback table")
+    parser.add_argument("--database-url", default=None, help="Database URL for --feedback (defaults to DATABASE_URL)")
+    parser.add_argument("--output", type=Path, default=None, help="Output file (defaults to FAST_MODEL_PATH)")
+    parser.add_argument("--holdout", type=float, default=0.1, help="Share of reviews held out for the report")
+    parser.add_argument("--features", type=int, default=DEFAULT_FEATURES, help="Hashed feature columns")
+    parser.add_argument("--epochs", type=int, default=200, help="Full-batch optimizer steps")
+    parser.add_argument("--min-agreement", type=float, default=0.0, help="Fail below this held-out agreement")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=getattr(logging, Config.LOG_LEVEL), format=Config.LOG_FORMAT)
+    texts: List[str] = []
+    for path in args.texts:
+        texts.extend(path.read_text(encoding="utf-8").splitlines())
+    if args.feedback:
+        texts.extend(feedback_texts(args.database_url))
+    if not texts:
+        parser.error("No training reviews: pass --texts and/or --feedback")
+
+    report = distill(
+        texts,
+        output=args.output or Config.FAST_MODEL_PATH,
+        holdout=args.holdout,
+        n_features=args.features,
+        epochs=args.epochs
+    )
+    print(json.dumps(report, indent=2))
+    if report["holdout_agreement"] < args.min_agreement:
+        raise SystemExit(f"Held-out agreement {report['holdout_agreement']} is below {args.min_agreement}")
+
+
+if __name__ == "__main__":
+    main()
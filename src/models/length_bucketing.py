@@ -0,0 +1,102 @@
+"""Length-aware batching helpers and padding-waste accounting."""
+
+from typing import Any, Dict, List, Sequence
+import threading
+
+
+def bucket_by_length(lengths: Sequence[int], batch_size: int) -> List[List[int]]:
+    """
+    Group input indices into batches of similar token length.
+
+    Indices are sorted by length and cut into consecutive runs of
+    ``batch_size`` so each batch only pads to its own longest item.
+    The caller is responsible for scattering results back by index.
+    """
+    order = sorted(range(len(lengths)), key=lengths.__getitem__)
+    return [order[i:i + batch_size] for i in range(0, len(order), batch_size)]
+
+
+def chunk_in_order(count: int, batch_size: int) -> List[List[int]]:
+    """Group input indices into batches in arrival order."""
+    return [list(range(i, min(i + batch_size, count))) for i in range(0, count, batch_size)]
+
+
+class PaddingStats:
+    """
+    Running totals of real vs padded tokens across forward passes.
+
+    Attention cost grows with the square of the padded sequence length, so
+    alongside token counts we track ``sum(L_i^2)`` for the real lengths and
+    ``batch * L_max^2`` for what was actually computed.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.batches = 0
+            self.sequences = 0
+            self.real_tokens = 0
+            self.padded_tokens = 0
+            self.real_attention_cells = 0
+            self.padded_attention_cells = 0
+
+    def record(self, lengths: Sequence[int]) -> None:
+        """Record one padded batch given the unpadded length of each row."""
+        if not lengths:
+            return
+        longest = max(lengths)
+        with self._lock:
+            self.batches += 1
+            self.sequences += len(lengths)
+            self.real_tokens += sum(lengths)
+            self.padded_tokens += longest * len(lengths)
+            self.real_attention_cells += sum(length * length for length in lengths)
+            self.padded_attention_cells += longest * longest * len(lengths)
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            token_waste = 1 - self.real_tokens / self.padded_tokens if self.padded_tokens else 0.0
+            attention_waste = (
+                1 - self.real_attention_cells / self.padded_attention_cells
+                if self.padded_attention_cells else 0.0
+            )
+            return {
+                "batches": self.batches,
+                "sequences": self.sequences,
+                "real_tokens": self.real_tokens,
+                "padded_tokens": self.padded_tokens,
+                "token_waste": round(token_waste, 4),
+                "attention_waste": round(attention_waste, 4)
+            }
+
+
+def compare_padding(lengths: Sequence[int], batch_size: int) -> Dict[str, Any]:
+    """
+    Compare padding waste of arrival-order vs length-bucketed batching.
+
+    Useful offline: feed it the token lengths of a real review sample to see
+    how much attention compute bucketing would save on that distribution.
+    """
+    report: Dict[str, Any] = {}
+    totals = {}
+    for name, groups in (
+        ("arrival_order", chunk_in_order(len(lengths), batch_size)),
+        ("length_bucketed", bucket_by_length(lengths, batch_size))
+    ):
+        stats = PaddingStats()
+        for group in groups:
+            stats.record([lengths[i] for i in group])
+        report[name] = stats.to_dict()
+        totals[name] = stats
+
+    naive = totals["arrival_order"]
+    bucketed = totals["length_bucketed"]
+    if bucketed.padded_tokens:
+        report["padded_token_reduction"] = round(naive.padded_tokens / bucketed.padded_tokens, 3)
+        report["attention_compute_reduction"] = round(
+            naive.padded_attention_cells / bucketed.padded_attention_cells, 3
+        )
+    return report
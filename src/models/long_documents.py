@@ -0,0 +1,60 @@
+"""
+Sliding-window scoring for reviews longer than the model's sequence length.
+
+A long review is split into overlapping windows of ``MAX_SEQUENCE_LENGTH``
+tokens, every window is scored, and the window probabilities are combined
+into one prediction for the review.
+"""
+
+from typing import List, Sequence
+
+AGGREGATIONS = ("mean", "length", "last")
+
+
+def select_windows(count: int, max_windows: int) -> List[int]:
+    """
+    Pick which window positions to score when a review has ``count`` windows.
+
+    The first window (which introduces the subject) and the last
+    ``max_windows - 1`` windows (where the verdict usually is) are kept, so
+    the cost per review is bounded without ignoring its ending.
+    """
+    if max_windows <= 0 or count <= max_windows:
+        return list(range(count))
+    if max_windows == 1:
+        return [0]
+    return [0] + list(range(count - max_windows + 1, count))
+
+
+def aggregate(
+    probabilities: Sequence[Sequence[float]],
+    lengths: Sequence[int],
+    positions: Sequence[int],
+    method: str = "mean"
+) -> List[float]:
+    """
+    Combine per-window class probabilities into one distribution.
+
+    Args:
+        probabilities: Class probabilities per window
+        lengths: Real (non-padding) tokens per window
+        positions: Window position within the review, 0 for the first
+        method: ``mean`` weighs windows equally, ``length`` by their token
+            count, ``last`` linearly by position so later windows count more
+
+    Returns:
+        Weighted average of the window probabilities
+    """
+    if method == "length":
+        weights = [float(length) for length in lengths]
+    elif method == "last":
+        weights = [float(position + 1) for position in positions]
+    elif method == "mean":
+        weights = [1.0] * len(probabilities)
+    else:
+        raise ValueError(f"Unknown aggregation {method!r}, expected one of {AGGREGATIONS}")
+    total = sum(weights)
+    return [
+        sum(weight * row[label] for weight, row in zip(weights, probabilities)) / total
+        for label in range(len(probabilities[0]))
+    ]
@@ -0,0 +1,127 @@
+"""
+Memory-mapped checkpoint loading.
+
+``from_pretrained`` reads ``model.safetensors`` into anonymous memory, so
+every replica on a host keeps a private copy of the ~250MB of weights. With
+``MODEL_LOAD_MMAP=True`` the file is opened with ``safetensors.safe_open``,
+which maps it copy-on-write, and every parameter is assigned the tensor it
+returns, a view into the mapping:
+
+- the weights stay in the page cache and are shared by all processes that
+  map the same file;
+- nothing is copied, so loading never holds two copies of the weights;
+- pages are read from disk when first touched (the warmup pass touches them).
+
+The model is built with random initialization skipped, so its own weights
+are allocated but never written, and are freed once the mapped tensors
+replace them; they never become resident. A checkpoint must not be
+overwritten in place while it is mapped; replace it with a new directory or
+an atomic rename, as ``/admin/model/reload`` expects.
+"""
+
+from pathlib import Path
+from typing import Dict, List, Tuple
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+WEIGHTS_NAME = "model.safetensors"
+WEIGHTS_INDEX_NAME = "model.safetensors.index.json"
+
+
+def weight_files(model_path: Path) -> List[Path]:
+    """The safetensors files of a checkpoint directory, following the shard index if there is one."""
+    model_path = Path(model_path)
+    index = model_path / WEIGHTS_INDEX_NAME
+    if index.is_file():
+        weight_map = json.loads(index.read_text(encoding="utf-8"))["weight_map"]
+        return [model_path / name for name in sorted(set(weight_map.values()))]
+    if (model_path / WEIGHTS_NAME).is_file():
+        return [model_path / WEIGHTS_NAME]
+    raise FileNotFoundError(f"No {WEIGHTS_NAME} in {model_path}; memory-mapped loading needs safetensors weights")
+
+
+def map_safetensors(path: Path) -> Dict[str, "torch.Tensor"]:
+    """Tensors of a safetensors file as views into a private mapping of it, which they keep alive."""
+    from safetensors import safe_open
+
+    with safe_open(str(path), framework="pt", device="cpu") as weights:
+        return {name: weights.get_tensor(name) for name in weights.keys()}
+
+
+def _random_init_functions() -> frozenset:
+    import torch
+
+    init = torch.nn.init
+    return frozenset([
+        init.uniform_, init.normal_, init.trunc_normal_, init.xavier_uniform_, init.xavier_normal_,
+        init.kaiming_uniform_, init.kaiming_normal_, init.orthogonal_, init.sparse_,
+        torch.Tensor.uniform_, torch.Tensor.normal_
+    ])
+
+
+def _skip_random_init():
+    """
+    Torch function mode that turns random weight initialization into a no-op.
+
+    A mode only applies to the thread that enters it, so modules built
+    concurrently elsewhere are initialized as usual. Deterministic
+    initialization (``zeros_``, ``ones_``, ``arange``) still runs, so buffers
+    that are not saved in checkpoints, such as position ids, are computed.
+    """
+    from torch.overrides import TorchFunctionMode
+
+    skipped = _random_init_functions()
+
+    class SkipRandomInit(TorchFunctionMode):
+        def __torch_function__(self, func, types, args=(), kwargs=None):
+            if func in skipped:
+                return args[0] if args else kwargs.get("tensor")
+            return func(*args, **(kwargs or {}))
+
+    return SkipRandomInit()
+
+
+def load_mmap_model(model_path: Path) -> Tuple["torch.nn.Module", List[Path]]:
+    """
+    Build the sequence classifier at ``model_path`` with memory-mapped weights.
+
+    Returns:
+        The model in eval mode, and the mapped weight files
+
+    Raises:
+        FileNotFoundError: If the checkpoint has no safetensors weights
+        ValueError: If the weights do not cover every parameter of the model
+    """
+    from transformers import AutoConfig, AutoModelForSequenceClassification
+
+    files = weight_files(model_path)
+    config = AutoConfig.from_pretrained(str(model_path))
+    with _skip_random_init():
+        model = AutoModelForSequenceClassification.from_config(config)
+
+    state = {}
+    for path in files:
+        state.update(map_safetensors(path))
+    expected = model.state_dict()
+    converted = []
+    for name, tensor in state.items():
+        if name in expected and tensor.dtype != expected[name].dtype:
+            # from_pretrained loads into the default dtype; match it, at the cost of a copy
+            state[name] = tensor.to(expected[name].dtype)
+            converted.append(name)
+    result = model.load_state_dict(state, strict=False, assign=True)
+    model.tie_weights()
+    # Parameters tied to a loaded one are loaded too
+    params = dict(model.named_parameters(remove_duplicate=False))
+    loaded = {id(param) for name, param in params.items() if name not in result.missing_keys}
+    missing = [name for name, param in params.items() if id(param) not in loaded]
+    if missing:
+        raise ValueError(f"Checkpoint weights are missing {len(missing)} parameters, e.g. {missing[:3]}")
+    if result.unexpected_keys:
+        logger.warning(f"Ignoring {len(result.unexpected_keys)} unused checkpoint tensors, e.g. {result.unexpected_keys[:3]}")
+    if converted:
+        logger.warning(f"Copied {len(converted)} tensors to convert their dtype; they are not shared")
+    model.eval()
+    return model, files
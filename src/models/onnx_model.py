@@ -0,0 +1,194 @@
+"""
+ONNX Runtime inference backend.
+
+Run ``python -m src.models.onnx_model`` to check that the ONNX graph agrees
+with the PyTorch model before switching with ``MODEL_BACKEND=onnx``.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+import argparse
+import json
+import logging
+import os
+import time
+
+import numpy as np
+
+from ..config.settings import Config
+from .checkpoint import checkpoint_fingerprint
+from .sentiment_model import SentimentModel, ModelLoadError
+
+logger = logging.getLogger(__name__)
+
+ONNX_OPSET = 14
+
+
+class OnnxSentimentModel(SentimentModel):
+    """
+    DistilBERT classifier served by ONNX Runtime.
+
+    On first load the PyTorch checkpoint is exported to ONNX and cached in
+    ``cache_dir`` under the checkpoint fingerprint, so later loads (and other
+    processes) skip the export. Tokenization, batching and result formatting
+    are shared with ``SentimentModel``; only the forward pass differs.
+    """
+
+    RETURN_TENSORS = "np"
+
+    def __init__(
+        self,
+        model_path: Optional[Path] = None,
+        cache_dir: Optional[Path] = None,
+        intra_op_threads: Optional[int] = None
+    ):
+        super().__init__(model_path=model_path, device="cpu", precision="fp32")
+        self.cache_dir = Path(cache_dir or Config.ONNX_CACHE_DIR)
+        self.intra_op_threads = Config.ONNX_INTRA_OP_THREADS if intra_op_threads is None else intra_op_threads
+        self._session = None
+        self._input_names: List[str] = []
+
+    @classmethod
+    def import_dependencies(cls) -> None:
+        import onnxruntime  # noqa: F401
+        from transformers import AutoTokenizer  # noqa: F401
+
+    def load(self) -> None:
+        if self._is_loaded:
+            logger.info("Model already loaded")
+            return
+        try:
+            logger.info(f"Loading ONNX model for: {self.model_path}")
+            start = time.perf_counter()
+            import onnxruntime as ort
+            imported = time.perf_counter()
+            fingerprint = checkpoint_fingerprint(self.model_path)
+            onnx_path = self.cache_dir / f"model-{fingerprint}.onnx"
+            self._load_tokenizer()
+            tokenized = time.perf_counter()
+            if not onnx_path.exists():
+                self._export(onnx_path)
+            exported = time.perf_counter()
+
+            options = ort.SessionOptions()
+            options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+            options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+            options.intra_op_num_threads = self.intra_op_threads
+            self._session = ort.InferenceSession(
+                str(onnx_path),
+                sess_options=options,
+                providers=["CPUExecutionProvider"]
+            )
+            self._input_names = [i.name for i in self._session.get_inputs()]
+            self.version = f"{fingerprint}-onnx{self._mode_suffix()}"
+            self.load_timings = {
+                "import_s": round(imported - start, 3),
+                "tokenizer_s": round(tokenized - imported, 3),
+                "export_s": round(exported - tokenized, 3),
+                "session_s": round(time.perf_counter() - exported, 3)
+            }
+            self._is_loaded = True
+            logger.info(f"ONNX model loaded successfully! (version {self.version}, timings {self.load_timings})")
+        except Exception as e:
+            logger.error(f"Failed to load ONNX model: {e}")
+            raise ModelLoadError(f"Failed to load ONNX model: {e}") from e
+
+    def _export(self, onnx_path: Path) -> None:
+        import torch
+        from transformers import AutoModelForSequenceClassification
+
+        logger.info(f"Exporting checkpoint to ONNX: {onnx_path}")
+        model = AutoModelForSequenceClassification.from_pretrained(str(self.model_path))
+        model.eval()
+        sample = self._tokenizer(["export sample"], return_tensors="pt")
+        onnx_path.parent.mkdir(parents=True, exist_ok=True)
+        # Export under a temporary name so concurrent processes never load a partial file
+        tmp_path = onnx_path.with_suffix(f".{os.getpid()}.tmp")
+        with torch.no_grad():
+            torch.onnx.export(
+                model,
+                (sample["input_ids"], sample["attention_mask"]),
+                str(tmp_path),
+                input_names=["input_ids", "attention_mask"],
+                output_names=["logits"],
+                dynamic_axes={
+                    "input_ids": {0: "batch", 1: "sequence"},
+                    "attention_mask": {0: "batch", 1: "sequence"},
+                    "logits": {0: "batch"}
+                },
+                opset_version=ONNX_OPSET
+            )
+        os.replace(tmp_path, onnx_path)
+        del model
+
+    def _forward(self, inputs) -> List[List[float]]:
+        feed = {name: np.asarray(inputs[name], dtype=np.int64) for name in self._input_names}
+        logits = self._session.run(["logits"], feed)[0]
+        logits = logits - logits.max(axis=-1, keepdims=True)
+        exp = np.exp(logits)
+        return (exp / exp.sum(axis=-1, keepdims=True)).tolist()
+
+    @property
+    def model(self):
+        return self._session
+
+
+def verify_equivalence(
+    model_path: Optional[Path] = None,
+    texts: Optional[List[str]] = None,
+    tolerance: float = 0.1
+) -> Dict[str, Any]:
+    """
+    Compare ONNX Runtime predictions against the PyTorch model.
+
+    Args:
+        model_path: Checkpoint directory (defaults to ``Config.MODEL_PATH``)
+        texts: Reviews to compare (defaults to the quantization reference set)
+        tolerance: Maximum allowed difference in percentage points per score
+
+    Returns:
+        Report with label agreement, the largest score difference and a pass flag
+    """
+    from .quantization import REFERENCE_REVIEWS
+
+    texts = texts or REFERENCE_REVIEWS
+    torch_model = SentimentModel(model_path=model_path, device="cpu", precision="fp32")
+    onnx_model = OnnxSentimentModel(model_path=model_path)
+    torch_model.load()
+    onnx_model.load()
+    expected = torch_model.predict_batch(texts)
+    actual = onnx_model.predict_batch(texts)
+
+    max_diff = max(
+        abs(a["scores"][label] - b["scores"][label])
+        for a, b in zip(expected, actual) for label in ("negative", "positive")
+    )
+    agreement = sum(a["sentiment"] == b["sentiment"] for a, b in zip(expected, actual)) / len(texts)
+    return {
+        "reference_size": len(texts),
+        "agreement": round(agreement, 4),
+        "max_score_diff": round(max_diff, 4),
+        "tolerance": tolerance,
+        "passed": agreement == 1.0 and max_diff <= tolerance
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Check ONNX Runtime predictions against PyTorch.")
+    parser.add_argument("--model-path", type=Path, default=None, help="Checkpoint directory")
+    parser.add_argument("--texts", type=Path, default=None, help="File with one review per line")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="Max score difference in percentage points")
+    args = parser.parse_args(argv)
+
+    texts = None
+    if args.texts:
+        texts = [line.strip() for line in args.texts.read_text(encoding="utf-8").splitlines() if line.strip()]
+
+    report = verify_equivalence(args.model_path, texts, args.tolerance)
+    print(json.dumps(report, indent=2))
+    if not report["passed"]:
+        raise SystemExit("ONNX predictions do not match the PyTorch model")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""
+Dynamic INT8 quantization for CPU inference.
+
+Run ``python -m src.models.quantization`` to compare every reduced precision
+(INT8 and bf16) against the FP32 checkpoint on a reference set of reviews
+before opting in with ``MODEL_PRECISION``.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+import argparse
+import io
+import json
+import logging
+import time
+
+import torch
+
+from .sentiment_model import SUPPORTED_PRECISIONS
+
+logger = logging.getLogger(__name__)
+
+REFERENCE_REVIEWS: List[str] = [
+    "This product exceeded my expectations! Highly recommend.",
+    "Terrible quality. Broke after one week of use.",
+    "Fast shipping and great customer service!",
+    "Not worth the money. Very disappointed.",
+    "It works as described, nothing more and nothing less.",
+    "The battery lasts forever and the screen is gorgeous.",
+    "Arrived damaged and the seller never answered my emails.",
+    "Decent for the price, but the strap feels cheap.",
+    "My kids love it and use it every single day.",
+    "Stopped charging after two months. Returning it.",
+    "Five stars, would buy again without a second thought.",
+    "The instructions were confusing and two screws were missing.",
+    "Comfortable, stylish and true to size.",
+    "Smells awful and gave me a rash. Avoid.",
+    "I was skeptical at first, but this blender is a beast.",
+    "Loud, flimsy and the lid does not seal properly.",
+    "Good value. Does the job for light use around the house.",
+    "Worst purchase I have made this year.",
+    "Sound quality is crisp and the bass is surprisingly deep.",
+    "Color looked nothing like the pictures and it faded after one wash.",
+]
+
+
+def select_quantized_engine() -> None:
+    """Pick a quantized kernel backend supported by this CPU."""
+    engines = torch.backends.quantized.supported_engines
+    for engine in ("x86", "fbgemm", "qnnpack"):
+        if engine in engines:
+            torch.backends.quantized.engine = engine
+            return
+
+
+def quantize_dynamic_int8(model: torch.nn.Module, inplace: bool = False) -> torch.nn.Module:
+    """
+    Replace the model's Linear layers with dynamically quantized INT8 versions.
+
+    Without ``inplace`` the model is deep-copied first, which briefly holds a
+    second FP32 copy of every weight.
+    """
+    select_quantized_engine()
+    return torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8, inplace=inplace)
+
+
+def model_size_bytes(model: torch.nn.Module) -> int:
+    """
+    Get the serialized size of the model's state dict.
+
+    Quantized Linear layers keep their weights in packed params that do not
+    show up in ``parameters()``, so serializing is the reliable way to
+    compare FP32 and INT8 footprints.
+    """
+    buffer = io.BytesIO()
+    torch.save(model.state_dict(), buffer)
+    return buffer.tell()
+
+
+def _time_predictions(model, texts: List[str], runs: int) -> Dict[str, float]:
+    model.predict(texts[0])
+    latencies = []
+    for _ in range(runs):
+        for text in texts:
+            start = time.perf_counter()
+            model.predict(text)
+            latencies.append((time.perf_counter() - start) * 1000)
+    latencies.sort()
+    return {
+        "mean_ms": round(sum(latencies) / len(latencies), 3),
+        "p50_ms": round(latencies[len(latencies) // 2], 3),
+        "p95_ms": round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))], 3)
+    }
+
+
+def compare_precision(
+    model_path: Optional[Path] = None,
+    texts: Optional[List[str]] = None,
+    runs: int = 3,
+    precisions: Sequence[str] = SUPPORTED_PRECISIONS
+) -> Dict[str, Any]:
+    """
+    Compare each reduced precision against FP32 predictions, footprint and latency.
+
+    A precision this machine cannot run (e.g. bf16 without AVX512-BF16 or
+    AMX) loads as fp32; it is reported as ``skipped`` instead of measured.
+
+    Args:
+        model_path: Checkpoint directory (defaults to ``Config.MODEL_PATH``)
+        texts: Reference reviews (defaults to ``REFERENCE_REVIEWS``)
+        runs: Timed passes over the reference set per precision
+        precisions: Precisions to measure; fp32 is always included as the baseline
+
+    Returns:
+        Report with size and latency per precision, and label agreement,
+        score drift, size reduction and speedup against fp32 for the others
+    """
+    from .sentiment_model import SentimentModel
+
+    texts = texts or REFERENCE_REVIEWS
+    precisions = ["fp32"] + [precision for precision in precisions if precision != "fp32"]
+    report: Dict[str, Any] = {"reference_size": len(texts)}
+    predictions = {}
+    for precision in precisions:
+        model = SentimentModel(model_path=model_path, device="cpu", precision=precision)
+        model.load()
+        if model.precision != precision:
+            report[precision] = {"skipped": f"not supported on this machine, loaded as {model.precision}"}
+            del model
+            continue
+        predictions[precision] = model.predict_batch(texts)
+        report[precision] = {
+            "size_mb": round(model_size_bytes(model.model) / 1024 ** 2, 2),
+            "latency": _time_predictions(model, texts, runs)
+        }
+        del model
+
+    fp32 = predictions["fp32"]
+    for precision in precisions[1:]:
+        if precision not in predictions:
+            continue
+        reduced = predictions[precision]
+        drift = [abs(a["scores"]["positive"] - b["scores"]["positive"]) for a, b in zip(fp32, reduced)]
+        disagreements = [
+            {"text": text, "fp32": a["sentiment"], precision: b["sentiment"]}
+            for text, a, b in zip(texts, fp32, reduced) if a["sentiment"] != b["sentiment"]
+        ]
+        report[precision].update({
+            "agreement": round(1 - len(disagreements) / len(texts), 4),
+            "max_score_drift": round(max(drift), 2),
+            "mean_score_drift": round(sum(drift) / len(drift), 2),
+            "disagreements": disagreements,
+            "size_reduction": round(report["fp32"]["size_mb"] / report[precision]["size_mb"], 2),
+            "speedup": round(report["fp32"]["latency"]["mean_ms"] / report[precision]["latency"]["mean_ms"], 2)
+        })
+    return report
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Compare reduced-precision and FP32 sentiment predictions.")
+    parser.add_argument("--model-path", type=Path, default=None, help="Checkpoint directory")
+    parser.add_argument("--texts", type=Path, default=None, help="File with one reference review per line")
+    parser.add_argument("--runs", type=int, default=3, help="Timed passes per precision")
+    parser.add_argument("--precisions", nargs="+", choices=SUPPORTED_PRECISIONS, default=list(SUPPORTED_PRECISIONS),
+                        help="Precisions to compare against fp32")
+    parser.add_argument("--min-agreement", type=float, default=0.99, help="Fail below this label agreement")
+    args = parser.parse_args(argv)
+
+    texts = None
+    if args.texts:
+        texts = [line.strip() for line in args.texts.read_text(encoding="utf-8").splitlines() if line.strip()]
+
+    report = compare_precision(args.model_path, texts, args.runs, args.precisions)
+    print(json.dumps(report, indent=2))
+    failing = [
+        f"{precision} agreement {result['agreement']}"
+        for precision, result in report.items()
+        if isinstance(result, dict) and result.get("agreement", 1.0) < args.min_agreement
+    ]
+    if failing:
+        raise SystemExit(f"{', '.join(failing)} below {args.min_agreement}")
+
+
+if __name__ == "__main__":
+    main()
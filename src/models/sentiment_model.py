@@ -2,17 +2,27 @@
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import logging
-
-import torch
-import torch.nn.functional as F
-from transformers import AutoModelForSequenceClassification, AutoTokenizer
+import time
 
 from ..config.settings import Config
+from ..monitoring.memory import mapped_file_memory, process_memory
+from ..monitoring.metrics import INFERENCE_BATCH_SIZE, STAGE_LATENCY
+from .checkpoint import checkpoint_fingerprint
+from .length_bucketing import PaddingStats, bucket_by_length, chunk_in_order
+from .long_documents import AGGREGATIONS, aggregate
+from .tokenization import BatchTokenizer
 
 logger = logging.getLogger(__name__)
 
+_TOKENIZE_LATENCY = STAGE_LATENCY.labels(stage="tokenize")
+_FORWARD_LATENCY = STAGE_LATENCY.labels(stage="forward")
+_POSTPROCESS_LATENCY = STAGE_LATENCY.labels(stage="postprocess")
+
+# fp32, int8 (dynamic quantization) or bf16 (autocast); int8 and bf16 fall back to fp32 off CPU
+SUPPORTED_PRECISIONS = ("fp32", "int8", "bf16")
+
 
 class BaseModel(ABC):
     @abstractmethod
@@ -23,64 +33,360 @@ class BaseModel(ABC):
     def predict(self, text: str) -> Dict[str, Any]:
         pass
 
+    @abstractmethod
+    def predict_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
+        pass
+
     @abstractmethod
     def is_loaded(self) -> bool:
         pass
 
 
 class SentimentModel(BaseModel):
+    NAME = "distilbert"
     LABELS = {0: "Negative", 1: "Positive"}
+    RETURN_TENSORS = "pt"
+    # Reading /proc/self/smaps takes tens of milliseconds, too slow for every /health probe
+    MAPPED_MEMORY_TTL = 10.0
 
-    def __init__(self, model_path: Optional[Path] = None, device: Optional[str] = None):
+    def __init__(self, model_path: Optional[Path] = None, device: Optional[str] = None, precision: Optional[str] = None):
         self.model_path = model_path or Config.MODEL_PATH
-        self.device = torch.device(device or Config.DEVICE)
+        # torch and transformers are imported in load() so importing this module stays cheap
+        self.device = device or Config.DEVICE
+        self.precision = (precision or Config.MODEL_PRECISION).lower()
+        if self.precision not in SUPPORTED_PRECISIONS:
+            raise ValueError(
+                f"MODEL_PRECISION must be one of {', '.join(SUPPORTED_PRECISIONS)}, "
+                f"got {precision or Config.MODEL_PRECISION!r}"
+            )
         self._model = None
         self._tokenizer = None
+        self._batch_tokenizer: Optional[BatchTokenizer] = None
+        self._graph = None
         self._is_loaded = False
+        self.version: Optional[str] = None
+        self.load_timings: Dict[str, float] = {}
+        self.load_memory: Dict[str, Any] = {}
+        self.weight_files: List[Path] = []
+        self.weights_bytes: Optional[int] = None
+        self._mapped_memory: Optional[Tuple[float, Dict[str, Any]]] = None
+        self.runtime: Dict[str, Any] = {}
+        self.padding_stats = PaddingStats()
         logger.info(f"SentimentModel initialized with device: {self.device}")
 
+    @classmethod
+    def import_dependencies(cls) -> None:
+        """
+        Import the inference libraries ``load`` needs.
+
+        torch keeps an exception traceback from import time (its optional
+        pynvml probe), which pins every frame on the importing stack. Callers
+        that replace models import here first, so that no model is on that
+        stack and replaced models can be freed.
+        """
+        import torch  # noqa: F401
+        from transformers import AutoModelForSequenceClassification  # noqa: F401
+
     def load(self) -> None:
         if self._is_loaded:
             logger.info("Model already loaded")
             return
         try:
             logger.info(f"Loading model from: {self.model_path}")
-            self._tokenizer = AutoTokenizer.from_pretrained(str(self.model_path))
-            self._model = AutoModelForSequenceClassification.from_pretrained(str(self.model_path))
+            memory_before = process_memory()
+            start = time.perf_counter()
+            from transformers import AutoModelForSequenceClassification  # noqa: F401
+            imported = time.perf_counter()
+            self._load_tokenizer()
+            tokenized = time.perf_counter()
+            self._model = self._load_weights()
             self._model.to(self.device)
             self._model.eval()
+            if self.precision == "int8":
+                self._quantize()
+            loaded = time.perf_counter()
+            memory_after = process_memory()
+            self.weights_bytes = _state_bytes(self._model)
+            self.load_memory = {
+                "rss_before_mb": memory_before["rss_mb"],
+                "rss_after_mb": memory_after["rss_mb"],
+                "peak_rss_mb": memory_after["peak_rss_mb"]
+            }
+            self._configure_runtime()
+            configured = time.perf_counter()
+            self.version = f"{checkpoint_fingerprint(self.model_path)}-{self.precision}{self._mode_suffix()}"
+            self.load_timings = {
+                "import_s": round(imported - start, 3),
+                "tokenizer_s": round(tokenized - imported, 3),
+                "weights_s": round(loaded - tokenized, 3),
+                "runtime_s": round(configured - loaded, 3)
+            }
             self._is_loaded = True
-            logger.info("Model loaded successfully!")
+            logger.info(
+                f"Model loaded successfully! (version {self.version}, timings {self.load_timings}, "
+                f"memory {self.load_memory})"
+            )
         except Exception as e:
             logger.error(f"Failed to load model: {e}")
             raise ModelLoadError(f"Failed to load model: {e}") from e
 
+    def _load_weights(self):
+        """Build the model, memory-mapping the safetensors weights when ``MODEL_LOAD_MMAP`` is on."""
+        from transformers import AutoModelForSequenceClassification
+
+        self.weight_files = []
+        if Config.MODEL_LOAD_MMAP:
+            from .mmap_loading import load_mmap_model
+
+            try:
+                model, self.weight_files = load_mmap_model(self.model_path)
+                return model
+            except (FileNotFoundError, ValueError) as e:
+                logger.warning(f"Memory-mapped loading not possible, using from_pretrained: {e}")
+        return AutoModelForSequenceClassification.from_pretrained(str(self.model_path))
+
+    def memory_usage(self) -> Dict[str, Any]:
+        """
+        Memory held by the model weights.
+
+        With memory-mapped weights, ``mapped`` gives the part of the
+        checkpoint resident in this process and its proportional share
+        (``pss_mb``), which falls as more replicas map the same file. It is
+        re-read at most every ``MAPPED_MEMORY_TTL`` seconds.
+        """
+        usage: Dict[str, Any] = {
+            "mmap": bool(self.weight_files),
+            "weights_mb": round(self.weights_bytes / 1024 ** 2, 1) if self.weights_bytes is not None else None,
+            "load": self.load_memory
+        }
+        if self.weight_files:
+            now = time.monotonic()
+            if self._mapped_memory is None or now - self._mapped_memory[0] > self.MAPPED_MEMORY_TTL:
+                self._mapped_memory = (now, mapped_file_memory(self.weight_files))
+            usage["mapped"] = self._mapped_memory[1]
+        return usage
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get model identity, padding and tokenization counters."""
+        stats: Dict[str, Any] = {
+            "model_loaded": self.is_loaded(),
+            "device": str(self.device),
+            "precision": self.precision,
+            "model_version": self.version,
+            "model_path": str(self.model_path),
+            "padding": self.padding_stats.to_dict()
+        }
+        if self.runtime:
+            stats["runtime"] = self.runtime
+        if self.batch_tokenizer is not None:
+            stats["tokenization"] = self.batch_tokenizer.get_stats()
+        return stats
+
+    def _mode_suffix(self) -> str:
+        """Version suffix for settings that change predictions, so caches keep them apart."""
+        if not Config.LONG_DOCUMENT_MODE:
+            return ""
+        if Config.LONG_DOCUMENT_AGGREGATION not in AGGREGATIONS:
+            raise ModelLoadError(
+                f"LONG_DOCUMENT_AGGREGATION must be one of {AGGREGATIONS}, "
+                f"got {Config.LONG_DOCUMENT_AGGREGATION!r}"
+            )
+        return (
+            f"-long{Config.LONG_DOCUMENT_MAX_WINDOWS}x{Config.LONG_DOCUMENT_STRIDE}"
+            f"-{Config.LONG_DOCUMENT_AGGREGATION}"
+        )
+
+    def _load_tokenizer(self) -> None:
+        """Load the Rust-backed fast tokenizer; the pure-Python one is far slower."""
+        from transformers import AutoTokenizer
+
+        tokenizer = AutoTokenizer.from_pretrained(str(self.model_path), use_fast=True)
+        if not tokenizer.is_fast:
+            raise ModelLoadError(
+                f"No fast tokenizer available for {self.model_path}; install `tokenizers` "
+                "or add a tokenizer.json to the checkpoint"
+            )
+        self._tokenizer = tokenizer
+        self._batch_tokenizer = BatchTokenizer(
+            tokenizer,
+            max_length=Config.MAX_SEQUENCE_LENGTH,
+            max_chars=Config.TOKENIZER_MAX_CHARS,
+            cache_size=Config.TOKENIZER_CACHE_SIZE
+        )
+
+    def _quantize(self) -> None:
+        from .quantization import quantize_dynamic_int8
+
+        if not str(self.device).startswith("cpu"):
+            logger.warning(f"INT8 dynamic quantization is CPU-only, keeping fp32 on {self.device}")
+            self.precision = "fp32"
+            return
+        size_before = _state_bytes(self._model)
+        self._model = quantize_dynamic_int8(self._model, inplace=True)
+        size_after = _state_bytes(self._model)
+        logger.info(
+            f"Quantized Linear layers to int8: {size_before / 1024 ** 2:.1f}MB -> "
+            f"{size_after / 1024 ** 2:.1f}MB"
+        )
+
+    def _configure_runtime(self) -> None:
+        """Apply the torch CPU runtime profile, see ``torch_runtime``."""
+        from . import torch_runtime
+
+        graph_mode = Config.TORCH_GRAPH_MODE.lower()
+        if graph_mode not in torch_runtime.GRAPH_MODES:
+            raise ModelLoadError(
+                f"TORCH_GRAPH_MODE must be one of {torch_runtime.GRAPH_MODES}, got {graph_mode!r}"
+            )
+        threads = torch_runtime.configure_threads(Config.TORCH_INTRA_OP_THREADS, Config.TORCH_INTER_OP_THREADS)
+        if self.precision == "bf16":
+            if not str(self.device).startswith("cpu"):
+                logger.warning(f"bf16 autocast is CPU-only here, keeping fp32 on {self.device}")
+                self.precision = "fp32"
+            elif not torch_runtime.bf16_supported():
+                logger.warning("This CPU has no native bf16 support (AVX512-BF16/AMX), keeping fp32")
+                self.precision = "fp32"
+        if graph_mode != "eager":
+            example = self._batch_tokenizer.pad([[self._batch_tokenizer.pad_token_id] * 16], self.RETURN_TENSORS)
+            example = {name: tensor.to(self.device) for name, tensor in example.items()}
+            try:
+                self._graph = torch_runtime.build_graph(self._model, graph_mode, example, self.precision)
+                self._warm_graph(torch_runtime.warmup_shapes(Config.BATCH_SIZE, Config.MAX_SEQUENCE_LENGTH))
+            except Exception as e:
+                logger.warning(f"Could not build a {graph_mode} graph, running eager: {e}")
+                self._graph = None
+                graph_mode = "eager"
+        self.runtime = torch_runtime.describe(threads, self.precision, graph_mode, Config.TORCH_INFERENCE_MODE)
+        logger.info(f"Torch runtime: {self.runtime}")
+
+    def _warm_graph(self, shapes: List[Tuple[int, int]]) -> None:
+        """Run the graph once per (batch size, length) so tracing and compilation happen at load time."""
+        for batch_size, length in shapes:
+            inputs = self._batch_tokenizer.pad(
+                [[self._batch_tokenizer.pad_token_id] * length] * batch_size,
+                self.RETURN_TENSORS
+            )
+            self._forward(inputs)
 
     def predict(self, text: str) -> Dict[str, Any]:
+        return self.predict_batch([text])[0]
+
+    def predict_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
         if not self._is_loaded:
             raise ModelNotLoadedError("Model not loaded")
-        if not text or not text.strip():
+        if any(not text or not text.strip() for text in texts):
             raise ValueError("Input text cannot be empty")
         try:
-            inputs = self._tokenizer(text, return_tensors="pt", truncation=True, max_length=Config.MAX_SEQUENCE_LENGTH, padding=True)
-            inputs = {k: v.to(self.device) for k, v in inputs.items()}
-            with torch.no_grad():
-                outputs = self._model(**inputs)
-                probabilities = F.softmax(outputs.logits, dim=-1)
-            predicted_class = torch.argmax(probabilities, dim=-1).item()
-            confidence = probabilities[0][predicted_class].item()
-            return {
-                "sentiment": self.LABELS.get(predicted_class, "Unknown"),
-                "confidence": round(confidence * 100, 2),
-                "scores": {
-                    "negative": round(probabilities[0][0].item() * 100, 2),
-                    "positive": round(probabilities[0][1].item() * 100, 2)
-                }
-            }
+            start = time.perf_counter()
+            if Config.LONG_DOCUMENT_MODE:
+                batches, windows = self.encode_windows(texts)
+            else:
+                batches, windows = self.encode(texts), None
+            _TOKENIZE_LATENCY.observe(time.perf_counter() - start)
+            return self.predict_encoded(batches, len(texts), windows)
         except Exception as e:
             logger.error(f"Prediction failed: {e}")
             raise PredictionError(f"Prediction failed: {e}") from e
 
+    def encode(self, texts: List[str]) -> List[Tuple[List[int], Any]]:
+        """Tokenize texts into padded model inputs, one (input indices, inputs) pair per batch."""
+        return self._batch(self._batch_tokenizer.encode(texts))
+
+    def encode_windows(self, texts: List[str]) -> Tuple[List[Tuple[List[int], Any]], List[Tuple[int, int]]]:
+        """
+        Split texts into overlapping windows and batch them for ``predict_encoded``.
+
+        Returns:
+            Batches whose indices refer to windows, and the (text index,
+            window position) of every window
+        """
+        ids, windows = self._batch_tokenizer.encode_windows(
+            texts,
+            stride=Config.LONG_DOCUMENT_STRIDE,
+            max_windows=Config.LONG_DOCUMENT_MAX_WINDOWS
+        )
+        return self._batch(ids), windows
+
+    def _batch(self, ids: List[Any]) -> List[Tuple[List[int], Any]]:
+        """Group token id sequences into padded batches of ``BATCH_SIZE``."""
+        if Config.LENGTH_BUCKETING:
+            groups = bucket_by_length([len(sequence) for sequence in ids], Config.BATCH_SIZE)
+        else:
+            groups = chunk_in_order(len(ids), Config.BATCH_SIZE)
+        return [
+            (group, self._batch_tokenizer.pad([ids[i] for i in group], self.RETURN_TENSORS))
+            for group in groups
+        ]
+
+    def predict_encoded(
+        self,
+        batches: List[Tuple[List[int], Any]],
+        count: int,
+        windows: Optional[List[Tuple[int, int]]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Run batches produced by ``encode`` and return results in input order.
+
+        With ``windows`` (from ``encode_windows``) the batch indices refer to
+        windows, whose probabilities are aggregated per text.
+        """
+        results: List[Dict[str, Any]] = [{} for _ in range(count)]
+        scored: List[List[Tuple[int, int, List[float]]]] = [[] for _ in range(count)]
+        for group, inputs in batches:
+            lengths = inputs["attention_mask"].sum(-1).tolist()
+            self.padding_stats.record(lengths)
+            INFERENCE_BATCH_SIZE.observe(len(group))
+            start = time.perf_counter()
+            probabilities = self._forward(inputs)
+            forwarded = time.perf_counter()
+            if windows is None:
+                for i, row in zip(group, probabilities):
+                    results[i] = self._format_result(row)
+            else:
+                for i, row, length in zip(group, probabilities, lengths):
+                    text_index, position = windows[i]
+                    scored[text_index].append((position, length, row))
+            _FORWARD_LATENCY.observe(forwarded - start)
+            _POSTPROCESS_LATENCY.observe(time.perf_counter() - forwarded)
+        if windows is not None:
+            for i, text_windows in enumerate(scored):
+                text_windows.sort(key=lambda window: window[0])
+                probabilities = aggregate(
+                    [row for _, _, row in text_windows],
+                    lengths=[length for _, length, _ in text_windows],
+                    positions=[position for position, _, _ in text_windows],
+                    method=Config.LONG_DOCUMENT_AGGREGATION
+                )
+                results[i] = {**self._format_result(probabilities), "windows": len(text_windows)}
+        return results
+
+    def _forward(self, inputs) -> List[List[float]]:
+        import torch
+        from .torch_runtime import autocast, grad_mode
+
+        inputs = {k: v.to(self.device) for k, v in inputs.items()}
+        with grad_mode(Config.TORCH_INFERENCE_MODE):
+            with autocast(self.precision):
+                if self._graph is not None:
+                    logits = self._graph(*inputs.values())
+                else:
+                    logits = self._model(**inputs).logits
+            probabilities = torch.softmax(logits.float(), dim=-1)
+        return probabilities.tolist()
+
+    def _format_result(self, probabilities: List[float]) -> Dict[str, Any]:
+        predicted_class = max(range(len(probabilities)), key=probabilities.__getitem__)
+        return {
+            "sentiment": self.LABELS.get(predicted_class, "Unknown"),
+            "confidence": round(probabilities[predicted_class] * 100, 2),
+            "scores": {
+                "negative": round(probabilities[0] * 100, 2),
+                "positive": round(probabilities[1] * 100, 2)
+            },
+            "model_version": self.version,
+            "model": self.NAME
+        }
+
     def is_loaded(self) -> bool:
         return self._is_loaded
 
@@ -92,6 +398,22 @@ class SentimentModel(BaseModel):
     def tokenizer(self):
         return self._tokenizer
 
+    @property
+    def batch_tokenizer(self) -> Optional[BatchTokenizer]:
+        return self._batch_tokenizer
+
+
+
+def _state_bytes(model) -> int:
+    """Bytes of the tensors in the model's state dict, including packed int8 weights."""
+    import torch
+
+    total = 0
+    for value in model.state_dict().values():
+        for tensor in value if isinstance(value, tuple) else (value,):
+            if isinstance(tensor, torch.Tensor):
+                total += tensor.numel() * tensor.element_size()
+    return total
 
 
 class ModelError(Exception):
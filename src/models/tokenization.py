@@ -0,0 +1,204 @@
+"""
+Tokenization fast path.
+
+Wraps the Rust-backed fast tokenizer with character pre-truncation, an
+optional LRU cache of encodings and a padding step that builds tensors
+directly instead of going through ``tokenizer.pad``.
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import threading
+
+import numpy as np
+
+from .long_documents import select_windows
+
+
+def pretruncate(text: str, max_chars: int) -> str:
+    """
+    Cut ``text`` to at most ``max_chars`` characters at a whitespace boundary.
+
+    Cutting between words keeps the tokens of the prefix identical to the
+    leading tokens of the full text, because the tokenizer never merges
+    across whitespace.
+    """
+    if max_chars <= 0 or len(text) <= max_chars:
+        return text
+    cut = max_chars
+    while cut > 0 and not text[cut].isspace():
+        cut -= 1
+    return text[:cut] if cut > 0 else text[:max_chars]
+
+
+class EncodingCache:
+    """Thread-safe LRU cache of token ids keyed by the exact input text."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[int, ...]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, text: str) -> Optional[Tuple[int, ...]]:
+        with self._lock:
+            ids = self._entries.get(text)
+            if ids is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(text)
+            self.hits += 1
+            return ids
+
+    def put(self, text: str, ids: Sequence[int]) -> None:
+        with self._lock:
+            self._entries[text] = tuple(ids)
+            self._entries.move_to_end(text)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+class BatchTokenizer:
+    """
+    Turns raw texts into truncated token ids and padded model inputs.
+
+    Texts longer than ``max_chars`` are cut before tokenizing, since
+    tokenizing 10000 characters only to keep the first 512 tokens wastes
+    most of the work. If a cut text yields fewer than ``max_length`` tokens
+    (unusually long words), it is tokenized again in full, so the result is
+    always identical to tokenizing the whole text. Uncached texts are
+    tokenized in one ``encode_batch`` call, which the Rust tokenizer spreads
+    across its thread pool.
+    """
+
+    def __init__(self, tokenizer, max_length: int, max_chars: int, cache_size: int = 0):
+        """
+        Initialize the batch tokenizer.
+
+        Args:
+            tokenizer: Loaded fast tokenizer
+            max_length: Maximum tokens per sequence, including special tokens
+            max_chars: Pre-truncation limit in characters (0 disables it)
+            cache_size: Encodings kept in the LRU cache (0 disables it)
+        """
+        self._tokenizer = tokenizer
+        self.max_length = max_length
+        self.max_chars = max_chars
+        self.cache = EncodingCache(cache_size) if cache_size > 0 else None
+        self.pad_token_id = tokenizer.pad_token_id or 0
+        self.input_names = list(tokenizer.model_input_names)
+        self.pretruncated = 0
+        self.fallbacks = 0
+
+    def encode(self, texts: List[str]) -> List[Sequence[int]]:
+        """Get the truncated token ids for each text, in input order."""
+        ids: List[Optional[Sequence[int]]] = [None] * len(texts)
+        missing: List[int] = []
+        if self.cache is not None:
+            for i, text in enumerate(texts):
+                ids[i] = self.cache.get(text)
+                if ids[i] is None:
+                    missing.append(i)
+        else:
+            missing = list(range(len(texts)))
+        if not missing:
+            return ids
+
+        inputs = [pretruncate(texts[i], self.max_chars) for i in missing]
+        encoded = self._tokenize(inputs)
+        retry = [
+            position for position, i in enumerate(missing)
+            if len(inputs[position]) < len(texts[i]) and len(encoded[position]) < self.max_length
+        ]
+        if retry:
+            for position, full in zip(retry, self._tokenize([texts[missing[p]] for p in retry])):
+                encoded[position] = full
+        self.pretruncated += sum(len(inputs[p]) < len(texts[i]) for p, i in enumerate(missing))
+        self.fallbacks += len(retry)
+
+        for position, i in enumerate(missing):
+            ids[i] = encoded[position]
+            if self.cache is not None:
+                self.cache.put(texts[i], encoded[position])
+        return ids
+
+    def encode_windows(
+        self,
+        texts: List[str],
+        stride: int,
+        max_windows: int
+    ) -> Tuple[List[Sequence[int]], List[Tuple[int, int]]]:
+        """
+        Split each text into overlapping windows of at most ``max_length`` tokens.
+
+        Texts are tokenized in full (no pre-truncation or caching), since the
+        end of the review is what the windows are for.
+
+        Args:
+            texts: Texts to split
+            stride: Tokens shared by consecutive windows
+            max_windows: Windows kept per text, see ``select_windows``
+
+        Returns:
+            Token ids per window, and the (text index, window position) of each
+        """
+        encoded = self._tokenizer(
+            texts,
+            truncation=True,
+            max_length=self.max_length,
+            stride=stride,
+            return_overflowing_tokens=True,
+            return_attention_mask=False,
+            return_token_type_ids=False
+        )
+        per_text: List[List[Sequence[int]]] = [[] for _ in texts]
+        for ids, text_index in zip(encoded["input_ids"], encoded["overflow_to_sample_mapping"]):
+            per_text[text_index].append(ids)
+        window_ids: List[Sequence[int]] = []
+        windows: List[Tuple[int, int]] = []
+        for text_index, text_windows in enumerate(per_text):
+            for position in select_windows(len(text_windows), max_windows):
+                window_ids.append(text_windows[position])
+                windows.append((text_index, position))
+        return window_ids, windows
+
+    def _tokenize(self, texts: List[str]) -> List[List[int]]:
+        return self._tokenizer(
+            texts,
+            truncation=True,
+            max_length=self.max_length,
+            return_attention_mask=False,
+            return_token_type_ids=False
+        )["input_ids"]
+
+    def pad(self, sequences: List[Sequence[int]], return_tensors: str = "pt") -> Dict[str, Any]:
+        """Right-pad sequences to the longest one and build the model inputs."""
+        width = max(len(ids) for ids in sequences)
+        input_ids = np.full((len(sequences), width), self.pad_token_id, dtype=np.int64)
+        attention_mask = np.zeros((len(sequences), width), dtype=np.int64)
+        for row, ids in enumerate(sequences):
+            input_ids[row, :len(ids)] = ids
+            attention_mask[row, :len(ids)] = 1
+        arrays = {"input_ids": input_ids, "attention_mask": attention_mask}
+        if "token_type_ids" in self.input_names:
+            arrays["token_type_ids"] = np.zeros_like(input_ids)
+        if return_tensors == "pt":
+            import torch
+            return {name: torch.from_numpy(array) for name, array in arrays.items()}
+        return arrays
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pre-truncation and cache counters."""
+        stats: Dict[str, Any] = {
+            "max_chars": self.max_chars,
+            "pretruncated": self.pretruncated,
+            "fallbacks": self.fallbacks
+        }
+        if self.cache is not None:
+            stats["cache"] = self.cache.get_stats()
+        return stats
@@ -0,0 +1,138 @@
+"""
+Torch CPU runtime profile for ``SentimentModel``.
+
+Applies the ``TORCH_*`` settings when the torch backend loads: intra/inter-op
+thread counts, bf16 autocast on CPUs with native bf16 support
+(``MODEL_PRECISION=bf16``), and an optional TorchScript-traced or
+``torch.compile``d graph that is warmed up on fixed shapes before serving.
+Run ``python -m benchmarks runtime`` to measure each setting on a machine.
+"""
+
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+import contextlib
+import logging
+
+import torch
+
+logger = logging.getLogger(__name__)
+
+GRAPH_MODES = ("eager", "trace", "compile")
+
+
+class LogitsModule(torch.nn.Module):
+    """Wrap a Hugging Face classifier so it takes positional tensors and returns logits."""
+
+    def __init__(self, model: torch.nn.Module, input_names: Sequence[str]):
+        super().__init__()
+        self.model = model
+        self.input_names = list(input_names)
+
+    def forward(self, *tensors: torch.Tensor) -> torch.Tensor:
+        return self.model(**dict(zip(self.input_names, tensors))).logits
+
+
+def configure_threads(intra_op: int, inter_op: int) -> Dict[str, int]:
+    """
+    Set torch's intra- and inter-op thread counts (0 keeps torch's default).
+
+    Returns:
+        The thread counts in effect afterwards
+    """
+    if intra_op > 0:
+        torch.set_num_threads(intra_op)
+    if inter_op > 0 and inter_op != torch.get_num_interop_threads():
+        try:
+            torch.set_num_interop_threads(inter_op)
+        except RuntimeError:
+            # Only possible before the first inter-op task, e.g. not after a model reload
+            logger.warning(
+                f"Inter-op thread pool already started, keeping {torch.get_num_interop_threads()} threads"
+            )
+    return {"intra_op": torch.get_num_threads(), "inter_op": torch.get_num_interop_threads()}
+
+
+def bf16_supported() -> bool:
+    """Whether oneDNN has native bf16 kernels on this CPU (AVX512-BF16 or AMX)."""
+    try:
+        return torch.backends.mkldnn.is_available() and torch.ops.mkldnn._is_mkldnn_bf16_supported()
+    except (AttributeError, RuntimeError):
+        return False
+
+
+def autocast(precision: str) -> contextlib.AbstractContextManager:
+    """bf16 autocast for ``precision == 'bf16'``; matmuls run in bf16, softmax and LayerNorm stay fp32."""
+    if precision == "bf16":
+        return torch.autocast("cpu", dtype=torch.bfloat16)
+    return contextlib.nullcontext()
+
+
+def grad_mode(inference_mode: bool) -> contextlib.AbstractContextManager:
+    """``torch.inference_mode`` (no autograd version counters or views) or plain ``no_grad``."""
+    return torch.inference_mode() if inference_mode else torch.no_grad()
+
+
+def warmup_shapes(batch_size: int, max_length: int) -> List[Tuple[int, int]]:
+    """
+    (batch size, sequence length) pairs run before serving a graph.
+
+    ``torch.compile`` specializes on batch size 1 and makes a dimension
+    dynamic only after it has seen it change, so warming up on a single row
+    and on a full batch of another length leaves one graph for single
+    requests and one dynamic graph for everything else.
+    """
+    shapes = [(1, min(16, max_length))]
+    if batch_size > 1:
+        shapes.append((batch_size, min(64, max_length)))
+    return shapes
+
+
+def build_graph(
+    model: torch.nn.Module,
+    mode: str,
+    example_inputs: Dict[str, torch.Tensor],
+    precision: str
+) -> Callable[..., torch.Tensor]:
+    """
+    Build a traced or compiled graph of ``model`` that returns logits.
+
+    ``trace`` records the forward pass with TorchScript, then freezes it
+    (weights become constants) and runs ``optimize_for_inference``, which
+    fuses Linear and activation ops into oneDNN kernels on CPU. With bf16 the
+    trace is recorded under autocast, so the casts are part of the graph.
+    ``compile`` uses ``torch.compile`` with dynamic shapes; it compiles on
+    the first calls, which ``warmup_shapes`` moves to load time.
+
+    Args:
+        model: Loaded classifier in eval mode
+        mode: 'trace' or 'compile'
+        example_inputs: Padded inputs from ``BatchTokenizer.pad``, used for tracing
+        precision: Model precision ('fp32', 'int8' or 'bf16')
+
+    Returns:
+        Callable taking the input tensors in ``example_inputs`` order
+    """
+    wrapper = LogitsModule(model, list(example_inputs)).eval()
+    if mode == "trace":
+        with torch.no_grad(), autocast(precision):
+            # Autocast caches cast weights as constants, which the re-trace check reports as a mismatch
+            traced = torch.jit.trace(wrapper, tuple(example_inputs.values()), strict=False, check_trace=False)
+        graph = torch.jit.freeze(traced)
+        device = next(model.parameters(), torch.empty(0)).device
+        if device.type == "cpu" and precision != "int8":
+            graph = torch.jit.optimize_for_inference(graph)
+        return graph
+    if mode == "compile":
+        return torch.compile(wrapper, dynamic=True)
+    raise ValueError(f"Unknown graph mode: {mode} (expected one of {', '.join(GRAPH_MODES)})")
+
+
+def describe(threads: Dict[str, int], precision: str, graph_mode: str, inference_mode: bool) -> Dict[str, Any]:
+    """Runtime settings in effect, for ``/health`` and benchmark results."""
+    return {
+        **threads,
+        "precision": precision,
+        "graph_mode": graph_mode,
+        "inference_mode": inference_mode,
+        "mkldnn": torch.backends.mkldnn.is_available(),
+        "cpu_capability": torch.backends.cpu.get_cpu_capability()
+    }
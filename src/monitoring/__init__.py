@@ -0,0 +1,22 @@
+"""Monitoring module for Prometheus-style metrics and process memory."""
+
+from .memory import mapped_file_memory, process_memory
+from .metrics import (
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    registry,
+    render_metrics
+)
+
+__all__ = [
+    'Counter',
+    'Gauge',
+    'Histogram',
+    'MetricsRegistry',
+    'registry',
+    'render_metrics',
+    'mapped_file_memory',
+    'process_memory'
+]
@@ -0,0 +1,67 @@
+"""
+Process and mapped-file memory, read from /proc.
+
+``process_memory`` reports the resident and peak resident set size of this
+process. ``mapped_file_memory`` reports how much of a set of memory-mapped
+files is resident in this process, and its proportional share (Pss), which
+drops as more processes map the same pages. Both return None values on
+platforms without /proc.
+"""
+
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+_KB_PER_MB = 1024.0
+
+
+def _mb(kilobytes: Optional[int]) -> Optional[float]:
+    return round(kilobytes / _KB_PER_MB, 1) if kilobytes is not None else None
+
+
+def process_memory() -> Dict[str, Optional[float]]:
+    """Resident (VmRSS) and peak resident (VmHWM) memory of this process in MB."""
+    values: Dict[str, Optional[int]] = {"VmRSS": None, "VmHWM": None}
+    try:
+        with open("/proc/self/status", encoding="ascii") as handle:
+            for line in handle:
+                key, _, rest = line.partition(":")
+                if key in values:
+                    values[key] = int(rest.split()[0])
+    except OSError:
+        try:
+            import resource
+            values["VmHWM"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        except (ImportError, OSError):
+            pass
+    return {"rss_mb": _mb(values["VmRSS"]), "peak_rss_mb": _mb(values["VmHWM"])}
+
+
+def mapped_file_memory(paths: Iterable[Path]) -> Dict[str, Optional[float]]:
+    """
+    Memory of this process's mappings of ``paths`` in MB, from /proc/self/smaps.
+
+    ``rss_mb`` is what is resident in this process, ``shared_mb`` the part
+    also mapped by other processes, and ``pss_mb`` this process's share of
+    it (each shared page divided by the number of processes mapping it).
+    """
+    targets = {str(Path(path).resolve()) for path in paths}
+    totals = {"Rss": 0, "Pss": 0, "Shared_Clean": 0, "Shared_Dirty": 0}
+    try:
+        with open("/proc/self/smaps", encoding="utf-8", errors="replace") as handle:
+            matching = False
+            for line in handle:
+                key, _, rest = line.partition(":")
+                if " " not in key:
+                    if matching and key in totals:
+                        totals[key] += int(rest.split()[0])
+                    continue
+                # Mapping header: address perms offset dev inode [pathname]
+                fields = line.split(None, 5)
+                matching = len(fields) == 6 and fields[5].rstrip("\n") in targets
+    except OSError:
+        return {"rss_mb": None, "pss_mb": None, "shared_mb": None}
+    return {
+        "rss_mb": _mb(totals["Rss"]),
+        "pss_mb": _mb(totals["Pss"]),
+        "shared_mb": _mb(totals["Shared_Clean"] + totals["Shared_Dirty"])
+    }
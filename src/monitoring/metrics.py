@@ -0,0 +1,284 @@
+"""
+Lightweight Prometheus-style metrics.
+
+A dependency-free subset of the Prometheus client: counters, gauges and
+histograms with labels, rendered in the text exposition format. Recording a
+sample is a dict lookup, a lock and a bisect, which keeps the cost on the
+request path to about a microsecond.
+"""
+
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+import threading
+
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+STAGE_BUCKETS: Tuple[float, ...] = (0.0001, 0.00025, 0.0005) + LATENCY_BUCKETS
+SIZE_BUCKETS: Tuple[float, ...] = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value != value:
+        return "NaN"
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric(ABC):
+    """Base class for a metric family with optional labels."""
+
+    TYPE = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], "_Metric"] = {}
+        self._lock = threading.Lock()
+        self._function: Optional[Callable[[], float]] = None
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """Compute the value when scraped instead of on the request path."""
+        self._function = function
+
+    def _read_function(self) -> float:
+        try:
+            return float(self._function())
+        except Exception:
+            return float("nan")
+
+    def labels(self, **labels: str):
+        """Get the child metric for a label combination, creating it once."""
+        key = tuple([labels[name] for name in self.labelnames])
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.get(key)
+                if child is None:
+                    child = self._new_child()
+                    self._children[key] = child
+        return child
+
+    @abstractmethod
+    def _new_child(self) -> "_Metric":
+        """Create the metric holding the value of one label combination."""
+
+    def _samples(self) -> List[Tuple[Tuple[str, ...], "_Metric"]]:
+        if not self.labelnames:
+            return [((), self)]
+        with self._lock:
+            children = list(self._children.items())
+        return sorted(((tuple(str(v) for v in key), child) for key, child in children), key=lambda item: item[0])
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.TYPE}"]
+        for values, child in self._samples():
+            lines.extend(child._render_child(self.name, self.labelnames, values))
+        return lines
+
+    @abstractmethod
+    def _render_child(self, name: str, labelnames: Sequence[str], values: Sequence[str]) -> List[str]:
+        """Sample lines of one label combination, named after the family ``name``."""
+
+
+class Counter(_Metric):
+    """
+    Monotonically increasing value.
+
+    Counter names end in ``_total``, which is added if missing, so the
+    HELP and TYPE lines name the same family as the samples.
+    """
+
+    TYPE = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        if not name.endswith("_total"):
+            name += "_total"
+        super().__init__(name, documentation, labelnames)
+        self._value = 0.0
+
+    def _new_child(self) -> "Counter":
+        return Counter(self.name, self.documentation)
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> float:
+        if self._function is not None:
+            return self._read_function()
+        return self._value
+
+    def _render_child(self, name, labelnames, values):
+        return [f"{name}{_format_labels(labelnames, values)} {_format_value(self.value)}"]
+
+
+class Gauge(_Metric):
+    """Value that can go up and down, or be computed at scrape time."""
+
+    TYPE = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._value = 0.0
+
+    def _new_child(self) -> "Gauge":
+        return Gauge(self.name, self.documentation)
+
+    def set(self, value: float) -> None:
+        self._value = float(value)
+
+    @property
+    def value(self) -> float:
+        if self._function is not None:
+            return self._read_function()
+        return self._value
+
+    def _render_child(self, name, labelnames, values):
+        return [f"{name}{_format_labels(labelnames, values)} {_format_value(self.value)}"]
+
+
+class Histogram(_Metric):
+    """Distribution of observations over fixed buckets."""
+
+    TYPE = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+
+    def _new_child(self) -> "Histogram":
+        return Histogram(self.name, self.documentation, buckets=self.buckets)
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    @property
+    def count(self) -> int:
+        return sum(self._counts)
+
+    def _render_child(self, name, labelnames, values):
+        with self._lock:
+            counts = list(self._counts)
+            total = self._sum
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets + (float("inf"),), counts):
+            cumulative += count
+            le = f'le="{_format_value(bound)}"'
+            lines.append(f"{name}_bucket{_format_labels(labelnames, values, le)} {cumulative}")
+        lines.append(f"{name}_sum{_format_labels(labelnames, values)} {_format_value(total)}")
+        lines.append(f"{name}_count{_format_labels(labelnames, values)} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Collection of metric families rendered together."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                return self._metrics[metric.name]
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+
+def render_metrics() -> str:
+    """Render all registered metrics in the Prometheus text format."""
+    return registry.render()
+
+
+# Request path
+HTTP_REQUESTS = registry.counter(
+    "sentiment_http_requests_total", "HTTP requests by route, method and status.", ("route", "method", "status")
+)
+HTTP_LATENCY = registry.histogram(
+    "sentiment_http_request_duration_seconds", "HTTP request latency by route.", ("route",)
+)
+STAGE_LATENCY = registry.histogram(
+    "sentiment_stage_duration_seconds",
+    "Time spent in each stage of the analyze path.",
+    ("stage",),
+    buckets=STAGE_BUCKETS
+)
+
+# Inference
+INFERENCE_BATCH_SIZE = registry.histogram(
+    "sentiment_inference_batch_size", "Texts per forward pass.", buckets=SIZE_BUCKETS
+)
+SCHEDULER_BATCH_SIZE = registry.histogram(
+    "sentiment_scheduler_batch_size", "Requests coalesced per micro-batch.", buckets=SIZE_BUCKETS
+)
+
+# Gauges and counters read from service state at scrape time
+MODEL_READY = registry.gauge("sentiment_model_ready", "1 when the model is loaded and warmed up.")
+QUEUE_DEPTH = registry.gauge("sentiment_batch_queue_depth", "Requests waiting in the micro-batching queue.")
+WORKER_POOL_ALIVE = registry.gauge("sentiment_worker_pool_alive", "Live inference worker processes.")
+WORKER_POOL_PENDING = registry.gauge("sentiment_worker_pool_pending_batches", "Batches sent to workers and not yet answered.")
+WORKER_POOL_RESTARTS = registry.counter("sentiment_worker_pool_restarts_total", "Inference worker processes restarted.")
+PREDICTIONS = registry.counter(
+    "sentiment_predictions_total", "Predictions served, by model and routing reason.", ("model", "reason")
+)
+CACHE_ENTRIES = registry.gauge("sentiment_cache_entries", "Entries in the in-memory prediction cache.")
+CACHE_BYTES = registry.gauge("sentiment_cache_bytes", "Estimated size of the in-memory prediction cache.")
+CACHE_HITS = registry.counter("sentiment_cache_hits_total", "Prediction cache hits.", ("cache",))
+CACHE_MISSES = registry.counter("sentiment_cache_misses_total", "Prediction cache misses.", ("cache",))
+CACHE_EVICTIONS = registry.counter("sentiment_cache_evictions_total", "Prediction cache LRU evictions.")
+FEEDBACK_PENDING = registry.gauge("sentiment_feedback_buffer_pending", "Feedback records waiting for the next bulk insert.")
+FEEDBACK_FLUSHED = registry.counter("sentiment_feedback_flushed_records_total", "Feedback records written by the write-behind buffer.")
@@ -1,5 +1,27 @@
 """Services module for business logic."""
 
-from .sentiment_service import SentimentService, ServiceError
+from .sentiment_service import (
+    SentimentService,
+    ServiceError,
+    ServiceOverloadedError,
+    ServiceNotReadyError
+)
+from .batch_scheduler import BatchScheduler, QueueFullError, SchedulerStoppedError
+from .prediction_cache import PredictionCache
+from .disk_cache import DiskPredictionCache
+from .worker_pool import InferenceWorkerPool
+from .model_router import ModelRouter
 
-__all__ = ['SentimentService', 'ServiceError']
+__all__ = [
+    'SentimentService',
+    'ServiceError',
+    'ServiceOverloadedError',
+    'ServiceNotReadyError',
+    'BatchScheduler',
+    'QueueFullError',
+    'SchedulerStoppedError',
+    'PredictionCache',
+    'DiskPredictionCache',
+    'InferenceWorkerPool',
+    'ModelRouter'
+]
@@ -0,0 +1,193 @@
+"""
+Dynamic micro-batching scheduler.
+Coalesces concurrent single-text requests into one batched forward pass.
+"""
+
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+import logging
+import queue
+import threading
+import time
+
+from ..monitoring.metrics import SCHEDULER_BATCH_SIZE
+
+
+logger = logging.getLogger(__name__)
+
+
+class BatchScheduler:
+    """
+    Request-coalescing scheduler backed by a bounded queue and one worker thread.
+
+    Callers submit single texts and receive a ``Future``. The worker takes the
+    first queued item, then keeps collecting until either ``max_batch_size``
+    items are gathered or ``max_wait_ms`` has elapsed, runs them as one batch
+    and resolves every caller's future with its own result. Stopping the
+    scheduler fails every request still queued with ``SchedulerStoppedError``.
+    """
+
+    def __init__(
+        self,
+        predict_fn: Callable[[List[str]], Union[List[Dict[str, Any]], Future]],
+        max_batch_size: int,
+        max_wait_ms: float,
+        max_queue_size: int
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            predict_fn: Batch prediction callable, one result per input text.
+                It may also return a Future of those results, so the worker can
+                gather the next batch while e.g. a worker process runs this one
+            max_batch_size: Maximum number of texts per forward pass
+            max_wait_ms: Maximum time to wait for a batch to fill up
+            max_queue_size: Maximum number of pending requests
+        """
+        self._predict_fn = predict_fn
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000.0
+        self._queue: "queue.Queue[Tuple[str, Future]]" = queue.Queue(maxsize=max_queue_size)
+        self._stop_event = threading.Event()
+        self._submit_lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the background worker thread."""
+        if self.is_running():
+            return
+        self._stop_event.clear()
+        self._worker = threading.Thread(
+            target=self._run,
+            name="batch-scheduler",
+            daemon=True
+        )
+        self._worker.start()
+        logger.info(
+            f"BatchScheduler started (max_batch_size={self.max_batch_size}, "
+            f"max_wait_ms={self.max_wait * 1000:g}, max_queue_size={self._queue.maxsize})"
+        )
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the worker after it finishes the current batch and fail the queued requests."""
+        with self._submit_lock:
+            self._stop_event.set()
+        if self._worker is not None:
+            self._worker.join(timeout)
+            self._worker = None
+        failed = 0
+        while True:
+            try:
+                _, future = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if future.set_running_or_notify_cancel():
+                future.set_exception(SchedulerStoppedError("Inference scheduler stopped"))
+                failed += 1
+        if failed:
+            logger.warning(f"BatchScheduler stopped with {failed} queued requests, failed them")
+
+    def is_running(self) -> bool:
+        """Check if the worker thread is alive."""
+        return self._worker is not None and self._worker.is_alive()
+
+    def submit(self, text: str) -> Future:
+        """
+        Queue a text for batched prediction.
+
+        Args:
+            text: Validated text to analyze
+
+        Returns:
+            Future resolving to the prediction for ``text``
+
+        Raises:
+            QueueFullError: If the queue is at capacity
+            SchedulerStoppedError: If the scheduler was stopped
+        """
+        future: Future = Future()
+        # Checked under the lock so nothing is queued after stop() drained the queue
+        with self._submit_lock:
+            if self._stop_event.is_set():
+                raise SchedulerStoppedError("Inference scheduler stopped")
+            try:
+                self._queue.put_nowait((text, future))
+            except queue.Full:
+                raise QueueFullError("Inference queue is full")
+        return future
+
+    def queue_depth(self) -> int:
+        """Get the approximate number of pending requests."""
+        return self._queue.qsize()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get scheduler queue state and limits."""
+        return {
+            "running": self.is_running(),
+            "queue_depth": self.queue_depth(),
+            "max_queue_size": self._queue.maxsize,
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait * 1000
+        }
+
+    def _run(self) -> None:
+        """Worker loop: gather a batch, predict, resolve futures."""
+        while not self._stop_event.is_set():
+            try:
+                first = self._queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
+            batch = [first]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    if remaining > 0:
+                        batch.append(self._queue.get(timeout=remaining))
+                    else:
+                        batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            self._process(batch)
+
+    def _process(self, batch: List[Tuple[str, Future]]) -> None:
+        """Run one batch and hand each caller its result."""
+        batch = [(text, future) for text, future in batch if future.set_running_or_notify_cancel()]
+        if not batch:
+            return
+        SCHEDULER_BATCH_SIZE.observe(len(batch))
+        try:
+            results = self._predict_fn([text for text, _ in batch])
+        except Exception as e:
+            self._resolve(batch, None, e)
+            return
+        if isinstance(results, Future):
+            results.add_done_callback(lambda done: self._resolve(batch, done))
+        else:
+            self._resolve(batch, results)
+
+    @staticmethod
+    def _resolve(batch: List[Tuple[str, Future]], results, error: Optional[BaseException] = None) -> None:
+        """Hand each caller its result, unwrapping a completed Future if needed."""
+        if isinstance(results, Future):
+            error = results.exception()
+            results = None if error is not None else results.result()
+        if error is not None:
+            for _, future in batch:
+                future.set_exception(error)
+            return
+        for (_, future), result in zip(batch, results):
+            future.set_result(result)
+
+
+class QueueFullError(Exception):
+    """Exception raised when the scheduler queue cannot accept more work."""
+    pass
+
+
+class SchedulerStoppedError(Exception):
+    """Exception raised for requests the stopped scheduler will never run."""
+    pass
@@ -0,0 +1,260 @@
+"""
+Persistent second-level prediction cache.
+Stores predictions in a local SQLite file shared by every worker process.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS predictions (
+    key TEXT PRIMARY KEY,
+    model_version TEXT NOT NULL,
+    result TEXT NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_predictions_last_access ON predictions (last_access);
+"""
+
+
+class DiskPredictionCache:
+    """
+    SQLite-backed prediction cache that is safe to share across processes.
+
+    The database runs in WAL mode so readers never block the writer, and
+    every thread (and every forked process) opens its own connection. The
+    table is trimmed back to ``max_entries`` by least recent access every
+    ``trim_interval`` writes. Hits only record their access time in memory;
+    the times are written in one transaction once ``touch_batch`` have
+    accumulated or ``touch_interval`` seconds have passed, and before every
+    trim. Rows from another model version are never served and never
+    touched, so the trim evicts them first. Any storage error is logged and
+    treated as a miss, so a broken cache file only costs a recomputation.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        max_entries: int,
+        trim_interval: int = 256,
+        touch_batch: int = 64,
+        touch_interval: float = 5.0
+    ):
+        """
+        Initialize the cache and create the database if needed.
+
+        Args:
+            path: SQLite file location
+            max_entries: Maximum number of rows kept on disk
+            trim_interval: Number of writes between size checks
+            touch_batch: Pending access times that trigger a write
+            touch_interval: Maximum seconds an access time stays pending
+        """
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.trim_interval = max(1, trim_interval)
+        self.touch_batch = max(1, touch_batch)
+        self.touch_interval = touch_interval
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._touches: Dict[str, float] = {}
+        self._touches_flushed = time.monotonic()
+        self._enabled = True
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self._open()
+
+    def _open(self) -> None:
+        """Create the schema, rebuilding the file if it is corrupted."""
+        try:
+            conn = self._connection()
+            if conn.execute("PRAGMA quick_check").fetchone()[0] != "ok":
+                raise sqlite3.DatabaseError("integrity check failed")
+            conn.executescript(_SCHEMA)
+        except sqlite3.DatabaseError as e:
+            logger.warning(f"Prediction cache at {self.path} is unusable ({e}), rebuilding")
+            self._rebuild()
+
+    def _rebuild(self) -> None:
+        """Move a corrupted database aside and start from an empty one."""
+        self._close()
+        try:
+            for suffix in ("", "-wal", "-shm"):
+                candidate = Path(f"{self.path}{suffix}")
+                if candidate.exists():
+                    candidate.replace(Path(f"{candidate}.corrupt"))
+            self._connection().executescript(_SCHEMA)
+        except (OSError, sqlite3.DatabaseError) as e:
+            logger.error(f"Failed to rebuild prediction cache, disabling it: {e}")
+            self._enabled = False
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get this thread's connection, reopening it after a fork."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=5.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def _close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+            self._local.conn = None
+
+    def _record_error(self, operation: str, error: Exception) -> None:
+        with self._lock:
+            self.errors += 1
+        logger.warning(f"Prediction cache {operation} failed: {error}")
+        if isinstance(error, sqlite3.DatabaseError) and not isinstance(error, sqlite3.OperationalError):
+            self._rebuild()
+
+    def get(self, key: str, model_version: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Look up a prediction made by ``model_version``."""
+        if not self._enabled:
+            return None
+        try:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT model_version, result FROM predictions WHERE key = ?", (key,)
+            ).fetchone()
+            value = None
+            if row is not None and row[0] == (model_version or ""):
+                value = json.loads(row[1])
+        except (sqlite3.Error, ValueError) as e:
+            self._record_error("read", e)
+            value = None
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._touches[key] = time.time()
+            flush = (
+                len(self._touches) >= self.touch_batch
+                or time.monotonic() - self._touches_flushed >= self.touch_interval
+            )
+        if flush:
+            self.flush_touches()
+        return value
+
+    def flush_touches(self) -> int:
+        """Write the pending access times of cache hits in one transaction."""
+        with self._lock:
+            touches, self._touches = self._touches, {}
+            self._touches_flushed = time.monotonic()
+        if not touches or not self._enabled:
+            return 0
+        try:
+            conn = self._connection()
+            conn.execute("BEGIN")
+            try:
+                # Another process may have touched the row more recently
+                conn.executemany(
+                    "UPDATE predictions SET last_access = MAX(last_access, ?) WHERE key = ?",
+                    [(accessed, key) for key, accessed in touches.items()]
+                )
+                conn.execute("COMMIT")
+            except sqlite3.Error:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                raise
+        except sqlite3.Error as e:
+            self._record_error("touch", e)
+            return 0
+        return len(touches)
+
+    def put(self, key: str, model_version: Optional[str], value: Dict[str, Any]) -> None:
+        """Store a prediction made by ``model_version``."""
+        if not self._enabled:
+            return
+        try:
+            self._connection().execute(
+                "INSERT OR REPLACE INTO predictions (key, model_version, result, last_access) "
+                "VALUES (?, ?, ?, ?)",
+                (key, model_version or "", json.dumps(value), time.time())
+            )
+        except sqlite3.Error as e:
+            self._record_error("write", e)
+            return
+        with self._lock:
+            self._writes += 1
+            should_trim = self._writes % self.trim_interval == 0
+        if should_trim:
+            self.trim()
+
+    def trim(self) -> int:
+        """Evict least recently used rows beyond ``max_entries``."""
+        self.flush_touches()
+        try:
+            conn = self._connection()
+            count = conn.execute("SELECT COUNT(*) FROM predictions").fetchone()[0]
+            excess = count - self.max_entries
+            if excess <= 0:
+                return 0
+            conn.execute(
+                "DELETE FROM predictions WHERE key IN "
+                "(SELECT key FROM predictions ORDER BY last_access LIMIT ?)",
+                (excess,)
+            )
+            return excess
+        except sqlite3.Error as e:
+            self._record_error("trim", e)
+            return 0
+
+    def warm(self, model_version: Optional[str], limit: int) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Load the most recently used predictions for ``model_version``.
+
+        Rows of other versions are left alone: other processes sharing the
+        file may still serve them, and the trim evicts them once unused.
+        """
+        if not self._enabled or limit <= 0:
+            return []
+        entries = []
+        try:
+            rows = self._connection().execute(
+                "SELECT key, result FROM predictions WHERE model_version = ? "
+                "ORDER BY last_access DESC LIMIT ?",
+                (model_version or "", limit)
+            ).fetchall()
+            for key, result in rows:
+                try:
+                    entries.append((key, json.loads(result)))
+                except ValueError:
+                    continue
+        except sqlite3.Error as e:
+            self._record_error("warm", e)
+        return entries
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache counters."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self._enabled,
+                "path": str(self.path),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "errors": self.errors
+            }
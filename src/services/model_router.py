@@ -0,0 +1,137 @@
+"""
+Routing between DistilBERT and the fast fallback model.
+Sheds load to the fast model when the DistilBERT path is saturated or slow,
+and tracks the confidence-gated cascade.
+"""
+
+from typing import Any, Dict, Optional, Tuple
+import threading
+import time
+
+from ..monitoring.metrics import PREDICTIONS
+
+
+MODES = ("auto", "fast", "accurate", "cascade")
+
+# Routes returned by ModelRouter.choose
+FAST = "fast"
+PRIMARY = "distilbert"
+CASCADE = "cascade"
+
+
+class ModelRouter:
+    """
+    Decides per request whether the fast model, DistilBERT or the cascade answers.
+
+    Two load signals are tracked: the number of texts currently with
+    DistilBERT (queued in the micro-batcher or running), and an exponential
+    moving average of single-request DistilBERT latency. Crossing either
+    threshold routes ``auto`` requests to the fast model; otherwise they go
+    through the cascade if it is enabled, else to DistilBERT. The latency signal
+    expires after ``latency_ttl`` seconds without a new sample, so while
+    everything is shed some requests reach DistilBERT again and refresh it;
+    the in-flight threshold keeps that probe traffic bounded.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int,
+        max_latency_ms: float,
+        cascade: bool = False,
+        smoothing: float = 0.2,
+        latency_ttl: float = 1.0
+    ):
+        """
+        Initialize the router.
+
+        Args:
+            max_in_flight: DistilBERT texts in flight before shedding (0 disables the signal)
+            max_latency_ms: Average DistilBERT latency before shedding (0 disables the signal)
+            cascade: Send ``auto`` requests through the cascade when not shedding
+            smoothing: Weight of the newest latency sample in the moving average
+            latency_ttl: Seconds after which the latency average stops counting
+        """
+        self.max_in_flight = max_in_flight
+        self.max_latency = max_latency_ms / 1000.0
+        self.smoothing = smoothing
+        self.latency_ttl = latency_ttl
+        self.cascade = cascade
+        self.cascade_accepted = 0
+        self.cascade_escalated = 0
+        self._in_flight = 0
+        self._latency: Optional[float] = None
+        self._latency_at = 0.0
+        self._lock = threading.Lock()
+
+    def choose(self, mode: str, primary_ready: bool, fast_available: bool) -> Tuple[str, str]:
+        """
+        Pick the route for one request.
+
+        Args:
+            mode: 'auto', 'fast', 'accurate' or 'cascade'
+            primary_ready: Whether DistilBERT is loaded and warmed up
+            fast_available: Whether the fast model is loaded
+
+        Returns:
+            (``FAST``, ``PRIMARY`` or ``CASCADE``, reason); the reason also labels the metric
+        """
+        if not fast_available or mode == "accurate":
+            return PRIMARY, "default" if mode == "auto" else "requested"
+        if mode in ("fast", "cascade"):
+            return (FAST if mode == "fast" else CASCADE), "requested"
+        if not primary_ready:
+            return FAST, "not_ready"
+        if self.max_in_flight > 0 and self._in_flight >= self.max_in_flight:
+            return FAST, "queue_depth"
+        if self.max_latency > 0 and self.recent_latency() > self.max_latency:
+            return FAST, "latency"
+        return (CASCADE if self.cascade else PRIMARY), "default"
+
+    def recent_latency(self) -> float:
+        """Average DistilBERT latency in seconds, or 0 if there is no recent sample."""
+        if self._latency is None or time.monotonic() - self._latency_at > self.latency_ttl:
+            return 0.0
+        return self._latency
+
+    def begin(self, count: int = 1) -> None:
+        """Record ``count`` texts handed to DistilBERT."""
+        with self._lock:
+            self._in_flight += count
+
+    def end(self, count: int = 1, latency: Optional[float] = None) -> None:
+        """Record ``count`` texts finished by DistilBERT, with the request latency for single texts."""
+        with self._lock:
+            self._in_flight -= count
+            if latency is not None:
+                if self._latency is None or time.monotonic() - self._latency_at > self.latency_ttl:
+                    self._latency = latency
+                else:
+                    self._latency += self.smoothing * (latency - self._latency)
+                self._latency_at = time.monotonic()
+
+    @staticmethod
+    def record(model: str, reason: str, count: int = 1) -> None:
+        PREDICTIONS.labels(model=model, reason=reason).inc(count)
+
+    def record_cascade(self, accepted: int, escalated: int) -> None:
+        """Count cascade texts answered by the fast model and texts escalated to DistilBERT."""
+        with self._lock:
+            self.cascade_accepted += accepted
+            self.cascade_escalated += escalated
+        if accepted:
+            self.record(FAST, "cascade", accepted)
+
+    def get_stats(self) -> Dict[str, Any]:
+        total = self.cascade_accepted + self.cascade_escalated
+        return {
+            "in_flight": self._in_flight,
+            "recent_latency_ms": round(self.recent_latency() * 1000, 2),
+            "max_in_flight": self.max_in_flight,
+            "max_latency_ms": round(self.max_latency * 1000, 2),
+            "cascade": {
+                "enabled": self.cascade,
+                "accepted": self.cascade_accepted,
+                "escalated": self.cascade_escalated,
+                "escalation_rate": round(self.cascade_escalated / total, 4) if total else None
+            }
+        }
@@ -0,0 +1,138 @@
+"""
+Content-addressed prediction cache.
+Keeps recent model outputs in memory so duplicate reviews skip inference.
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+import copy
+import hashlib
+import json
+import logging
+import threading
+import time
+
+
+logger = logging.getLogger(__name__)
+
+# Rough per-entry bookkeeping cost (OrderedDict node, tuple, key string header)
+_ENTRY_OVERHEAD_BYTES = 200
+
+
+class PredictionCache:
+    """
+    Thread-safe LRU cache of predictions with entry/byte caps and a TTL.
+
+    Keys are hashes of the whitespace-normalized text plus the identity of
+    the checkpoint that produced the prediction, so a model change can never
+    serve stale results. When a different model version is observed the
+    whole cache is dropped to release memory held by the old entries.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int, ttl_seconds: float):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached predictions
+            max_bytes: Approximate memory budget for cached predictions
+            ttl_seconds: Time after which an entry is treated as a miss (0 disables)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[Dict[str, Any], int, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._model_version: Optional[str] = None
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Collapse runs of whitespace so trivially different copies share a key."""
+        return " ".join(text.split())
+
+    @classmethod
+    def make_key(cls, text: str, model_version: Optional[str]) -> str:
+        """Build the cache key for ``text`` scored by ``model_version``."""
+        payload = f"{model_version or ''}\0{cls.normalize(text)}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def ensure_version(self, model_version: Optional[str]) -> None:
+        """Drop all entries if the serving model version has changed."""
+        with self._lock:
+            if model_version == self._model_version:
+                return
+            if self._entries:
+                logger.info(
+                    f"Model version changed ({self._model_version} -> {model_version}), "
+                    f"invalidating {len(self._entries)} cached predictions"
+                )
+                self.invalidations += 1
+            self._entries.clear()
+            self._bytes = 0
+            self._model_version = model_version
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Look up a prediction, refreshing its LRU position on a hit."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, size, expires_at = entry
+            if self.ttl_seconds and time.monotonic() >= expires_at:
+                del self._entries[key]
+                self._bytes -= size
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return copy.deepcopy(value)
+
+    def put(self, key: str, value: Dict[str, Any]) -> None:
+        """Store a prediction, evicting least recently used entries as needed."""
+        size = len(key) + len(json.dumps(value)) + _ENTRY_OVERHEAD_BYTES
+        if size > self.max_bytes or self.max_entries <= 0:
+            return
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = (copy.deepcopy(value), size, expires_at)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache counters and occupancy."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+                "model_version": self._model_version
+            }
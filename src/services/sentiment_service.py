@@ -3,18 +3,48 @@ Sentiment Analysis Service.
 Follows Single Responsibility Principle - handles business logic for sentiment analysis.
 """
 
-from typing import Dict, Any, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+import asyncio
+import gc
 import logging
+import threading
+import time
 
+from ..config.settings import Config
+from ..models.cascade import needs_escalation
+from ..models.factory import create_model
+from ..models.fast_model import FastSentimentModel
 from ..models.sentiment_model import (
     SentimentModel,
+    ModelLoadError,
     ModelNotLoadedError,
     PredictionError
 )
+from ..monitoring import metrics
+from ..monitoring.memory import process_memory
+from .batch_scheduler import BatchScheduler, QueueFullError, SchedulerStoppedError
+from .prediction_cache import PredictionCache
+from .disk_cache import DiskPredictionCache
+from .model_router import CASCADE, FAST, MODES, ModelRouter
+from .worker_pool import InferenceWorkerPool
 
 
 logger = logging.getLogger(__name__)
 
+_VALIDATE_LATENCY = metrics.STAGE_LATENCY.labels(stage="validate")
+_CACHE_LOOKUP_LATENCY = metrics.STAGE_LATENCY.labels(stage="cache_lookup")
+_INFERENCE_LATENCY = metrics.STAGE_LATENCY.labels(stage="inference")
+_CACHE_STORE_LATENCY = metrics.STAGE_LATENCY.labels(stage="cache_store")
+
+# Failures of a single-text analysis, translated by ``_service_error``
+_ANALYZE_ERRORS = (
+    QueueFullError, SchedulerStoppedError, TimeoutError,
+    ModelNotLoadedError, PredictionError, ValueError
+)
+
 
 class SentimentService:
     """
@@ -24,6 +54,19 @@ class SentimentService:
     
     _instance: Optional['SentimentService'] = None
     _model: Optional[SentimentModel] = None
+    _fast_model: Optional[FastSentimentModel] = None
+    _router: Optional[ModelRouter] = None
+    _scheduler: Optional[BatchScheduler] = None
+    _cache: Optional[PredictionCache] = None
+    _disk_cache: Optional[DiskPredictionCache] = None
+    _worker_pool: Optional[InferenceWorkerPool] = None
+    _executor: Optional[ThreadPoolExecutor] = None
+    _state: str = "uninitialized"
+    _startup_timings: Dict[str, float] = {}
+    _init_thread: Optional[threading.Thread] = None
+    _reload_thread: Optional[threading.Thread] = None
+    _reload_status: Dict[str, Any] = {}
+    _reload_lock = threading.Lock()
     
     def __new__(cls):
         """Singleton pattern to ensure only one instance exists."""
@@ -34,45 +77,628 @@ class SentimentService:
     def __init__(self):
         """Initialize the service."""
         if self._model is None:
-            self._model = SentimentModel()
+            self._model = create_model()
+        if self._router is None:
+            self._router = ModelRouter(
+                max_in_flight=Config.FAST_ROUTE_QUEUE_DEPTH,
+                max_latency_ms=Config.FAST_ROUTE_LATENCY_MS,
+                cascade=Config.CASCADE_ENABLED
+            )
+        if self._cache is None and Config.CACHE_ENABLED:
+            self._cache = PredictionCache(
+                max_entries=Config.CACHE_MAX_ENTRIES,
+                max_bytes=Config.CACHE_MAX_BYTES,
+                ttl_seconds=Config.CACHE_TTL_SECONDS
+            )
+        if self._disk_cache is None and Config.DISK_CACHE_ENABLED:
+            self._disk_cache = DiskPredictionCache(
+                path=Config.DISK_CACHE_PATH,
+                max_entries=Config.DISK_CACHE_MAX_ENTRIES
+            )
+        self._register_metrics()
+    
+    def _register_metrics(self) -> None:
+        """Expose queue, worker and cache state as gauges read at scrape time."""
+        metrics.MODEL_READY.set_function(lambda: int(self.is_ready()))
+        metrics.QUEUE_DEPTH.set_function(
+            lambda: self._scheduler.queue_depth() if self._scheduler is not None else 0
+        )
+        metrics.WORKER_POOL_ALIVE.set_function(
+            lambda: self._worker_pool.get_stats()["alive"] if self._worker_pool is not None else 0
+        )
+        metrics.WORKER_POOL_PENDING.set_function(
+            lambda: self._worker_pool.get_stats()["pending_batches"] if self._worker_pool is not None else 0
+        )
+        metrics.WORKER_POOL_RESTARTS.set_function(
+            lambda: self._worker_pool.restarts if self._worker_pool is not None else 0
+        )
+        if self._cache is not None:
+            metrics.CACHE_ENTRIES.set_function(lambda: self._cache.get_stats()["entries"])
+            metrics.CACHE_BYTES.set_function(lambda: self._cache.get_stats()["bytes"])
+            metrics.CACHE_EVICTIONS.set_function(lambda: self._cache.evictions)
+            metrics.CACHE_HITS.labels(cache="memory").set_function(lambda: self._cache.hits)
+            metrics.CACHE_MISSES.labels(cache="memory").set_function(lambda: self._cache.misses)
+        if self._disk_cache is not None:
+            metrics.CACHE_HITS.labels(cache="disk").set_function(lambda: self._disk_cache.hits)
+            metrics.CACHE_MISSES.labels(cache="disk").set_function(lambda: self._disk_cache.misses)
     
-    def initialize(self) -> None:
-        """Initialize and load the model."""
+    def initialize(self, background: bool = False) -> None:
+        """
+        Initialize and load the model.
+        
+        Args:
+            background: Load and warm up the model on a background thread and
+                return immediately; ``get_status`` reports ``warming`` until done
+        """
         logger.info("Initializing SentimentService...")
-        self._model.load()
-        logger.info("SentimentService initialized successfully")
+        # Loaded up front (it takes milliseconds) so it can answer while DistilBERT warms up
+        self._load_fast_model()
+        if not background:
+            self._load_and_warm()
+            return
+        if self._init_thread is not None and self._init_thread.is_alive():
+            return
+        self._state = "warming"
+        self._init_thread = threading.Thread(
+            target=self._load_and_warm,
+            kwargs={"raise_errors": False},
+            name="model-warmup",
+            daemon=True
+        )
+        self._init_thread.start()
+    
+    def _load_and_warm(self, raise_errors: bool = True) -> None:
+        """Load the model, run one warmup forward pass and start workers."""
+        self._state = "warming"
+        try:
+            start = time.perf_counter()
+            # Import outside the model's frames, see SentimentModel.import_dependencies
+            self._model.import_dependencies()
+            imported = time.perf_counter()
+            self._model.load()
+            loaded = time.perf_counter()
+            self._model.predict("Warmup review to initialize the inference path.")
+            warmed = time.perf_counter()
+            self._warm_cache()
+            self._start_worker_pool()
+            self._start_scheduler()
+            self._startup_timings = {
+                **self._model.load_timings,
+                "import_s": round(imported - start, 3),
+                "load_total_s": round(loaded - start, 3),
+                "warmup_s": round(warmed - loaded, 3)
+            }
+            self._state = "ready"
+            logger.info(f"SentimentService initialized successfully (timings {self._startup_timings})")
+        except Exception as e:
+            self._state = "failed"
+            logger.error(f"Failed to initialize SentimentService: {e}")
+            if raise_errors:
+                raise
+    
+    def _load_fast_model(self) -> None:
+        """Load the fast fallback model if enabled; the service runs without it if that fails."""
+        if not Config.FAST_MODEL_ENABLED or self._fast_model is not None:
+            return
+        model = FastSentimentModel(Config.FAST_MODEL_PATH)
+        try:
+            model.load()
+        except ModelLoadError as e:
+            logger.warning(f"Fast fallback model unavailable, serving DistilBERT only: {e}")
+            return
+        self._fast_model = model
+    
+    def _start_worker_pool(self) -> None:
+        """Start inference worker processes if enabled."""
+        if Config.INFERENCE_WORKERS <= 0:
+            return
+        if self._worker_pool is None:
+            self._worker_pool = self._create_worker_pool(self._model)
+        self._worker_pool.start()
+    
+    @staticmethod
+    def _create_worker_pool(model: SentimentModel) -> InferenceWorkerPool:
+        """Pool whose workers each load the checkpoint of ``model`` with the current backend."""
+        return InferenceWorkerPool(
+            model_factory=partial(create_model, Config.MODEL_BACKEND, model.model_path),
+            num_workers=Config.INFERENCE_WORKERS,
+            threads_per_worker=Config.INFERENCE_THREADS_PER_WORKER,
+            task_timeout=Config.INFERENCE_TASK_TIMEOUT
+        )
+    
+    def reload_model(self, model_path: Optional[Path] = None, background: bool = True) -> bool:
+        """
+        Load a checkpoint and swap it in without a restart.
+        
+        The new model is loaded and warmed up (with its own worker pool, if
+        workers are on) while the current one keeps serving. The swap is a
+        single reference assignment read once per batch, so every batch runs
+        entirely on the old or the new model, and batches already running
+        finish on the old one before it is released.
+        
+        Args:
+            model_path: Checkpoint directory (defaults to ``Config.MODEL_PATH``)
+            background: Return immediately; progress is reported by ``get_status``
+            
+        Returns:
+            False if a reload is already in progress
+            
+        Raises:
+            ServiceError: If a foreground reload fails
+        """
+        with self._reload_lock:
+            if self._reload_thread is not None and self._reload_thread.is_alive():
+                return False
+            self._reload_status = {
+                "state": "loading",
+                "model_path": str(model_path or Config.MODEL_PATH),
+                "started_at": time.time()
+            }
+            self._reload_thread = threading.Thread(
+                target=self._reload,
+                args=(model_path,),
+                name="model-reload",
+                daemon=True
+            )
+            self._reload_thread.start()
+        if not background:
+            self._reload_thread.join()
+            if self._reload_status["state"] == "failed":
+                raise ServiceError(f"Model reload failed: {self._reload_status['error']}")
+        return True
+    
+    def _reload(self, model_path: Optional[Path]) -> None:
+        """Reload thread: load and warm the replacement, swap it in, release the old model."""
+        try:
+            start = time.perf_counter()
+            model = create_model(model_path=model_path)
+            model.load()
+            loaded = time.perf_counter()
+            model.predict("Warmup review to initialize the inference path.")
+            warmed = time.perf_counter()
+            pool = None
+            if self._worker_pool is not None:
+                pool = self._create_worker_pool(model)
+                pool.start()
+            
+            old_model, old_pool = self._model, self._worker_pool
+            self._worker_pool = pool
+            self._model = model
+            self._warm_cache()
+            logger.info(f"Swapped model {old_model.version} -> {model.version}")
+            
+            if old_pool is not None:
+                old_pool.stop(drain_timeout=Config.INFERENCE_TASK_TIMEOUT)
+            previous_version = old_model.version
+            del old_model, old_pool
+            self._release_memory()
+            
+            self._reload_status = {
+                **self._reload_status,
+                "state": "ready",
+                "model_version": model.version,
+                "previous_version": previous_version,
+                "timings": {
+                    **model.load_timings,
+                    "load_total_s": round(loaded - start, 3),
+                    "warmup_s": round(warmed - loaded, 3),
+                    "total_s": round(time.perf_counter() - start, 3)
+                }
+            }
+        except Exception as e:
+            self._reload_status = {**self._reload_status, "state": "failed", "error": str(e)}
+            logger.error(f"Model reload failed, still serving {self._model.version}: {e}")
+    
+    @staticmethod
+    def _release_memory() -> None:
+        """
+        Collect the replaced model and return cached GPU memory.
+        
+        Nothing in the service calls ``gc.freeze``, so the old model is never
+        pinned in the permanent generation and is freed here.
+        """
+        gc.collect()
+        try:
+            import torch
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
+        except ImportError:
+            pass
     
-    def analyze(self, text: str) -> Dict[str, Any]:
+    def _start_scheduler(self) -> None:
+        """Start the micro-batching scheduler if enabled."""
+        if Config.BATCHING_ENABLED:
+            if self._scheduler is None:
+                self._scheduler = BatchScheduler(
+                    predict_fn=self._submit_batch,
+                    max_batch_size=Config.BATCHING_MAX_BATCH_SIZE,
+                    max_wait_ms=Config.BATCHING_MAX_WAIT_MS,
+                    max_queue_size=Config.BATCHING_QUEUE_DEPTH
+                )
+            self._scheduler.start()
+    
+    def analyze(self, text: str, mode: Optional[str] = None) -> Dict[str, Any]:
         """
         Analyze sentiment of the given text.
         
         Args:
             text: Text to analyze
+            mode: 'auto' (default) lets the router shed load to the fast
+                model, 'fast' asks for it, 'accurate' always uses DistilBERT,
+                'cascade' escalates only uncertain fast answers to DistilBERT
             
         Returns:
-            Analysis result with sentiment, confidence, and scores
+            Analysis result with sentiment, confidence, scores and the
+            ``model`` that answered
             
         Raises:
+            ServiceOverloadedError: If the inference queue is full or the
+                prediction takes longer than ``BATCHING_RESULT_TIMEOUT``
+            ServiceNotReadyError: If the model is still loading
             ServiceError: If analysis fails
         """
         try:
-            # Validate input
-            text = self._validate_input(text)
+            text, mode, validated = self._prepare_request(text, mode)
+            
+            # Serve duplicates from the prediction cache
+            cached = self._cache_get(self._cache_key(text))
+            looked_up = time.perf_counter()
+            _CACHE_LOOKUP_LATENCY.observe(looked_up - validated)
+            if cached is not None:
+                return cached
+            
+            answered, reason = self._answer_without_inference(text, mode)
+            if answered is not None:
+                return answered
+            
+            # Get prediction, coalesced with concurrent requests when batching is on
+            self._router.begin()
+            try:
+                if self._scheduler is not None and self._scheduler.is_running():
+                    future = self._scheduler.submit(text)
+                    try:
+                        result = future.result(timeout=Config.BATCHING_RESULT_TIMEOUT)
+                    except TimeoutError:
+                        # Still queued: drop it; already running: its result is discarded
+                        future.cancel()
+                        raise
+                else:
+                    result = self._predict_batch([text])[0]
+            except QueueFullError as e:
+                return self._queue_full_fallback(text, e)
+            finally:
+                self._router.end(latency=time.perf_counter() - looked_up)
+            predicted = self._record_inference(result, reason, looked_up)
             
-            # Get prediction
-            result = self._model.predict(text)
+            self._cache_put(text, result)
+            _CACHE_STORE_LATENCY.observe(time.perf_counter() - predicted)
             
             logger.debug(f"Analysis complete: {result['sentiment']} ({result['confidence']}%)")
             return result
             
-        except ModelNotLoadedError:
+        except _ANALYZE_ERRORS as e:
+            raise self._service_error(e)
+    
+    async def analyze_async(self, text: str, mode: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Async counterpart of ``analyze`` for the ASGI app.
+        
+        Validation runs inline. Nothing that blocks runs on the event loop:
+        with the disk cache on, cache reads and writes run on the loop's
+        default executor, and inference is awaited. With batching on, the
+        request's future from the micro-batching scheduler is awaited
+        directly, otherwise the forward pass runs on the inference executor.
+        A waiting request therefore holds no thread.
+        
+        Raises:
+            ServiceOverloadedError: If the inference queue is full or the
+                prediction takes longer than ``BATCHING_RESULT_TIMEOUT``
+            ServiceNotReadyError: If the model is still loading
+            ServiceError: If analysis fails
+        """
+        try:
+            text, mode, validated = self._prepare_request(text, mode)
+            
+            cached = await self._cache_io(self._cache_get, self._cache_key(text))
+            looked_up = time.perf_counter()
+            _CACHE_LOOKUP_LATENCY.observe(looked_up - validated)
+            if cached is not None:
+                return cached
+            
+            answered, reason = self._answer_without_inference(text, mode)
+            if answered is not None:
+                return answered
+            
+            self._router.begin()
+            try:
+                if self._scheduler is not None and self._scheduler.is_running():
+                    # Cancelling the wrapper on timeout cancels the queued request too
+                    result = await asyncio.wait_for(
+                        asyncio.wrap_future(self._scheduler.submit(text)),
+                        timeout=Config.BATCHING_RESULT_TIMEOUT
+                    )
+                else:
+                    loop = asyncio.get_running_loop()
+                    result = (await loop.run_in_executor(self._inference_executor(), self._predict_batch, [text]))[0]
+            except QueueFullError as e:
+                return self._queue_full_fallback(text, e)
+            finally:
+                self._router.end(latency=time.perf_counter() - looked_up)
+            predicted = self._record_inference(result, reason, looked_up)
+            
+            await self._cache_io(self._cache_put, text, result)
+            _CACHE_STORE_LATENCY.observe(time.perf_counter() - predicted)
+            return result
+            
+        except _ANALYZE_ERRORS as e:
+            raise self._service_error(e)
+    
+    def _prepare_request(self, text: Any, mode: Optional[str]) -> Tuple[str, str, float]:
+        """Validate one ``analyze`` request; returns the clean text, the mode and when validation finished."""
+        start = time.perf_counter()
+        mode = self._validate_mode(mode)
+        text = self._validate_input(text)
+        validated = time.perf_counter()
+        _VALIDATE_LATENCY.observe(validated - start)
+        return text, mode, validated
+    
+    def _answer_without_inference(self, text: str, mode: str) -> Tuple[Optional[Dict[str, Any]], str]:
+        """
+        Route a request, answering it with the fast model when the route allows.
+        
+        Returns:
+            The fast model's result, or None if DistilBERT has to answer;
+            and the routing reason to record
+        """
+        route, reason = self._choose_model(mode)
+        if route == FAST:
+            return self._predict_fast([text], reason)[0], reason
+        if route == CASCADE:
+            fast_result = self._cascade_first_stage(text)
+            if fast_result is not None:
+                return fast_result, reason
+            reason = "cascade_escalated"
+        return None, reason
+    
+    def _queue_full_fallback(self, text: str, error: QueueFullError) -> Dict[str, Any]:
+        """Answer with the fast model when the inference queue is full; without one, re-raise ``error``."""
+        if self._fast_model is None:
+            raise error
+        return self._predict_fast([text], "queue_full")[0]
+    
+    def _record_inference(self, result: Dict[str, Any], reason: str, looked_up: float) -> float:
+        """Record the inference latency and the model that answered; returns when inference finished."""
+        predicted = time.perf_counter()
+        _INFERENCE_LATENCY.observe(predicted - looked_up)
+        self._router.record(result.get("model", SentimentModel.NAME), reason)
+        return predicted
+    
+    async def _cache_io(self, operation: Callable[..., Any], *args: Any) -> Any:
+        """Run a cache read or write, off the event loop when it may query the SQLite disk cache."""
+        if self._disk_cache is None:
+            return operation(*args)
+        return await asyncio.get_running_loop().run_in_executor(None, operation, *args)
+    
+    async def analyze_batch_async(self, texts: List[Any], mode: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Async counterpart of ``analyze_batch``, run on the inference executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._inference_executor(), self.analyze_batch, texts, mode)
+    
+    def _choose_model(self, mode: str) -> Tuple[str, str]:
+        """Ask the router which route (fast model, DistilBERT or cascade) answers this request."""
+        return self._router.choose(mode, self.is_ready(), self._fast_model is not None)
+    
+    def _cascade_first_stage(self, text: str) -> Optional[Dict[str, Any]]:
+        """Score ``text`` with the fast model; return the result if confident, else None to escalate."""
+        result = self._fast_model.predict(text)
+        if needs_escalation(result, Config.CASCADE_MIN_CONFIDENCE):
+            self._router.record_cascade(accepted=0, escalated=1)
+            return None
+        self._router.record_cascade(accepted=1, escalated=0)
+        return result
+    
+    def _predict_fast(self, texts: List[str], reason: str) -> List[Dict[str, Any]]:
+        """Answer with the fast model; its results are not cached, DistilBERT's are preferred."""
+        results = self._fast_model.predict_batch(texts)
+        self._router.record(FastSentimentModel.NAME, reason, len(texts))
+        return results
+    
+    @staticmethod
+    def _validate_mode(mode: Optional[str]) -> str:
+        if mode is None:
+            return "auto"
+        if not isinstance(mode, str) or mode.lower() not in MODES:
+            raise ValueError(f"Mode must be one of {', '.join(MODES)}")
+        return mode.lower()
+    
+    def _inference_executor(self) -> ThreadPoolExecutor:
+        """Threads that run forward passes for async callers when batching is off."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=Config.ASYNC_INFERENCE_THREADS,
+                thread_name_prefix="async-inference"
+            )
+        return self._executor
+    
+    @staticmethod
+    def _service_error(error: Exception) -> "ServiceError":
+        """Translate a scheduler, model or validation error into the service error to raise."""
+        if isinstance(error, QueueFullError):
+            logger.warning("Inference queue full, rejecting request")
+            return ServiceOverloadedError("Service is overloaded. Please try again later.")
+        if isinstance(error, TimeoutError):
+            logger.warning(f"No prediction within {Config.BATCHING_RESULT_TIMEOUT:g}s, rejecting request")
+            return ServiceOverloadedError("Service is overloaded. Please try again later.")
+        if isinstance(error, SchedulerStoppedError):
+            logger.warning("Inference scheduler stopped, rejecting request")
+            return ServiceNotReadyError("Service is shutting down. Please try again later.")
+        if isinstance(error, ModelNotLoadedError):
             logger.error("Model not loaded")
-            raise ServiceError("Service not initialized. Please try again later.")
-        except PredictionError as e:
-            logger.error(f"Prediction error: {e}")
-            raise ServiceError("Failed to analyze text. Please try again.")
+            return ServiceNotReadyError("Service not initialized. Please try again later.")
+        if isinstance(error, PredictionError):
+            logger.error(f"Prediction error: {error}")
+            return ServiceError("Failed to analyze text. Please try again.")
+        return ServiceError(str(error))
+    
+    def analyze_batch(self, texts: List[Any], mode: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Analyze sentiment of many texts in as few forward passes as possible.
+        
+        Invalid items do not fail the batch; each one gets an ``error``
+        entry in place of a prediction while the valid items are scored.
+        
+        Args:
+            texts: Texts to analyze
+            mode: 'auto', 'fast', 'accurate' or 'cascade', as for
+                ``analyze``; with the cascade only the uncertain texts are
+                sent to DistilBERT, together in one batch
+            
+        Returns:
+            One result per input, in input order
+            
+        Raises:
+            ServiceError: If the batch itself is invalid or inference fails
+        """
+        if not isinstance(texts, list):
+            raise ServiceError("Texts must be a list")
+        if not texts:
+            raise ServiceError("Texts cannot be empty")
+        if len(texts) > Config.MAX_BATCH_ITEMS:
+            raise ServiceError(f"Too many texts (max {Config.MAX_BATCH_ITEMS} per batch)")
+        try:
+            mode = self._validate_mode(mode)
         except ValueError as e:
             raise ServiceError(str(e))
+        
+        results: List[Dict[str, Any]] = [{} for _ in texts]
+        valid_indices = []
+        valid_texts = []
+        for i, text in enumerate(texts):
+            try:
+                if text is not None and not isinstance(text, str):
+                    raise ValueError("Text must be a string")
+                text = self._validate_input(text)
+            except ValueError as e:
+                results[i] = {"error": str(e)}
+                continue
+            cache_key = self._cache_key(text)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                results[i] = cached
+                continue
+            valid_texts.append(text)
+            valid_indices.append(i)
+        
+        if not valid_texts:
+            return results
+        
+        route, reason = self._choose_model(mode)
+        if route == FAST:
+            for i, prediction in zip(valid_indices, self._predict_fast(valid_texts, reason)):
+                results[i] = prediction
+            return results
+        if route == CASCADE:
+            uncertain_indices, uncertain_texts = [], []
+            for i, text, prediction in zip(valid_indices, valid_texts, self._fast_model.predict_batch(valid_texts)):
+                if needs_escalation(prediction, Config.CASCADE_MIN_CONFIDENCE):
+                    uncertain_indices.append(i)
+                    uncertain_texts.append(text)
+                else:
+                    results[i] = prediction
+            self._router.record_cascade(len(valid_texts) - len(uncertain_texts), len(uncertain_texts))
+            if not uncertain_texts:
+                return results
+            valid_indices, valid_texts, reason = uncertain_indices, uncertain_texts, "cascade_escalated"
+        
+        self._router.begin(len(valid_texts))
+        try:
+            predictions = self._predict_batch(valid_texts)
+        except ModelNotLoadedError:
+            logger.error("Model not loaded")
+            raise ServiceNotReadyError("Service not initialized. Please try again later.")
+        except PredictionError as e:
+            logger.error(f"Batch prediction error: {e}")
+            raise ServiceError("Failed to analyze texts. Please try again.")
+        finally:
+            self._router.end(len(valid_texts))
+        self._router.record(SentimentModel.NAME, reason, len(valid_texts))
+        
+        for i, text, prediction in zip(valid_indices, valid_texts, predictions):
+            results[i] = prediction
+            self._cache_put(text, prediction)
+        
+        logger.debug(f"Batch analysis complete: {len(valid_texts)}/{len(texts)} items scored")
+        return results
+    
+    def _pool_running(self) -> bool:
+        return self._worker_pool is not None and self._worker_pool.is_running()
+    
+    def _predict_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """Run inference in-process or spread it across the worker pool."""
+        if not self._pool_running():
+            return self._model.predict_batch(texts)
+        futures = [
+            self._worker_pool.submit_batch(texts[i:i + Config.BATCH_SIZE])
+            for i in range(0, len(texts), Config.BATCH_SIZE)
+        ]
+        return [result for future in futures for result in future.result()]
+    
+    def _submit_batch(self, texts: List[str]) -> Union[List[Dict[str, Any]], Future]:
+        """Scheduler hook: hand batches to the worker pool without waiting on them."""
+        if self._pool_running():
+            return self._worker_pool.submit_batch(texts)
+        return self._model.predict_batch(texts)
+    
+    def _cache_key(self, text: str) -> Optional[str]:
+        """Get the prediction cache key for ``text``, or None if caching is off."""
+        if self._cache is None and self._disk_cache is None:
+            return None
+        version = self._model.version
+        if self._cache is not None:
+            self._cache.ensure_version(version)
+        return PredictionCache.make_key(text, version)
+    
+    def _cache_get(self, key: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Look up a prediction in memory first, then on disk."""
+        if key is None:
+            return None
+        if self._cache is not None:
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+        if self._disk_cache is not None:
+            cached = self._disk_cache.get(key, self._model.version)
+            if cached is not None and self._cache is not None:
+                self._cache.put(key, cached)
+            return cached
+        return None
+    
+    def _cache_put(self, text: str, result: Dict[str, Any]) -> None:
+        """
+        Store a prediction in every enabled cache level.
+        
+        The key uses the version of the model that produced ``result``, which
+        differs from the serving one when a reload swapped models mid-request.
+        """
+        if self._cache is None and self._disk_cache is None:
+            return
+        version = result.get("model_version", self._model.version)
+        key = PredictionCache.make_key(text, version)
+        if self._cache is not None and version == self._model.version:
+            self._cache.put(key, result)
+        if self._disk_cache is not None:
+            self._disk_cache.put(key, version, result)
+    
+    def _warm_cache(self) -> None:
+        """Preload the in-memory cache with recent predictions from disk."""
+        if self._cache is None or self._disk_cache is None:
+            return
+        version = self._model.version
+        self._cache.ensure_version(version)
+        entries = self._disk_cache.warm(version, Config.DISK_CACHE_WARM_ENTRIES)
+        for key, value in reversed(entries):
+            self._cache.put(key, value)
+        logger.info(f"Warmed prediction cache with {len(entries)} entries from disk")
     
     def _validate_input(self, text: str) -> str:
         """
@@ -102,17 +728,59 @@ class SentimentService:
     
     def is_ready(self) -> bool:
         """Check if the service is ready to handle requests."""
-        return self._model is not None and self._model.is_loaded()
+        return self._model is not None and self._model.is_loaded() and self._state == "ready"
     
     def get_status(self) -> Dict[str, Any]:
-        """Get service status information."""
-        return {
+        """Get service status information, from each component's ``get_stats``."""
+        status = {
             "ready": self.is_ready(),
-            "model_loaded": self._model.is_loaded() if self._model else False,
-            "device": str(self._model.device) if self._model else None
+            "state": self._state,
+            "startup_timings": self._startup_timings,
+            "backend": Config.MODEL_BACKEND,
+            "memory": {"process": process_memory()}
         }
+        if self._model is not None:
+            status.update(self._model.get_stats())
+            status["memory"]["model"] = self._model.memory_usage()
+        else:
+            status.update(model_loaded=False, device=None, precision=None, model_version=None, model_path=None)
+        if self._reload_status:
+            status["reload"] = self._reload_status
+        if self._fast_model is not None:
+            status["fast_model"] = {**self._fast_model.get_stats(), "routing": self._router.get_stats()}
+        if self._scheduler is not None:
+            status["batching"] = self._scheduler.get_stats()
+        if self._worker_pool is not None:
+            status["worker_pool"] = self._worker_pool.get_stats()
+        if self._cache is not None:
+            status["cache"] = self._cache.get_stats()
+        if self._disk_cache is not None:
+            status["disk_cache"] = self._disk_cache.get_stats()
+        return status
+    
+    def shutdown(self) -> None:
+        """Stop background workers."""
+        if self._scheduler is not None:
+            self._scheduler.stop()
+        if self._worker_pool is not None:
+            self._worker_pool.stop()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        if self._disk_cache is not None:
+            self._disk_cache.flush_touches()
 
 
 class ServiceError(Exception):
     """Exception raised for service-level errors."""
     pass
+
+
+class ServiceOverloadedError(ServiceError):
+    """Exception raised when the service cannot accept more work."""
+    pass
+
+
+class ServiceNotReadyError(ServiceError):
+    """Exception raised when the model is not loaded yet."""
+    pass
@@ -0,0 +1,292 @@
+"""
+Multi-process inference worker pool.
+Scales CPU inference across processes, each running its own copy of the model.
+"""
+
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import itertools
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+import time
+
+from ..config.settings import Config
+from ..models.sentiment_model import BaseModel, PredictionError
+
+
+logger = logging.getLogger(__name__)
+
+WARMUP_TEXT = "Warmup review to initialize the inference path."
+
+
+def _worker_main(
+    model_factory: Callable[[], BaseModel],
+    settings: Dict[str, Any],
+    tasks,
+    results,
+    threads: int
+) -> None:
+    """
+    Worker process: load and warm up a model, then run batches from ``tasks``.
+
+    Reports ``(None, pid, None)`` on ``results`` once ready, or
+    ``(None, None, error)`` if the model cannot be loaded.
+    """
+    # Before the tokenizer first runs: each worker handles one batch at a time
+    os.environ["TOKENIZERS_PARALLELISM"] = "false"
+    for name, value in settings.items():
+        setattr(Config, name, value)
+
+    import torch
+
+    torch.set_num_threads(threads)
+    torch.set_num_interop_threads(1)
+    try:
+        model = model_factory()
+        model.load()
+        model.predict(WARMUP_TEXT)
+    except Exception as e:
+        results.put((None, None, PredictionError(f"Inference worker could not load the model: {e}")))
+        return
+    results.put((None, os.getpid(), None))
+
+    while True:
+        task = tasks.get()
+        if task is None:
+            break
+        task_id, texts = task
+        try:
+            results.put((task_id, model.predict_batch(texts), None))
+        except Exception as e:
+            results.put((task_id, None, PredictionError(str(e))))
+
+
+def _config_snapshot() -> Dict[str, Any]:
+    """Current settings, applied in each worker so runtime overrides of ``Config`` carry over."""
+    return {name: value for name, value in vars(Config).items() if name.isupper()}
+
+
+class InferenceWorkerPool:
+    """
+    Pool of spawned inference processes fed from one shared task queue.
+
+    Workers are started with ``spawn``, not forked: by the time the pool
+    starts, the parent has run inference (so torch's OpenMP pool and the
+    tokenizer's thread pool exist) and runs several threads, and forking
+    such a process can deadlock the child. Each worker therefore builds its
+    model with ``model_factory``, warms it up and reports ready before the
+    pool accepts work. With ``MODEL_LOAD_MMAP=True`` the workers map the same
+    safetensors files, so the weights are held once in the page cache rather
+    than once per worker. Each worker gets its own slice of the CPU through
+    ``threads_per_worker``. A collector thread in the parent resolves
+    callers' futures as results come back, and restarts workers that die.
+    """
+
+    def __init__(
+        self,
+        model_factory: Callable[[], BaseModel],
+        num_workers: int,
+        threads_per_worker: int,
+        task_timeout: float,
+        start_timeout: float = 300.0
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            model_factory: Picklable callable returning an unloaded model, called in each worker
+            num_workers: Number of worker processes
+            threads_per_worker: Torch intra-op threads per worker
+            task_timeout: Seconds to wait for a batch before failing it
+            start_timeout: Seconds to wait for the workers to load their models
+        """
+        self._model_factory = model_factory
+        self.num_workers = num_workers
+        self.threads_per_worker = max(1, threads_per_worker)
+        self.task_timeout = task_timeout
+        self.start_timeout = start_timeout
+        self._context = multiprocessing.get_context("spawn")
+        self._tasks = self._context.Queue(maxsize=num_workers * 2)
+        self._results = self._context.Queue()
+        self._workers: List[multiprocessing.Process] = []
+        self._pending: Dict[int, Tuple[Future, float]] = {}
+        self._lock = threading.Lock()
+        self._ids = itertools.count()
+        self._collector: Optional[threading.Thread] = None
+        self._running = False
+        self.restarts = 0
+
+    def start(self) -> None:
+        """
+        Start the worker processes and wait until each has loaded its model.
+
+        Raises:
+            RuntimeError: If a worker fails to load the model or does not
+                become ready within ``start_timeout``
+        """
+        if self._running:
+            return
+        self._workers = [self._spawn() for _ in range(self.num_workers)]
+        try:
+            self._wait_until_ready()
+        except RuntimeError:
+            self._terminate_workers()
+            raise
+        self._running = True
+        self._collector = threading.Thread(target=self._collect, name="worker-pool-collector", daemon=True)
+        self._collector.start()
+        logger.info(
+            f"InferenceWorkerPool started {self.num_workers} workers "
+            f"with {self.threads_per_worker} threads each"
+        )
+
+    def _wait_until_ready(self) -> None:
+        deadline = time.monotonic() + self.start_timeout
+        ready = 0
+        while ready < len(self._workers):
+            try:
+                _, _, error = self._results.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                raise RuntimeError(
+                    f"Only {ready} of {len(self._workers)} inference workers ready after {self.start_timeout}s"
+                )
+            if error is not None:
+                raise RuntimeError(str(error))
+            ready += 1
+
+    def _spawn(self) -> multiprocessing.Process:
+        process = self._context.Process(
+            target=_worker_main,
+            args=(self._model_factory, _config_snapshot(), self._tasks, self._results, self.threads_per_worker),
+            name="inference-worker",
+            daemon=True
+        )
+        process.start()
+        return process
+
+    def _terminate_workers(self) -> None:
+        for process in self._workers:
+            if process.is_alive():
+                process.terminate()
+            process.join(timeout=1.0)
+        self._workers = []
+
+    def stop(self, drain_timeout: float = 0.0) -> None:
+        """
+        Stop the workers and fail any batches still in flight.
+
+        Args:
+            drain_timeout: Seconds to let already-submitted batches finish first
+        """
+        if not self._running:
+            return
+        deadline = time.monotonic() + drain_timeout
+        while time.monotonic() < deadline:
+            with self._lock:
+                if not self._pending:
+                    break
+            time.sleep(0.01)
+        self._running = False
+        for _ in self._workers:
+            try:
+                self._tasks.put(None, timeout=1.0)
+            except queue.Full:
+                break
+        for process in self._workers:
+            process.join(timeout=5.0)
+            if process.is_alive():
+                process.terminate()
+                process.join(timeout=1.0)
+            if not process.is_alive():
+                process.close()
+        self._workers = []
+        if self._collector is not None:
+            self._collector.join(timeout=2.0)
+            self._collector = None
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        for future, _ in pending.values():
+            future.set_exception(PredictionError("Worker pool stopped"))
+
+    def is_running(self) -> bool:
+        return self._running
+
+    def submit_batch(self, texts: List[str]) -> Future:
+        """
+        Queue a batch for a worker process.
+
+        Blocks while all workers are busy and the task queue is full, which
+        pushes back on the caller instead of buffering unbounded work.
+        """
+        future: Future = Future()
+        task_id = next(self._ids)
+        with self._lock:
+            self._pending[task_id] = (future, time.monotonic() + self.task_timeout)
+        try:
+            self._tasks.put((task_id, texts), timeout=self.task_timeout)
+        except queue.Full:
+            with self._lock:
+                self._pending.pop(task_id, None)
+            future.set_exception(PredictionError("Timed out waiting for an inference worker"))
+        return future
+
+    def predict_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """Run a batch on a worker process and wait for the results."""
+        return self.submit_batch(texts).result()
+
+    def _collect(self) -> None:
+        last_sweep = time.monotonic()
+        while self._running:
+            try:
+                task_id, results, error = self._results.get(timeout=1.0)
+            except queue.Empty:
+                task_id, error = None, None
+            except (EOFError, OSError):
+                break
+            if task_id is None and error is not None:
+                # A restarted worker could not load the model; it is retried on the next sweep
+                logger.error(f"Inference worker failed to start: {error}")
+            elif task_id is not None:
+                with self._lock:
+                    entry = self._pending.pop(task_id, None)
+                if entry is not None:
+                    if error is not None:
+                        entry[0].set_exception(error)
+                    else:
+                        entry[0].set_result(results)
+            if time.monotonic() - last_sweep >= 1.0:
+                self._restart_dead_workers()
+                self._expire_pending()
+                last_sweep = time.monotonic()
+
+    def _expire_pending(self) -> None:
+        """Fail batches whose worker never answered, e.g. because it crashed."""
+        now = time.monotonic()
+        with self._lock:
+            expired = [task_id for task_id, (_, deadline) in self._pending.items() if deadline <= now]
+            futures = [self._pending.pop(task_id)[0] for task_id in expired]
+        for future in futures:
+            future.set_exception(PredictionError("Inference worker timed out"))
+
+    def _restart_dead_workers(self) -> None:
+        for i, process in enumerate(self._workers):
+            if self._running and not process.is_alive():
+                logger.error(f"Inference worker {process.pid} exited with code {process.exitcode}, restarting")
+                self._workers[i] = self._spawn()
+                self.restarts += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool size, liveness and restart counters."""
+        with self._lock:
+            pending = len(self._pending)
+        return {
+            "workers": self.num_workers,
+            "alive": sum(p.is_alive() for p in self._workers),
+            "threads_per_worker": self.threads_per_worker,
+            "pending_batches": pending,
+            "restarts": self.restarts,
+            "parent_pid": os.getpid()
+        }
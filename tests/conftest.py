@@ -0,0 +1,67 @@
+"""Shared fixtures: a tiny random-weight checkpoint and isolated configuration."""
+
+from pathlib import Path
+
+import pytest
+from flask import Flask
+
+from benchmarks.common import make_tiny_checkpoint
+from src.config.settings import Config
+from src.database.models import db
+from src.database.repository import FeedbackRepository
+from src.services.sentiment_service import SentimentService
+
+
+@pytest.fixture(scope="session")
+def tiny_checkpoint(tmp_path_factory) -> Path:
+    """Small random-weight DistilBERT with a matching tokenizer, built once per session."""
+    return make_tiny_checkpoint(tmp_path_factory.mktemp("checkpoint") / "tiny")
+
+
+@pytest.fixture
+def tiny_config(tiny_checkpoint, tmp_path, monkeypatch):
+    """Point the model and every cache or database path at the tiny checkpoint and ``tmp_path``."""
+    monkeypatch.setattr(Config, "MODEL_PATH", tiny_checkpoint)
+    monkeypatch.setattr(Config, "ONNX_CACHE_DIR", tmp_path / "onnx_cache")
+    monkeypatch.setattr(Config, "DEVICE", "cpu")
+    monkeypatch.setattr(Config, "MODEL_BACKEND", "torch")
+    monkeypatch.setattr(Config, "MODEL_PRECISION", "fp32")
+    monkeypatch.setattr(Config, "DISK_CACHE_PATH", tmp_path / "prediction_cache.db")
+    return Config
+
+
+@pytest.fixture
+def service_factory(tiny_config, monkeypatch):
+    """
+    Build fresh, loaded ``SentimentService`` singletons on the tiny checkpoint.
+
+    Settings changed with ``monkeypatch`` before calling the factory apply to
+    the new service, and keyword arguments go to ``initialize``; every
+    service built is shut down after the test.
+    """
+    services = []
+
+    def build(**initialize_kwargs) -> SentimentService:
+        monkeypatch.setattr(SentimentService, "_instance", None)
+        service = SentimentService()
+        service.initialize(**initialize_kwargs)
+        services.append(service)
+        return service
+
+    yield build
+    for service in services:
+        service.shutdown()
+
+
+@pytest.fixture
+def database_app(tmp_path):
+    """Flask app bound to a fresh SQLite feedback database, with the tables the repository expects."""
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{tmp_path / 'feedback.db'}"
+    db.init_app(app)
+    with app.app_context():
+        db.create_all()
+        FeedbackRepository.ensure_feedback_stats()
+    yield app
+    with app.app_context():
+        db.engine.dispose()
@@ -0,0 +1,147 @@
+"""ASGI front end: Flask routes stop streaming for gone or stalled clients; async analysis keeps SQLite off the loop."""
+
+import asyncio
+import json
+import threading
+
+import pytest
+
+pytest.importorskip("a2wsgi")
+from flask import Flask
+
+from src.api import routes
+from src.asgi import ASGIApp
+from src.config.settings import Config
+
+
+@pytest.fixture
+def streaming_app():
+    """ASGI app around a Flask app whose ``/stream`` view yields up to 10000 chunks."""
+    flask_app = Flask(__name__)
+    progress = {"chunks": 0, "closed": threading.Event()}
+
+    @flask_app.route("/stream")
+    def stream():
+        def generate():
+            try:
+                for i in range(10_000):
+                    progress["chunks"] += 1
+                    yield f"row {i}\n"
+            finally:
+                progress["closed"].set()
+        return flask_app.response_class(generate(), mimetype="text/plain")
+
+    app = ASGIApp(flask_app)
+    yield app, progress
+    app._wsgi.executor.shutdown(wait=False)
+
+
+def _scope(path, method="GET"):
+    return {
+        "type": "http", "method": method, "path": path, "query_string": b"",
+        "headers": [], "http_version": "1.1", "scheme": "http"
+    }
+
+
+@pytest.mark.parametrize("path", ["/analyze", "/api/v1/analyze/batch"])
+@pytest.mark.parametrize("body", [b"", b"not json", b"[1, 2]", b'"text"', b"{}"])
+def test_invalid_analyze_bodies_get_the_same_400_from_flask_and_asgi(database_app, path, body):
+    database_app.register_blueprint(routes.api)
+    flask_response = database_app.test_client().post(path, data=body, content_type="application/json")
+    app = ASGIApp(database_app)
+    sent = []
+
+    async def main():
+        async def receive():
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        async def send(message):
+            sent.append(message)
+
+        await app(_scope(path, method="POST"), receive, send)
+
+    asyncio.run(main())
+    app._wsgi.executor.shutdown(wait=False)
+    assert flask_response.status_code == sent[0]["status"] == 400
+    assert flask_response.get_json() == json.loads(sent[1]["body"])
+
+
+def test_streaming_view_stops_when_the_client_disconnects(streaming_app):
+    app, progress = streaming_app
+    sent = []
+
+    async def main():
+        disconnected = asyncio.Event()
+        messages = [{"type": "http.request", "body": b"", "more_body": False}]
+
+        async def receive():
+            if messages:
+                return messages.pop()
+            await disconnected.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            sent.append(message)
+            if len(sent) == 3:
+                disconnected.set()
+            await asyncio.sleep(0)
+
+        await asyncio.wait_for(app(_scope("/stream"), receive, send), timeout=5)
+
+    asyncio.run(main())
+    assert progress["closed"].wait(5)
+    assert sent[0]["status"] == 200
+    assert progress["chunks"] < 1000
+    assert not any(message.get("more_body") is False for message in sent[1:])
+
+
+def test_streaming_view_gives_up_on_a_client_that_stops_reading(streaming_app, monkeypatch):
+    app, progress = streaming_app
+    monkeypatch.setattr(Config, "ASGI_WSGI_SEND_TIMEOUT", 0.2)
+
+    async def main():
+        messages = [{"type": "http.request", "body": b"", "more_body": False}]
+        stalled = asyncio.Event()
+
+        async def receive():
+            if messages:
+                return messages.pop()
+            await asyncio.Event().wait()
+
+        async def send(message):
+            if message["type"] == "http.response.body":
+                stalled.set()
+                await asyncio.Event().wait()
+
+        request = asyncio.ensure_future(app(_scope("/stream"), receive, send))
+        await stalled.wait()
+        # The view thread stops on its own, without the request task being cancelled
+        assert await asyncio.get_running_loop().run_in_executor(None, progress["closed"].wait, 5)
+        request.cancel()
+
+    asyncio.run(main())
+    assert progress["chunks"] < 100
+
+
+def test_async_analysis_matches_sync_and_reads_the_disk_cache_off_the_loop(service_factory, monkeypatch):
+    monkeypatch.setattr(Config, "DISK_CACHE_ENABLED", True)
+    service = service_factory()
+    cache_threads = []
+    get = service._disk_cache.get
+
+    def recording_get(key, version):
+        cache_threads.append(threading.current_thread())
+        return get(key, version)
+
+    monkeypatch.setattr(service._disk_cache, "get", recording_get)
+    text = "The screen cracked on the first day."
+
+    async def analyze():
+        return await service.analyze_async(text), threading.current_thread()
+
+    result, loop_thread = asyncio.run(analyze())
+    assert cache_threads and loop_thread not in cache_threads
+    assert result == service._predict_batch([text])[0]
+    # Stored by the async path, served to the sync one
+    service._cache.clear()
+    assert service.analyze(text) == result
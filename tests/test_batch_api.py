@@ -0,0 +1,40 @@
+"""Batched prediction: ``SentimentModel.predict_batch`` and ``POST /api/v1/analyze/batch``."""
+
+import pytest
+
+from src.api import routes
+from src.models.sentiment_model import SentimentModel
+
+TEXTS = ["Absolutely love it, works perfectly.", "Broke after a week, waste of money.", "ok"]
+
+
+@pytest.fixture
+def client(database_app, service_factory, monkeypatch):
+    service = service_factory()
+    monkeypatch.setattr(routes, "sentiment_service", service)
+    database_app.register_blueprint(routes.api)
+    return database_app.test_client()
+
+
+def test_batch_predictions_match_single_predictions(tiny_config):
+    model = SentimentModel()
+    model.load()
+    batch = model.predict_batch(TEXTS)
+    for text, result in zip(TEXTS, batch):
+        single = model.predict(text)
+        assert result["sentiment"] == single["sentiment"]
+        assert result["scores"] == pytest.approx(single["scores"], abs=1e-3)
+
+
+def test_invalid_items_do_not_fail_the_batch(client):
+    response = client.post("/api/v1/analyze/batch", json={"texts": [TEXTS[0], "   ", 42, TEXTS[1]]})
+    assert response.status_code == 200
+    results = response.get_json()["results"]
+    assert [("error" in r) for r in results] == [False, True, True, False]
+    assert results[0]["sentiment"] in ("Positive", "Negative")
+
+
+@pytest.mark.parametrize("body", [{"texts": "not a list"}, {"texts": []}, {"texts": ["ok"] * 10_000}])
+def test_invalid_batches_are_rejected(client, body):
+    response = client.post("/api/v1/analyze/batch", json=body)
+    assert response.status_code == 400 and "error" in response.get_json()
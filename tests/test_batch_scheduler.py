@@ -0,0 +1,95 @@
+"""Micro-batching scheduler: coalescing, error propagation, shutdown and the service's result timeout."""
+
+from concurrent.futures import Future
+import threading
+
+import pytest
+
+from src.config.settings import Config
+from src.services.batch_scheduler import BatchScheduler, QueueFullError, SchedulerStoppedError
+from src.services.sentiment_service import ServiceNotReadyError, ServiceOverloadedError
+
+
+def _scheduler(predict_fn, max_batch_size=8, max_queue_size=16):
+    return BatchScheduler(predict_fn, max_batch_size=max_batch_size, max_wait_ms=20, max_queue_size=max_queue_size)
+
+
+def test_queued_requests_are_coalesced_into_one_batch():
+    batches = []
+
+    def predict(texts):
+        batches.append(list(texts))
+        return [{"text": text} for text in texts]
+
+    scheduler = _scheduler(predict)
+    futures = [scheduler.submit(f"review {i}") for i in range(5)]
+    scheduler.start()
+    try:
+        assert [future.result(timeout=5)["text"] for future in futures] == [f"review {i}" for i in range(5)]
+    finally:
+        scheduler.stop()
+    assert batches == [[f"review {i}" for i in range(5)]]
+
+
+def test_a_failed_batch_fails_every_request_and_a_future_result_is_unwrapped():
+    calls = []
+
+    def predict(texts):
+        calls.append(texts)
+        if len(calls) == 1:
+            raise RuntimeError("forward pass failed")
+        done = Future()
+        done.set_result(["ok"] * len(texts))
+        return done
+
+    scheduler = _scheduler(predict)
+    failing = [scheduler.submit("a"), scheduler.submit("b")]
+    scheduler.start()
+    try:
+        for future in failing:
+            with pytest.raises(RuntimeError, match="forward pass failed"):
+                future.result(timeout=5)
+        assert scheduler.submit("c").result(timeout=5) == "ok"
+    finally:
+        scheduler.stop()
+
+
+def test_stop_fails_queued_requests_and_rejects_new_ones():
+    scheduler = _scheduler(lambda texts: [None] * len(texts), max_queue_size=2)
+    queued = [scheduler.submit("a"), scheduler.submit("b")]
+    with pytest.raises(QueueFullError):
+        scheduler.submit("c")
+
+    scheduler.stop()
+    for future in queued:
+        with pytest.raises(SchedulerStoppedError):
+            future.result(timeout=0)
+    with pytest.raises(SchedulerStoppedError):
+        scheduler.submit("d")
+
+
+def test_service_rejects_requests_whose_batch_does_not_finish(service_factory, monkeypatch):
+    service = service_factory()
+    release = threading.Event()
+
+    def stuck(texts):
+        release.wait(5)
+        return [{}] * len(texts)
+
+    monkeypatch.setattr(service._scheduler, "_predict_fn", stuck)
+    monkeypatch.setattr(Config, "BATCHING_RESULT_TIMEOUT", 0.1)
+    try:
+        with pytest.raises(ServiceOverloadedError):
+            service.analyze("The battery died after a week.")
+        # Queued behind the stuck batch: stopping fails it instead of leaving it waiting forever
+        waiting = service._scheduler.submit("Still waiting.")
+        service._scheduler.stop(timeout=0.1)
+        with pytest.raises(SchedulerStoppedError):
+            waiting.result(timeout=0)
+    finally:
+        release.set()
+
+    # A request that passed the is_running() check just before the scheduler stopped
+    monkeypatch.setattr(service._scheduler, "is_running", lambda: True)
+    with pytest.raises(ServiceNotReadyError):
+        service.analyze("Submitted during shutdown.")
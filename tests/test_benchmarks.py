@@ -0,0 +1,30 @@
+"""Benchmark harness: latency summaries and a short model benchmark run end to end."""
+
+import json
+
+from benchmarks.__main__ import main
+from benchmarks.common import percentiles
+
+
+def test_percentiles_summarize_samples():
+    summary = percentiles([float(ms) for ms in range(1, 101)])
+    assert summary == {
+        "count": 100, "mean_ms": 50.5, "p50_ms": 51.0, "p95_ms": 96.0, "p99_ms": 100.0, "max_ms": 100.0
+    }
+    assert percentiles([]) == {}
+
+
+def test_model_benchmark_writes_a_result_document(tiny_config, tmp_path, monkeypatch):
+    # The harness sets these globally; let monkeypatch restore them
+    monkeypatch.setattr(tiny_config, "BATCH_SIZE", tiny_config.BATCH_SIZE)
+    main([
+        "--model-path", str(tiny_config.MODEL_PATH), "--output-dir", str(tmp_path),
+        "model", "--lengths", "8", "32", "--batch-sizes", "1", "4", "--iterations", "2", "--warmup", "0"
+    ])
+
+    document = json.loads((tmp_path / "model.json").read_text())
+    assert document["benchmark"] == "model"
+    assert {"commit", "torch", "backend", "precision"} <= set(document["environment"])
+    rows = document["results"]["configurations"]
+    assert [(row["length"], row["batch_size"]) for row in rows] == [(8, 1), (8, 4), (32, 1), (32, 4)]
+    assert all(row["count"] == 2 and row["items_per_sec"] > 0 for row in rows)
@@ -0,0 +1,75 @@
+"""Offline bulk scoring: malformed rows become error rows, output is ordered and resumable."""
+
+import json
+
+import pytest
+
+from src.cli.bulk_score import score_file
+from src.models.sentiment_model import SentimentModel
+
+ROWS = [
+    '[1, 2]',
+    '{"review_id": "a", "text": "great product love it"}',
+    '{not json',
+    '{"text": "terrible broke after a week"}',
+    '"just a string"',
+    '{"review_id": "b", "text": ""}',
+    '{"review_id": "c", "text": "works perfectly"}'
+]
+
+
+@pytest.fixture
+def reviews(tmp_path):
+    path = tmp_path / "reviews.jsonl"
+    path.write_text("\n".join(ROWS) + "\n", encoding="utf-8")
+    return path
+
+
+def _score(tiny_config, reviews, output, **kwargs):
+    return score_file(
+        reviews, output, id_field="review_id", window=2, log_every=1e9,
+        model=SentimentModel(device="cpu"), **kwargs
+    )
+
+
+def test_non_object_rows_are_recorded_as_errors(tiny_config, reviews, tmp_path):
+    output = tmp_path / "scores.jsonl"
+    summary = _score(tiny_config, reviews, output)
+
+    records = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+    assert [record["id"] for record in records] == [0, "a", 2, 3, 4, "b", "c"]
+    failed = [record["id"] for record in records if record["error"]]
+    assert failed == [0, 2, 4, "b"]
+    assert all(record["sentiment"] in ("Positive", "Negative") for record in records if not record["error"])
+    assert summary["scored"] == 3 and summary["failed"] == 4
+
+
+def test_parquet_parts_share_one_schema_with_mixed_ids(tiny_config, reviews, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    from src.cli.bulk_score import parquet_schema
+
+    output = tmp_path / "scores"
+    # One window per part: the first part holds only an error row and an int id
+    _score(tiny_config, reviews, output, output_format="parquet", rows_per_part=1)
+
+    parts = sorted(output.glob("part-*.parquet"))
+    assert len(parts) == 4
+    assert all(pq.read_schema(part).equals(parquet_schema()) for part in parts)
+    table = pq.read_table(output)
+    assert table.column("id").to_pylist() == ["0", "a", "2", "3", "4", "b", "c"]
+
+
+def test_resume_continues_after_the_checkpoint(tiny_config, reviews, tmp_path):
+    output = tmp_path / "scores.jsonl"
+    _score(tiny_config, reviews, output)
+    complete = output.read_text(encoding="utf-8")
+
+    # Simulate a crash after the second window: keep its checkpoint, add a torn line
+    lines = complete.splitlines(keepends=True)
+    committed = "".join(lines[:4])
+    output.write_text(committed + lines[4][:10], encoding="utf-8")
+    checkpoint = tmp_path / "scores.jsonl.checkpoint.json"
+    checkpoint.write_text(json.dumps({"rows_done": 4, "output_bytes": len(committed.encode("utf-8"))}), encoding="utf-8")
+
+    _score(tiny_config, reviews, output, resume=True)
+    assert output.read_text(encoding="utf-8") == complete
@@ -0,0 +1,70 @@
+"""Confidence-gated cascade: the offline threshold report and the service path."""
+
+import numpy as np
+import pytest
+
+from src.models.cascade import evaluate_cascade, needs_escalation
+from src.models.fast_model import fit
+
+CONFIDENT = ["love it great quality", "works perfectly very happy", "broke after a week", "terrible waste of money"]
+
+
+class _FixedModel:
+    """Returns preset (sentiment, confidence) results per text."""
+
+    def __init__(self, version, results):
+        self.version = version
+        self._results = results
+
+    def predict_batch(self, texts):
+        return [
+            {"sentiment": self._results[text][0], "confidence": self._results[text][1]}
+            for text in texts
+        ]
+
+
+def test_escalation_below_the_threshold():
+    assert needs_escalation({"confidence": 89.99}, 90)
+    assert not needs_escalation({"confidence": 90.0}, 90)
+
+
+def test_report_recommends_the_cheapest_threshold_meeting_the_target():
+    fast = _FixedModel("fast-1", {"a": ("Positive", 99), "b": ("Positive", 85), "c": ("Negative", 65), "d": ("Negative", 95)})
+    full = _FixedModel("full-1", {"a": ("Positive", 99), "b": ("Negative", 70), "c": ("Negative", 90), "d": ("Negative", 99)})
+    report = evaluate_cascade(["a", "b", "c", "d"], fast, full, thresholds=[90, 60, 80], target_agreement=1.0)
+
+    rows = {row["min_confidence"]: row for row in report["thresholds"]}
+    assert list(rows) == [60, 80, 90]
+    assert rows[60]["escalation_rate"] == 0 and rows[60]["agreement"] == 0.75
+    assert rows[80]["escalation_rate"] == 0.25 and rows[80]["agreement"] == 0.75
+    assert rows[90]["escalation_rate"] == 0.5 and rows[90]["agreement"] == 1.0
+    assert rows[90]["accepted_agreement"] == 1.0
+    assert report["fast_only_agreement"] == 0.75
+    assert report["recommended_min_confidence"] == 90
+
+
+@pytest.fixture
+def fast_model_path(tmp_path):
+    targets = np.array([0.999, 0.999, 0.001, 0.001])
+    path = tmp_path / "fast.npz"
+    fit(CONFIDENT, targets, n_features=4096, epochs=400).save(path)
+    return path
+
+
+def test_service_escalates_only_uncertain_texts(tiny_config, monkeypatch, service_factory, fast_model_path):
+    monkeypatch.setattr(tiny_config, "FAST_MODEL_ENABLED", True)
+    monkeypatch.setattr(tiny_config, "FAST_MODEL_PATH", fast_model_path)
+    monkeypatch.setattr(tiny_config, "CASCADE_ENABLED", True)
+    monkeypatch.setattr(tiny_config, "CASCADE_MIN_CONFIDENCE", 90.0)
+    service = service_factory()
+
+    # "the box" shares no features with the training reviews, so the fast model is unsure
+    results = service.analyze_batch(CONFIDENT[:2] + ["the box"])
+    assert [r["model"] for r in results] == ["fast", "fast", "distilbert"]
+    assert service.analyze("the seller")["model"] == "distilbert"
+    # Explicit modes skip the cascade
+    assert service.analyze("the instructions", mode="fast")["model"] == "fast"
+    assert service.analyze(CONFIDENT[0], mode="accurate")["model"] == "distilbert"
+
+    cascade = service.get_status()["fast_model"]["routing"]["cascade"]
+    assert cascade["accepted"] == 2 and cascade["escalated"] == 2
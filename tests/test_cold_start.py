@@ -0,0 +1,59 @@
+"""Fast cold start: no heavy imports at app import, model warmed up in the background."""
+
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from src.api import routes
+from src.models.sentiment_model import SentimentModel
+from src.services.sentiment_service import ServiceNotReadyError
+
+
+def test_importing_the_app_does_not_import_torch():
+    code = "import sys, src.app; print(sorted({'torch', 'transformers', 'onnxruntime'} & set(sys.modules)))"
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert output.strip() == "[]"
+
+
+@pytest.fixture
+def held_load(monkeypatch):
+    """Make ``SentimentModel.load`` wait until the returned event is set."""
+    release = threading.Event()
+    load = SentimentModel.load
+
+    def held(self):
+        assert release.wait(30)
+        load(self)
+
+    monkeypatch.setattr(SentimentModel, "load", held)
+    yield release
+    release.set()
+
+
+def test_background_warmup_reports_warming_until_ready(database_app, service_factory, held_load, monkeypatch):
+    service = service_factory(background=True)
+    monkeypatch.setattr(routes, "sentiment_service", service)
+    database_app.register_blueprint(routes.api)
+    client = database_app.test_client()
+
+    response = client.get("/health")
+    assert response.status_code == 503 and response.get_json()["status"] == "warming"
+    with pytest.raises(ServiceNotReadyError):
+        service.analyze("great product")
+
+    held_load.set()
+    service._init_thread.join(30)
+    response = client.get("/health")
+    assert response.status_code == 200 and response.get_json()["status"] == "healthy"
+    assert set(response.get_json()["startup_timings"]) >= {"import_s", "load_total_s", "warmup_s"}
+    assert service.analyze("great product")["model"] == "distilbert"
+
+
+def test_failed_background_load_is_reported(tiny_config, tmp_path, monkeypatch, service_factory):
+    monkeypatch.setattr(tiny_config, "MODEL_PATH", tmp_path / "missing")
+    service = service_factory(background=True)
+    service._init_thread.join(30)
+    status = service.get_status()
+    assert status["state"] == "failed" and not status["ready"]
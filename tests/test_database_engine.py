@@ -0,0 +1,31 @@
+"""Database engine profile: SQLite pragmas on every connection, pool options for Postgres."""
+
+from sqlalchemy import create_engine, text
+
+from src.config.settings import Config
+from src.database.engine import configure_engine, engine_options
+
+
+def test_pragmas_apply_to_every_sqlite_connection(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, "SQLITE_BUSY_TIMEOUT_MS", 1234)
+    engine = create_engine(f"sqlite:///{tmp_path / 'feedback.db'}")
+    configure_engine(engine)
+    try:
+        connections = [engine.connect(), engine.connect()]
+        for connection in connections:
+            assert connection.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            # NORMAL
+            assert connection.execute(text("PRAGMA synchronous")).scalar() == 1
+            assert connection.execute(text("PRAGMA busy_timeout")).scalar() == 1234
+        for connection in connections:
+            connection.close()
+    finally:
+        engine.dispose()
+
+
+def test_pool_options_are_only_set_for_postgres(monkeypatch):
+    monkeypatch.setattr(Config, "DB_POOL_SIZE", 3)
+    options = engine_options("postgresql://app@db/feedback")
+    assert options["pool_size"] == 3 and options["pool_pre_ping"] is True
+    assert engine_options("postgres://app@db/feedback") == options
+    assert engine_options("sqlite:///feedback.db") == {}
@@ -0,0 +1,48 @@
+"""Persistent prediction cache: version isolation, batched access times and LRU trimming."""
+
+from src.services.disk_cache import DiskPredictionCache
+
+RESULT = {"sentiment": "Positive", "confidence": 97.5}
+
+
+def _cache(tmp_path, **kwargs):
+    kwargs.setdefault("touch_interval", 3600.0)
+    return DiskPredictionCache(tmp_path / "cache.db", **kwargs)
+
+
+def test_other_versions_are_missed_but_kept_for_their_processes(tmp_path):
+    old = _cache(tmp_path, max_entries=100)
+    old.put("a", "v1", RESULT)
+    new = _cache(tmp_path, max_entries=100)
+    new.put("b", "v2", RESULT)
+
+    assert new.get("a", "v2") is None
+    assert new.warm("v2", limit=10) == [("b", RESULT)]
+    # A process still serving v1 keeps its entries after v2 warmed up
+    assert old.get("a", "v1") == RESULT
+
+
+def test_hits_write_access_times_in_batches(tmp_path):
+    cache = _cache(tmp_path, max_entries=100, touch_batch=4)
+    for key in "abcd":
+        cache.put(key, "v1", RESULT)
+    connection = cache._connection()
+    writes = connection.total_changes
+
+    for key in "abc":
+        assert cache.get(key, "v1") == RESULT
+    assert connection.total_changes == writes
+    cache.get("d", "v1")
+    assert connection.total_changes == writes + 4
+
+
+def test_trim_evicts_stale_versions_and_honours_pending_hits(tmp_path):
+    cache = _cache(tmp_path, max_entries=2, trim_interval=4)
+    cache.put("stale", "v1", RESULT)
+    cache.put("hit", "v2", RESULT)
+    cache.put("unused", "v2", RESULT)
+    assert cache.get("hit", "v2") == RESULT
+    cache.put("new", "v2", RESULT)  # 4th write trims
+
+    assert [key for key, _ in cache.warm("v2", limit=10)] == ["new", "hit"]
+    assert cache.warm("v1", limit=10) == []
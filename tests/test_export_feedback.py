@@ -0,0 +1,76 @@
+"""Incremental feedback export: late commits, label-aware dedupe and crash recovery."""
+
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("pyarrow")
+import pyarrow.dataset as ds
+from sqlalchemy import create_engine, insert
+
+from src.cli.export_feedback import export_feedback
+from src.database.models import Feedback
+
+
+@pytest.fixture
+def database(tmp_path):
+    url = f"sqlite:///{tmp_path / 'feedback.db'}"
+    engine = create_engine(url)
+    Feedback.__table__.create(engine)
+
+    def add(feedback_id, text, is_correct=True, correct_label=None):
+        with engine.begin() as connection:
+            connection.execute(insert(Feedback.__table__).values(
+                id=feedback_id, text=text, predicted_sentiment="Positive", predicted_confidence=90.0,
+                is_correct=is_correct, correct_label=correct_label, created_at=datetime(2026, 1, 15, 12)
+            ))
+
+    yield url, add
+    engine.dispose()
+
+
+def _exported(output):
+    table = ds.dataset(output, partitioning="hive").to_table()
+    return sorted(zip(table.column("id").to_pylist(), table.column("label").to_pylist()))
+
+
+def test_rows_committed_below_the_high_water_mark_are_exported(database, tmp_path):
+    url, add = database
+    output = tmp_path / "export"
+    for feedback_id in (1, 2, 4, 5):
+        add(feedback_id, f"review {feedback_id}")
+    assert export_feedback(output, url)["last_id"] == 5
+
+    # Id 3 was allocated before 4 and 5 but committed after they were exported
+    add(3, "review 3")
+    summary = export_feedback(output, url)
+    assert summary["exported"] == 1
+    assert summary["rescanned"] == 4
+    assert summary["duplicates_skipped"] == 0
+    assert [feedback_id for feedback_id, _ in _exported(output)] == [1, 2, 3, 4, 5]
+
+
+def test_a_labeled_repeat_is_exported_and_an_unlabeled_one_is_not(database, tmp_path):
+    url, add = database
+    output = tmp_path / "export"
+    add(1, "broke after a week", is_correct=False)
+    add(2, "broke  after a week", is_correct=False, correct_label="Negative")
+    add(3, "broke after a week ", is_correct=False)
+    summary = export_feedback(output, url)
+
+    assert summary["exported"] == 2 and summary["duplicates_skipped"] == 1
+    assert _exported(output) == [(1, None), (2, "Negative")]
+
+
+def test_parts_from_an_interrupted_run_are_replaced(database, tmp_path):
+    url, add = database
+    output = tmp_path / "export"
+    add(1, "review 1")
+    export_feedback(output, url)
+    # A part written by a run that crashed before saving its state
+    stale = next(output.glob("day=*/part-*.parquet"))
+    stale.with_name("part-00000001.parquet").write_bytes(stale.read_bytes())
+
+    add(2, "review 2")
+    export_feedback(output, url)
+    assert [feedback_id for feedback_id, _ in _exported(output)] == [1, 2]
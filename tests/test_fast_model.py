@@ -0,0 +1,71 @@
+"""Fast fallback model and the router that sheds load to it."""
+
+import numpy as np
+import pytest
+
+from src.models.fast_model import FastSentimentModel, fit, hash_features, tokenize
+from src.models.sentiment_model import ModelLoadError
+from src.services.model_router import CASCADE, FAST, PRIMARY, ModelRouter
+
+POSITIVE = ["love it great quality", "works perfectly very happy", "great price would buy again"]
+NEGATIVE = ["broke after a week", "terrible quality waste of money", "not worth it very disappointed"]
+
+
+def test_features_are_stable_and_keep_negations():
+    assert "not good" in tokenize("Not good!")
+    indices, values = hash_features("good good not good", 1024)
+    again = hash_features("good good not good", 1024)
+    assert np.array_equal(indices, again[0]) and np.array_equal(values, again[1])
+    assert np.all(np.diff(indices) > 0) and len(hash_features("!!!", 1024)[0]) == 0
+
+
+def test_fitted_model_survives_a_save_and_load(tmp_path):
+    targets = np.array([0.95] * len(POSITIVE) + [0.05] * len(NEGATIVE))
+    model = fit(POSITIVE + NEGATIVE, targets, n_features=4096)
+    results = model.predict_batch(POSITIVE + NEGATIVE)
+    assert [r["sentiment"] for r in results] == ["Positive"] * 3 + ["Negative"] * 3
+
+    model.save(tmp_path / "fast.npz")
+    loaded = FastSentimentModel(tmp_path / "fast.npz")
+    loaded.load()
+    assert loaded.version.startswith("fast-") and loaded.n_features == 4096
+    assert loaded.predict_batch(POSITIVE) == [{**r, "model_version": loaded.version} for r in results[:3]]
+
+
+def test_missing_model_file_is_a_load_error(tmp_path):
+    with pytest.raises(ModelLoadError):
+        FastSentimentModel(tmp_path / "missing.npz").load()
+
+
+def test_requested_modes_bypass_load_signals():
+    router = ModelRouter(max_in_flight=1, max_latency_ms=0)
+    router.begin()
+    assert router.choose("accurate", True, True) == (PRIMARY, "requested")
+    assert router.choose("fast", True, True) == (FAST, "requested")
+    assert router.choose("cascade", True, True) == (CASCADE, "requested")
+    # Without the fast model everything goes to DistilBERT
+    assert router.choose("auto", True, False) == (PRIMARY, "default")
+
+
+def test_auto_requests_are_shed_under_load():
+    router = ModelRouter(max_in_flight=2, max_latency_ms=100, cascade=True, latency_ttl=60)
+    assert router.choose("auto", False, True) == (FAST, "not_ready")
+    assert router.choose("auto", True, True) == (CASCADE, "default")
+
+    router.begin(2)
+    assert router.choose("auto", True, True) == (FAST, "queue_depth")
+    router.end(2, latency=0.5)
+    assert router.choose("auto", True, True) == (FAST, "latency")
+    for _ in range(20):
+        router.end(0, latency=0.01)
+    assert router.choose("auto", True, True) == (CASCADE, "default")
+
+
+def test_stale_latency_stops_shedding(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("src.services.model_router.time.monotonic", lambda: now[0])
+    router = ModelRouter(max_in_flight=0, max_latency_ms=100, latency_ttl=1.0)
+    router.end(0, latency=0.5)
+    assert router.choose("auto", True, True) == (FAST, "latency")
+    now[0] += 1.5
+    assert router.choose("auto", True, True) == (PRIMARY, "default")
@@ -0,0 +1,66 @@
+"""Write-behind feedback buffer: idle flushes, grouping under load and shutdown."""
+
+import pytest
+
+from src.database.feedback_buffer import BufferStoppedError, FeedbackBuffer
+from src.database.models import Feedback, db
+
+
+def _record(i):
+    return {
+        "text": f"review {i}", "predicted_sentiment": "Positive",
+        "predicted_confidence": 90.0, "is_correct": True
+    }
+
+
+def _stored(app):
+    with app.app_context():
+        return sorted(text for (text,) in db.session.query(Feedback.text))
+
+
+@pytest.fixture
+def buffer():
+    buffer = FeedbackBuffer(max_records=50, flush_interval_ms=300, max_pending=100)
+    yield buffer
+    buffer.stop()
+
+
+def test_a_record_arriving_when_idle_is_flushed_without_waiting(database_app, buffer):
+    buffer.start(database_app)
+    future = buffer.submit([_record(0)])[0]
+    # Well under the 300ms interval
+    assert future.result(timeout=0.2) > 0
+
+
+def test_records_arriving_during_a_busy_period_are_grouped(database_app, buffer):
+    buffer.start(database_app)
+    buffer.submit([_record(0)])[0].result(timeout=1)
+    futures = [buffer.submit([_record(i)])[0] for i in range(1, 4)]
+    assert [future.result(timeout=2) > 0 for future in futures] == [True] * 3
+    assert buffer.flushes == 2
+    assert _stored(database_app) == [f"review {i}" for i in range(4)]
+
+
+def test_records_submitted_after_stop_are_written_by_the_caller(database_app, buffer):
+    buffer.start(database_app)
+    buffer.stop()
+    future = buffer.submit([_record(0)])[0]
+    assert future.done() and future.result() > 0
+    assert _stored(database_app) == ["review 0"]
+
+
+def test_submitting_to_a_buffer_that_never_started_fails(buffer):
+    with pytest.raises(BufferStoppedError):
+        buffer.submit([_record(0)])
+
+
+def test_stop_flushes_what_is_still_buffered(database_app):
+    buffer = FeedbackBuffer(max_records=50, flush_interval_ms=60_000, max_pending=100)
+    buffer.start(database_app)
+    buffer.submit([_record(0)])[0].result(timeout=1)
+    # Inside the interval after a flush: held back for grouping
+    futures = buffer.submit([_record(1), _record(2)])
+    assert not any(future.done() for future in futures)
+    buffer.stop()
+    assert all(future.result(timeout=0) > 0 for future in futures)
+    assert _stored(database_app) == ["review 0", "review 1", "review 2"]
@@ -0,0 +1,68 @@
+"""Keyset pagination, filters and the streaming export of ``GET /feedback``."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.api import routes
+from src.config.settings import Config
+from src.database.repository import FeedbackRepository
+
+START = datetime(2024, 5, 1, 12, 0, 0)
+
+
+@pytest.fixture
+def client(database_app, monkeypatch):
+    monkeypatch.setattr(Config, "FEEDBACK_PAGE_MAX", 4)
+    records = [
+        {
+            "text": f"review {i}",
+            "predicted_sentiment": "Positive" if i % 2 else "Negative",
+            "predicted_confidence": 80.0,
+            "is_correct": i % 3 != 0,
+            # Pairs of rows share a timestamp, so the id must break ties
+            "created_at": START + timedelta(minutes=i // 2)
+        }
+        for i in range(10)
+    ]
+    with database_app.app_context():
+        FeedbackRepository.create_feedback_batch(records)
+    database_app.register_blueprint(routes.api)
+    return database_app.test_client()
+
+
+def _pages(client, query):
+    texts, cursor = [], None
+    while True:
+        params = dict(query, **({"cursor": cursor} if cursor else {}))
+        body = client.get("/feedback", query_string=params).get_json()
+        texts.append([f["text"] for f in body["feedback"]])
+        cursor = body["next_cursor"]
+        if cursor is None:
+            return texts
+
+
+def test_pages_cover_every_row_once_newest_first(client):
+    pages = _pages(client, {"limit": 100})
+    # The limit is capped at FEEDBACK_PAGE_MAX
+    assert [len(page) for page in pages] == [4, 4, 2]
+    assert sum(pages, []) == [f"review {i}" for i in reversed(range(10))]
+
+
+def test_filters_apply_to_every_page(client):
+    pages = _pages(client, {"limit": 2, "sentiment": "Positive", "is_correct": "true",
+                            "since": (START + timedelta(minutes=1)).isoformat()})
+    assert sum(pages, []) == ["review 7", "review 5"]
+
+
+@pytest.mark.parametrize("query", [{"cursor": "not-a-cursor"}, {"is_correct": "maybe"}, {"since": "yesterday"}])
+def test_invalid_arguments_are_rejected(client, query):
+    response = client.get("/feedback", query_string=query)
+    assert response.status_code == 400 and "error" in response.get_json()
+
+
+def test_export_streams_every_matching_row(client):
+    response = client.get("/feedback/export", query_string={"sentiment": "Negative"})
+    assert response.is_streamed
+    texts = [f["text"] for f in response.get_json()["feedback"]]
+    assert texts == [f"review {i}" for i in (8, 6, 4, 2, 0)]
@@ -0,0 +1,55 @@
+"""Incremental feedback statistics agree with a recount of the feedback table."""
+
+from datetime import datetime, timedelta
+
+from src.database.models import FeedbackStats, db
+from src.database.repository import FeedbackRepository, confidence_bucket
+
+
+def _record(sentiment, confidence, is_correct, days_ago=0):
+    return {
+        "text": f"{sentiment} {confidence}", "predicted_sentiment": sentiment,
+        "predicted_confidence": confidence, "is_correct": is_correct,
+        "created_at": datetime.utcnow() - timedelta(days=days_ago)
+    }
+
+
+def test_confidence_buckets():
+    assert [confidence_bucket(c) for c in (0, 9.99, 10, 55.5, 99.9, 100, -3)] == [0, 0, 10, 50, 90, 90, 0]
+
+
+def test_writes_keep_the_summary_in_step_with_the_table(database_app):
+    with database_app.app_context():
+        FeedbackRepository.create_feedback("loved it", "Positive", 97.0, True)
+        ids = FeedbackRepository.create_feedback_batch([
+            _record("Positive", 55.0, False),
+            _record("Negative", 91.0, True),
+            _record("Negative", 93.0, True, days_ago=3),
+        ])
+        incremental = FeedbackRepository.get_feedback_stats()
+        assert incremental["total_feedback"] == 4 and incremental["accuracy"] == 75.0
+        assert incremental["by_sentiment"]["Negative"] == {
+            "total": 2, "correct": 2, "incorrect": 0, "accuracy": 100.0
+        }
+        assert incremental["by_confidence"]["90-100"]["total"] == 3
+        assert len(incremental["by_day"]) == 2
+
+        FeedbackRepository.delete_feedback(ids[0])
+        after_delete = FeedbackRepository.get_feedback_stats()
+        assert after_delete["total_feedback"] == 3 and after_delete["accuracy"] == 100.0
+        assert "50-60" not in after_delete["by_confidence"]
+
+        assert FeedbackRepository.rebuild_feedback_stats() == 3
+        assert FeedbackRepository.get_feedback_stats() == after_delete
+
+
+def test_existing_feedback_is_backfilled_once(database_app):
+    with database_app.app_context():
+        FeedbackRepository.create_feedback_batch([_record("Positive", 80.0, True)] * 2)
+        db.session.query(FeedbackStats).delete()
+        db.session.commit()
+
+        FeedbackRepository.ensure_feedback_stats()
+        assert FeedbackRepository.get_feedback_stats()["total_feedback"] == 2
+        FeedbackRepository.ensure_feedback_stats()
+        assert db.session.query(db.func.sum(FeedbackStats.count)).scalar() == 2
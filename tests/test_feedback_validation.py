@@ -0,0 +1,71 @@
+"""Feedback submission: type validation, and 400 for records the database refuses."""
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from src.api import routes
+from src.config.settings import Config
+from src.database.feedback_buffer import FeedbackBuffer
+from src.database.repository import FeedbackRepository
+
+VALID = {
+    "text": "Great value", "predicted_sentiment": "Positive",
+    "predicted_confidence": 92.5, "is_correct": True
+}
+
+
+@pytest.fixture
+def client(database_app):
+    database_app.register_blueprint(routes.api)
+    return database_app.test_client()
+
+
+@pytest.fixture
+def buffered_client(database_app, client, monkeypatch):
+    buffer = FeedbackBuffer(max_records=50, flush_interval_ms=50, max_pending=100)
+    buffer.start(database_app)
+    monkeypatch.setattr(routes, "feedback_buffer", buffer)
+    yield client
+    buffer.stop()
+
+
+@pytest.mark.parametrize("field, value", [
+    ("predicted_confidence", "92.5"),
+    ("predicted_confidence", True),
+    ("predicted_confidence", 150),
+    ("predicted_confidence", float("nan")),
+    ("is_correct", "yes"),
+    ("is_correct", 1),
+    ("text", None),
+    ("correct_label", 5),
+])
+def test_records_with_the_wrong_types_are_rejected(client, field, value):
+    response = client.post("/feedback", json=dict(VALID, **{field: value}))
+    assert response.status_code == 400
+    assert field in response.get_json()["error"]
+
+
+def test_a_batch_with_no_valid_record_is_rejected(client):
+    response = client.post("/feedback/batch", json={"feedback": [
+        dict(VALID, is_correct="no"), dict(VALID, predicted_confidence=-1)
+    ]})
+    assert response.status_code == 400
+    assert all("error" in result for result in response.get_json()["results"])
+
+
+def test_invalid_records_are_rejected_before_an_eventual_202(buffered_client, monkeypatch):
+    monkeypatch.setattr(Config, "FEEDBACK_CONSISTENCY", "eventual")
+    assert buffered_client.post("/feedback", json=dict(VALID, is_correct="true")).status_code == 400
+    assert buffered_client.post("/feedback", json=VALID).status_code == 202
+
+
+def test_a_record_the_database_refuses_gets_400(buffered_client, monkeypatch):
+    def refuse(records):
+        raise IntegrityError("INSERT INTO feedback", {}, Exception("CHECK constraint failed"))
+
+    monkeypatch.setattr(FeedbackRepository, "create_feedback_batch", staticmethod(refuse))
+    response = buffered_client.post("/feedback", json=VALID)
+    assert response.status_code == 400
+    response = buffered_client.post("/feedback/batch", json={"feedback": [VALID, VALID]})
+    assert response.status_code == 400
+    assert response.get_json()["results"] == [{"error": "Feedback record was rejected by the database"}] * 2
@@ -0,0 +1,48 @@
+"""Length-bucketed batching: fewer padded tokens, results still in input order."""
+
+import pytest
+
+from benchmarks.common import synthetic_reviews
+from src.models.length_bucketing import PaddingStats, bucket_by_length, chunk_in_order, compare_padding
+from src.models.sentiment_model import SentimentModel
+
+
+def test_buckets_group_similar_lengths_and_keep_every_index():
+    lengths = [50, 3, 48, 4, 5, 47]
+    assert chunk_in_order(len(lengths), 4) == [[0, 1, 2, 3], [4, 5]]
+    groups = bucket_by_length(lengths, 3)
+    assert groups == [[1, 3, 4], [5, 2, 0]]
+    assert sorted(sum(groups, [])) == list(range(len(lengths)))
+
+
+def test_padding_stats_count_real_and_padded_work():
+    stats = PaddingStats()
+    stats.record([4, 2])
+    stats.record([])
+    assert stats.to_dict() == {
+        "batches": 1, "sequences": 2, "real_tokens": 6, "padded_tokens": 8,
+        "token_waste": 0.25, "attention_waste": round(1 - 20 / 32, 4)
+    }
+
+
+def test_bucketing_reduces_padding_on_mixed_lengths():
+    report = compare_padding([5, 100, 6, 98, 7, 97, 8, 99], batch_size=2)
+    assert report["length_bucketed"]["padded_tokens"] < report["arrival_order"]["padded_tokens"]
+    assert report["padded_token_reduction"] > 1.5 and report["attention_compute_reduction"] > 1.5
+
+
+def test_bucketed_predictions_come_back_in_input_order(tiny_config, monkeypatch):
+    texts = [review for pair in zip(synthetic_reviews(4, 6), synthetic_reviews(4, 60, seed=1)) for review in pair]
+    monkeypatch.setattr(tiny_config, "BATCH_SIZE", 2)
+    predictions, padded = {}, {}
+    for bucketing in (False, True):
+        monkeypatch.setattr(tiny_config, "LENGTH_BUCKETING", bucketing)
+        model = SentimentModel()
+        model.load()
+        predictions[bucketing] = model.predict_batch(texts)
+        padded[bucketing] = model.padding_stats.to_dict()["padded_tokens"]
+
+    for plain, bucketed in zip(predictions[False], predictions[True]):
+        assert bucketed["sentiment"] == plain["sentiment"]
+        assert bucketed["scores"] == pytest.approx(plain["scores"], abs=1e-3)
+    assert padded[True] < padded[False]
@@ -0,0 +1,53 @@
+"""Sliding-window scoring: window selection, aggregation and the long-document model path."""
+
+import pytest
+
+from benchmarks.common import synthetic_reviews
+from src.models.long_documents import aggregate, select_windows
+from src.models.sentiment_model import SentimentModel
+
+
+def test_first_and_last_windows_are_kept():
+    assert select_windows(3, 4) == [0, 1, 2]
+    assert select_windows(10, 4) == [0, 7, 8, 9]
+    assert select_windows(10, 1) == [0]
+    assert select_windows(10, 0) == list(range(10))
+
+
+@pytest.mark.parametrize("method, expected", [
+    ("mean", [0.5, 0.5]),
+    ("length", [0.75, 0.25]),
+    ("last", [1 / 3, 2 / 3]),
+])
+def test_aggregation_weights(method, expected):
+    probabilities = [[1.0, 0.0], [0.0, 1.0]]
+    combined = aggregate(probabilities, lengths=[300, 100], positions=[0, 1], method=method)
+    assert combined == pytest.approx(expected)
+
+
+def test_unknown_aggregation_is_rejected():
+    with pytest.raises(ValueError, match="Unknown aggregation"):
+        aggregate([[1.0, 0.0]], lengths=[1], positions=[0], method="max")
+
+
+def _load(config, monkeypatch, long_documents):
+    monkeypatch.setattr(config, "LONG_DOCUMENT_MODE", long_documents)
+    monkeypatch.setattr(config, "LONG_DOCUMENT_MAX_WINDOWS", 3)
+    monkeypatch.setattr(config, "LONG_DOCUMENT_STRIDE", 64)
+    model = SentimentModel()
+    model.load()
+    return model
+
+
+def test_long_reviews_are_scored_over_windows(tiny_config, monkeypatch):
+    short, long = "great quality, works perfectly", synthetic_reviews(1, 2000)[0]
+    truncating = _load(tiny_config, monkeypatch, long_documents=False)
+    windowed = _load(tiny_config, monkeypatch, long_documents=True)
+
+    short_result, long_result = windowed.predict_batch([short, long])
+    assert short_result["windows"] == 1 and long_result["windows"] == 3
+    # A review that fits in one window scores exactly as without windows
+    assert short_result["scores"] == pytest.approx(truncating.predict(short)["scores"], abs=1e-3)
+    # Caches must not mix predictions from the two modes
+    assert windowed.version != truncating.version
+    assert windowed.version.endswith("-long3x64-mean")
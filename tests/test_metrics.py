@@ -0,0 +1,65 @@
+"""Metrics registry: text exposition format of each metric type."""
+
+import pytest
+
+from src.monitoring.metrics import Counter, MetricsRegistry, _Metric
+
+
+def _families(text):
+    """Map each sample name to the family declared by the closest preceding TYPE line."""
+    family, samples = None, {}
+    for line in text.splitlines():
+        if line.startswith("# TYPE "):
+            family = line.split()[2]
+        elif line and not line.startswith("#"):
+            samples[line.split("{")[0].split(" ")[0]] = family
+    return samples
+
+
+def test_samples_belong_to_the_family_named_in_their_metadata():
+    registry = MetricsRegistry()
+    requests = registry.counter("app_requests", "Requests.", ("status",))
+    requests.labels(status="200").inc()
+    requests.labels(status="503").inc(2)
+    registry.counter("app_errors_total", "Errors.").inc()
+    registry.gauge("app_ready", "Ready.").set_function(lambda: 1)
+    registry.histogram("app_latency_seconds", "Latency.", buckets=(0.1, 1.0)).observe(0.5)
+    text = registry.render()
+
+    assert "# HELP app_requests_total Requests." in text
+    assert "# TYPE app_requests_total counter" in text
+    assert 'app_requests_total{status="503"} 2' in text
+    assert "app_errors_total 1" in text
+    for sample, family in _families(text).items():
+        assert sample in (family, f"{family}_bucket", f"{family}_sum", f"{family}_count"), sample
+
+
+def test_histogram_buckets_are_cumulative():
+    registry = MetricsRegistry()
+    latency = registry.histogram("latency_seconds", "Latency.", ("route",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.5, 5.0):
+        latency.labels(route="/analyze").observe(value)
+    lines = registry.render().splitlines()
+
+    assert 'latency_seconds_bucket{route="/analyze",le="0.1"} 1' in lines
+    assert 'latency_seconds_bucket{route="/analyze",le="1"} 3' in lines
+    assert 'latency_seconds_bucket{route="/analyze",le="+Inf"} 4' in lines
+    assert 'latency_seconds_count{route="/analyze"} 4' in lines
+
+
+def test_registering_a_name_twice_returns_the_first_metric():
+    registry = MetricsRegistry()
+    assert registry.counter("hits", "Hits.") is registry.counter("hits_total", "Hits.")
+
+
+def test_metric_types_must_implement_the_child_hooks():
+    with pytest.raises(TypeError):
+        _Metric("untyped", "No type.")
+
+    class Incomplete(_Metric):
+        def _new_child(self):
+            return Incomplete(self.name, self.documentation)
+
+    with pytest.raises(TypeError):
+        Incomplete("incomplete", "Missing _render_child.")
+    assert isinstance(Counter("complete", "Complete."), _Metric)
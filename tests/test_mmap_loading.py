@@ -0,0 +1,65 @@
+"""Memory-mapped loading: same predictions as from_pretrained, weights backed by the file."""
+
+import threading
+
+import pytest
+import torch
+
+from src.models import mmap_loading
+from src.models.sentiment_model import SentimentModel
+
+TEXTS = ["Absolutely love it, works perfectly.", "Broke after a week, waste of money."]
+
+
+def _load(config, monkeypatch, mmap):
+    monkeypatch.setattr(config, "MODEL_LOAD_MMAP", mmap)
+    model = SentimentModel()
+    model.load()
+    return model
+
+
+def test_mapped_weights_predict_like_from_pretrained(tiny_config, monkeypatch):
+    pretrained = _load(tiny_config, monkeypatch, mmap=False)
+    mapped = _load(tiny_config, monkeypatch, mmap=True)
+
+    assert mapped.weight_files and not pretrained.weight_files
+    assert mapped.memory_usage()["mmap"] is True
+    for expected, actual in zip(pretrained.predict_batch(TEXTS), mapped.predict_batch(TEXTS)):
+        assert actual["sentiment"] == expected["sentiment"]
+        assert actual["scores"] == pytest.approx(expected["scores"], abs=1e-3)
+
+
+def test_parameters_are_backed_by_the_weight_file(tiny_config, monkeypatch):
+    register_parameter = torch.nn.Module.register_parameter
+    mapped = _load(tiny_config, monkeypatch, mmap=True)
+    embeddings = mapped.model.distilbert.embeddings
+
+    with open("/proc/self/maps", encoding="utf-8") as maps:
+        assert str(mapped.weight_files[0]) in maps.read()
+    # Not saved in the checkpoint, so computed when the model was built
+    assert torch.equal(embeddings.position_ids[0], torch.arange(embeddings.position_ids.shape[1]))
+    assert torch.nn.Module.register_parameter is register_parameter
+
+
+def test_random_init_is_skipped_only_in_the_loading_thread():
+    inside, release = threading.Event(), threading.Event()
+    weights = {name: torch.zeros(64) for name in ("loading", "concurrent")}
+
+    def load():
+        with mmap_loading._skip_random_init():
+            torch.nn.init.normal_(weights["loading"])
+            inside.set()
+            release.wait(5)
+
+    loader = threading.Thread(target=load)
+    loader.start()
+    try:
+        assert inside.wait(5)
+        # Initialized by another thread while the loader is still inside the mode
+        torch.nn.init.normal_(weights["concurrent"])
+    finally:
+        release.set()
+        loader.join(5)
+
+    assert not weights["loading"].any()
+    assert weights["concurrent"].any()
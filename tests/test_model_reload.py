@@ -0,0 +1,78 @@
+"""Model reload: admin authorization and swapping checkpoints under a running service."""
+
+import gc
+import weakref
+
+import pytest
+
+from benchmarks.common import make_tiny_checkpoint
+from src.api import routes
+from src.config.settings import Config
+
+TOKEN = "s3cret-token"
+
+
+@pytest.fixture
+def client(database_app, monkeypatch):
+    monkeypatch.setattr(Config, "ADMIN_TOKEN", TOKEN)
+    reloads = []
+
+    def reload_model(model_path=None):
+        reloads.append(model_path)
+        return True
+
+    monkeypatch.setattr(routes.sentiment_service, "reload_model", reload_model)
+    monkeypatch.setattr(routes.sentiment_service, "get_status", lambda: {"model_version": "test"})
+    database_app.register_blueprint(routes.api)
+    client = database_app.test_client()
+    client.reloads = reloads
+    return client
+
+
+@pytest.mark.parametrize("header", [f"Bearer {TOKEN}", f"bearer {TOKEN}", f"BEARER  {TOKEN} "])
+def test_bearer_scheme_is_case_insensitive(client, header):
+    response = client.post("/admin/model/reload", headers={"Authorization": header})
+    assert response.status_code == 202
+    assert client.reloads == [None]
+
+
+@pytest.mark.parametrize("header", [TOKEN, f"Basic {TOKEN}", "Bearer ", "Bearer wrong-token", f"Bearer{TOKEN}", ""])
+def test_anything_but_the_bearer_token_is_rejected(client, header):
+    response = client.post("/admin/model/reload", headers={"Authorization": header})
+    assert response.status_code == 401
+    assert response.headers["WWW-Authenticate"] == "Bearer"
+    assert client.reloads == []
+
+
+def test_reload_is_disabled_without_a_token(client, monkeypatch):
+    monkeypatch.setattr(Config, "ADMIN_TOKEN", "")
+    assert client.post("/admin/model/reload", headers={"Authorization": "Bearer "}).status_code == 403
+
+
+def test_reload_swaps_the_model_and_stops_serving_old_predictions(service_factory, tmp_path):
+    service = service_factory()
+    text = "The zipper broke on the second day."
+    before = service.analyze(text)
+    old_version = service._model.version
+
+    replacement = make_tiny_checkpoint(tmp_path / "replacement")
+    assert service.reload_model(replacement, background=False)
+
+    status = service.get_status()
+    assert status["reload"]["state"] == "ready"
+    assert status["reload"]["previous_version"] == old_version
+    assert service._model.version != old_version
+    after = service.analyze(text)
+    assert after["model_version"] == service._model.version != before["model_version"]
+    assert after["scores"] == service._model.predict(text)["scores"]
+
+
+def test_reload_frees_the_replaced_model(service_factory, tmp_path):
+    service = service_factory()
+    service.analyze("Works as described.")
+    old_weights = weakref.ref(service._model.model)
+
+    assert service.reload_model(make_tiny_checkpoint(tmp_path / "replacement"), background=False)
+    # Nothing pinned the old model in the permanent generation with gc.freeze
+    assert gc.get_freeze_count() == 0
+    assert old_weights() is None
@@ -0,0 +1,50 @@
+"""The ONNX Runtime backend must reproduce the PyTorch model's outputs."""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("onnxruntime")
+torch = pytest.importorskip("torch")
+
+from src.models.onnx_model import OnnxSentimentModel, verify_equivalence
+from src.models.sentiment_model import SentimentModel
+
+TEXTS = [
+    "great product love it",
+    "terrible broke after a week",
+    "it was fine",
+    "the battery and the screen are great but shipping was slow " * 8
+]
+
+
+def test_onnx_logits_match_pytorch(tiny_config):
+    torch_model = SentimentModel(device="cpu", precision="fp32")
+    onnx_model = OnnxSentimentModel()
+    torch_model.load()
+    onnx_model.load()
+
+    inputs = torch_model.batch_tokenizer.pad(torch_model.batch_tokenizer.encode(TEXTS), "pt")
+    with torch.no_grad():
+        expected = torch_model.model(**inputs).logits.numpy()
+    feed = {node.name: inputs[node.name].numpy() for node in onnx_model.model.get_inputs()}
+    actual = onnx_model.model.run(["logits"], feed)[0]
+
+    assert actual.shape == expected.shape == (len(TEXTS), 2)
+    np.testing.assert_allclose(actual, expected, rtol=1e-4, atol=1e-4)
+
+
+def test_export_is_cached_by_fingerprint(tiny_config):
+    OnnxSentimentModel().load()
+    exported = list(tiny_config.ONNX_CACHE_DIR.glob("model-*.onnx"))
+    assert len(exported) == 1
+    exported_at = exported[0].stat().st_mtime_ns
+
+    OnnxSentimentModel().load()
+    assert list(tiny_config.ONNX_CACHE_DIR.glob("model-*.onnx")) == exported
+    assert exported[0].stat().st_mtime_ns == exported_at
+
+
+def test_verify_equivalence_passes(tiny_config):
+    report = verify_equivalence(texts=TEXTS, tolerance=0.01)
+    assert report["passed"], report
+    assert report["agreement"] == 1.0
@@ -0,0 +1,34 @@
+"""MODEL_PRECISION validation and the reduced-precision comparison."""
+
+import pytest
+
+from src.models import quantization
+from src.models.sentiment_model import SUPPORTED_PRECISIONS, SentimentModel
+from src.models.torch_runtime import bf16_supported
+
+
+def test_unknown_precision_fails_at_construction(tiny_config, monkeypatch):
+    monkeypatch.setattr(tiny_config, "MODEL_PRECISION", "fp16")
+    with pytest.raises(ValueError, match="MODEL_PRECISION must be one of fp32, int8, bf16"):
+        SentimentModel()
+
+
+@pytest.mark.parametrize("precision", SUPPORTED_PRECISIONS)
+def test_every_supported_precision_loads_and_predicts(tiny_config, precision):
+    model = SentimentModel(precision=precision.upper())
+    model.load()
+    result = model.predict("Great value, works as described.")
+    assert result["sentiment"] in ("Positive", "Negative")
+    assert model.version.endswith(f"-{model.precision}")
+
+
+def test_comparison_measures_every_reduced_precision(tiny_config):
+    report = quantization.compare_precision(texts=quantization.REFERENCE_REVIEWS[:4], runs=1)
+
+    assert set(SUPPORTED_PRECISIONS) <= set(report)
+    assert report["int8"]["size_reduction"] > 1
+    if bf16_supported():
+        assert 0.0 <= report["bf16"]["agreement"] <= 1.0
+        assert "speedup" in report["bf16"]
+    else:
+        assert "skipped" in report["bf16"]
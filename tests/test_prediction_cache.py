@@ -0,0 +1,88 @@
+"""In-memory prediction cache: keys, LRU and byte limits, TTL and version changes."""
+
+import pytest
+
+from src.services import prediction_cache
+from src.services.prediction_cache import PredictionCache
+
+RESULT = {"sentiment": "Positive", "confidence": 97.5, "scores": {"positive": 97.5, "negative": 2.5}}
+
+
+def _cache(**kwargs):
+    settings = {"max_entries": 100, "max_bytes": 1_000_000, "ttl_seconds": 0}
+    settings.update(kwargs)
+    return PredictionCache(**settings)
+
+
+def test_keys_ignore_whitespace_but_not_the_model_version():
+    key = PredictionCache.make_key("Great  phone,\n works well ", "v1")
+    assert key == PredictionCache.make_key("Great phone, works well", "v1")
+    assert key != PredictionCache.make_key("Great phone, works well", "v2")
+    assert key != PredictionCache.make_key("great phone, works well", "v1")
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = _cache(max_entries=2)
+    cache.put("a", RESULT)
+    cache.put("b", RESULT)
+    assert cache.get("a") == RESULT
+    cache.put("c", RESULT)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == RESULT and cache.get("c") == RESULT
+    assert cache.get_stats()["evictions"] == 1
+
+
+def test_byte_budget_is_enforced():
+    one_entry = PredictionCache(max_entries=100, max_bytes=10_000, ttl_seconds=0)
+    one_entry.put("a", RESULT)
+    size = one_entry.get_stats()["bytes"]
+    cache = _cache(max_bytes=size * 2)
+    for key in "abc":
+        cache.put(key, RESULT)
+
+    stats = cache.get_stats()
+    assert stats["entries"] == 2 and stats["bytes"] <= size * 2
+    # An entry larger than the whole budget is not cached
+    cache.put("huge", {"text": "x" * size * 2})
+    assert cache.get("huge") is None
+
+
+def test_entries_expire_after_the_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(prediction_cache.time, "monotonic", lambda: now[0])
+    cache = _cache(ttl_seconds=60)
+    cache.put("a", RESULT)
+    now[0] += 59
+    assert cache.get("a") == RESULT
+    now[0] += 1
+    assert cache.get("a") is None
+    assert cache.get_stats()["expirations"] == 1
+
+
+def test_a_new_model_version_drops_every_entry():
+    cache = _cache()
+    cache.ensure_version("v1")
+    cache.put("a", RESULT)
+    cache.ensure_version("v1")
+    assert cache.get("a") == RESULT
+
+    cache.ensure_version("v2")
+    assert cache.get("a") is None
+    assert cache.get_stats()["invalidations"] == 1
+
+
+def test_callers_cannot_mutate_cached_results():
+    cache = _cache()
+    stored = {"scores": {"positive": 90.0}}
+    cache.put("a", stored)
+    stored["scores"]["positive"] = 0.0
+    cache.get("a")["scores"]["positive"] = 0.0
+    assert cache.get("a") == {"scores": {"positive": 90.0}}
+
+
+@pytest.mark.parametrize("max_entries", [0, -1])
+def test_a_cache_without_room_stores_nothing(max_entries):
+    cache = _cache(max_entries=max_entries)
+    cache.put("a", RESULT)
+    assert cache.get("a") is None
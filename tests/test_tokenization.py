@@ -0,0 +1,55 @@
+"""Tokenization fast path: same ids as the plain tokenizer, with pre-truncation and caching."""
+
+import pytest
+from transformers import AutoTokenizer
+
+from benchmarks.common import synthetic_reviews
+from src.models.tokenization import BatchTokenizer, pretruncate
+
+MAX_LENGTH = 16
+
+
+@pytest.fixture
+def tokenizer(tiny_checkpoint):
+    return AutoTokenizer.from_pretrained(str(tiny_checkpoint))
+
+
+def _reference(tokenizer, texts):
+    return tokenizer(texts, truncation=True, max_length=MAX_LENGTH)["input_ids"]
+
+
+def test_pretruncate_cuts_at_whitespace():
+    assert pretruncate("works perfectly well", 12) == "works"
+    assert pretruncate("short", 12) == "short"
+    assert pretruncate("unbroken" * 3, 5) == "unbro"
+    assert pretruncate("works perfectly well", 0) == "works perfectly well"
+
+
+def test_encodings_match_the_tokenizer(tokenizer):
+    texts = synthetic_reviews(4, 40) + ["great", "great " + "a" * 150]
+    batch = BatchTokenizer(tokenizer, max_length=MAX_LENGTH, max_chars=120)
+
+    assert [list(ids) for ids in batch.encode(texts)] == _reference(tokenizer, texts)
+    stats = batch.get_stats()
+    # The over-long word became [UNK] only after re-tokenizing the whole text
+    assert stats["pretruncated"] == 5 and stats["fallbacks"] == 1
+
+
+def test_cache_serves_repeated_texts(tokenizer):
+    batch = BatchTokenizer(tokenizer, max_length=MAX_LENGTH, max_chars=0, cache_size=2)
+    first = batch.encode(["great price", "bad box"])
+    again = batch.encode(["bad box", "great price", "fast shipping"])
+
+    assert list(again[0]) == list(first[1]) and list(again[1]) == list(first[0])
+    assert batch.get_stats()["cache"] == {"entries": 2, "hits": 2, "misses": 3}
+
+
+def test_pad_matches_the_tokenizer_padding(tokenizer):
+    texts = ["great", "the product is great and works perfectly"]
+    batch = BatchTokenizer(tokenizer, max_length=MAX_LENGTH, max_chars=0)
+    padded = batch.pad(batch.encode(texts))
+    expected = tokenizer(texts, truncation=True, max_length=MAX_LENGTH, padding=True, return_tensors="pt")
+
+    for name in ("input_ids", "attention_mask"):
+        assert padded[name].tolist() == expected[name].tolist()
+    assert set(padded) == set(batch.pad(batch.encode(texts), return_tensors="np"))
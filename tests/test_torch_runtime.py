@@ -0,0 +1,51 @@
+"""Torch runtime profile: thread settings, traced graphs and load-time validation."""
+
+import pytest
+import torch
+
+from src.models import torch_runtime
+from src.models.sentiment_model import ModelLoadError, SentimentModel
+
+TEXTS = ["Absolutely love it, works perfectly.", "Broke after a week, waste of money.", "ok"]
+
+
+def _load(config, monkeypatch, **settings):
+    for name, value in settings.items():
+        monkeypatch.setattr(config, name, value)
+    model = SentimentModel()
+    model.load()
+    return model
+
+
+@pytest.fixture
+def restore_threads():
+    threads = torch.get_num_threads()
+    yield
+    torch.set_num_threads(threads)
+
+
+def test_intra_op_threads_are_applied(restore_threads):
+    threads = torch_runtime.configure_threads(1, 0)
+    assert threads["intra_op"] == 1 == torch.get_num_threads()
+    assert threads["inter_op"] == torch.get_num_interop_threads()
+
+
+def test_warmup_covers_single_requests_and_full_batches():
+    assert torch_runtime.warmup_shapes(1, 512) == [(1, 16)]
+    assert torch_runtime.warmup_shapes(32, 48) == [(1, 16), (32, 48)]
+
+
+def test_traced_graph_predicts_like_eager(tiny_config, monkeypatch):
+    eager = _load(tiny_config, monkeypatch, TORCH_GRAPH_MODE="eager")
+    traced = _load(tiny_config, monkeypatch, TORCH_GRAPH_MODE="trace")
+
+    assert traced.runtime["graph_mode"] == "trace" and eager.runtime["graph_mode"] == "eager"
+    # Batches of other sizes and lengths than the trace example
+    for expected, actual in zip(eager.predict_batch(TEXTS), traced.predict_batch(TEXTS)):
+        assert actual["sentiment"] == expected["sentiment"]
+        assert actual["scores"] == pytest.approx(expected["scores"], abs=1e-3)
+
+
+def test_unknown_graph_mode_fails_the_load(tiny_config, monkeypatch):
+    with pytest.raises(ModelLoadError, match="TORCH_GRAPH_MODE"):
+        _load(tiny_config, monkeypatch, TORCH_GRAPH_MODE="jit")
@@ -0,0 +1,103 @@
+"""Spawned inference workers: results match the parent, crashed workers are replaced."""
+
+import os
+
+import pytest
+
+from src.models.sentiment_model import PredictionError, SentimentModel
+from src.services.worker_pool import InferenceWorkerPool
+
+TEXTS = ["Absolutely love it, works perfectly.", "Broke after a week, waste of money."]
+
+
+class _CrashingModel:
+    """Stand-in model whose worker process dies on the text ``"crash"``."""
+
+    def load(self):
+        pass
+
+    def predict(self, text):
+        return self.predict_batch([text])[0]
+
+    def predict_batch(self, texts):
+        if "crash" in texts:
+            os._exit(3)
+        return [{"text": text, "pid": os.getpid()} for text in texts]
+
+
+class _BrokenModel(_CrashingModel):
+    def load(self):
+        raise OSError("no checkpoint")
+
+
+@pytest.fixture
+def start_pool():
+    pools = []
+
+    def start(model_factory, **kwargs):
+        settings = {"num_workers": 2, "threads_per_worker": 1, "task_timeout": 10.0, "start_timeout": 60.0}
+        settings.update(kwargs)
+        pool = InferenceWorkerPool(model_factory, **settings)
+        pools.append(pool)
+        pool.start()
+        return pool
+
+    yield start
+    for pool in pools:
+        pool.stop()
+
+
+def test_workers_predict_like_the_parent(tiny_config, start_pool):
+    model = SentimentModel()
+    model.load()
+    # The parent has run inference before the pool starts, as in the service
+    expected = model.predict_batch(TEXTS)
+    pool = start_pool(SentimentModel)
+
+    futures = [pool.submit_batch([text]) for text in TEXTS]
+    for want, future in zip(expected, futures):
+        actual = future.result(timeout=30)[0]
+        assert actual["sentiment"] == want["sentiment"]
+        assert actual["scores"] == pytest.approx(want["scores"], abs=1e-3)
+        assert actual["model_version"] == want["model_version"]
+    status = pool.get_stats()
+    assert status["alive"] == 2 and status["pending_batches"] == 0
+
+
+def test_a_worker_that_cannot_load_fails_the_start(start_pool):
+    with pytest.raises(RuntimeError, match="no checkpoint"):
+        start_pool(_BrokenModel, num_workers=1)
+
+
+def test_a_crashed_worker_fails_its_batch_and_is_replaced(start_pool):
+    pool = start_pool(_CrashingModel, task_timeout=1.5)
+    lost = pool.submit_batch(["crash"])
+
+    with pytest.raises(PredictionError, match="timed out"):
+        lost.result(timeout=10)
+    assert pool.restarts == 1
+    result = pool.predict_batch(["still serving"])
+    assert result[0]["text"] == "still serving" and result[0]["pid"] != os.getpid()
+    assert pool.get_stats()["alive"] == 2
+
+
+def test_stop_fails_batches_in_flight(start_pool):
+    pool = start_pool(_CrashingModel, num_workers=1)
+    pool.submit_batch(["crash"])
+    lost = pool.submit_batch(["queued behind the crash"])
+    pool.stop()
+
+    with pytest.raises(PredictionError):
+        lost.result(timeout=1)
+    assert not pool.is_running()
+
+
+def test_service_starts_workers_after_its_warmup_thread(tiny_config, monkeypatch, service_factory):
+    monkeypatch.setattr(tiny_config, "INFERENCE_WORKERS", 1)
+    monkeypatch.setattr(tiny_config, "INFERENCE_THREADS_PER_WORKER", 1)
+    service = service_factory(background=True)
+    service._init_thread.join(120)
+
+    assert service.get_status()["worker_pool"]["alive"] == 1
+    results = service.analyze_batch(TEXTS)
+    assert [r["model_version"] for r in results] == [service.get_status()["model_version"]] * 2